@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cached Transliteration
+
+Sanskrit forms and lemmas follow a heavily Zipfian distribution, hence most
+of the transliteration calls made while reading a corpus are repetitions.
+`transliterate()` is a drop-in replacement for the function of the same name
+from `indic_transliteration.sanscript`, backed by a bounded LRU cache keyed by
+(text, source scheme, target scheme).
+
+The cache is shared by the CoNLL-U parser and the peewee Sanskrit fields.
+Its size can be set using `set_cache_size()` or through the environment
+variable `DCS_TRANSLITERATION_CACHE_SIZE` (useful for worker processes).
+
+`indic_transliteration` is imported on the first cache miss, hence importing
+this module is cheap.
+"""
+
+import os
+import functools
+
+###############################################################################
+
+DEFAULT_CACHE_SIZE = 2 ** 18
+CACHE_SIZE_VARIABLE = "DCS_TRANSLITERATION_CACHE_SIZE"
+
+# Scheme names as in `indic_transliteration.sanscript`
+DEVANAGARI = "devanagari"
+IAST = "iast"
+
+###############################################################################
+
+
+def _transliterate(text: str, source_scheme: str, target_scheme: str) -> str:
+    from indic_transliteration.sanscript import transliterate
+
+    return transliterate(text, source_scheme, target_scheme)
+
+
+def _create_cache(maxsize: int or None):
+    return functools.lru_cache(maxsize=maxsize)(_transliterate)
+
+
+_cached_transliterate = _create_cache(
+    int(os.environ.get(CACHE_SIZE_VARIABLE, DEFAULT_CACHE_SIZE))
+)
+
+###############################################################################
+
+
+def transliterate(text: str, source_scheme: str, target_scheme: str) -> str:
+    """Transliterate text, using the cache if possible"""
+    return _cached_transliterate(text, source_scheme, target_scheme)
+
+
+def set_cache_size(maxsize: int or None = DEFAULT_CACHE_SIZE):
+    """
+    Resize the transliteration cache
+
+    The existing cache entries and statistics are discarded.
+
+    Parameters
+    ----------
+    maxsize : int or None, optional
+        Maximum number of cached transliterations.
+        If None, the cache is unbounded. If 0, caching is disabled.
+        The default is DEFAULT_CACHE_SIZE.
+    """
+    global _cached_transliterate
+    _cached_transliterate = _create_cache(maxsize)
+
+
+def cache_info():
+    """Cache statistics as a named tuple (hits, misses, maxsize, currsize)"""
+    return _cached_transliterate.cache_info()
+
+
+def cache_clear():
+    """Clear the cache and its statistics"""
+    _cached_transliterate.cache_clear()
+
+
+###############################################################################
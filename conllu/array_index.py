@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Index of Per-text Arrays
+
+Common storage of the corpus indexes (`lemma_index.LemmaIndex`,
+`morph_index.MorphIndex`). An index is a directory containing a small
+manifest (`index.json`, replaced atomically) and one sub-directory of
+`numpy` arrays per text. Arrays are memory-mapped when they are read.
+
+Files of a text are never overwritten. (Re-)indexing a text writes a new
+sub-directory (`texts/<text_id>.<generation>`), which replaces the previous
+one when the manifest is saved, i.e., readers never see partially written
+arrays, and arrays already mapped by readers remain valid.
+
+Both indexes locate tokens with postings, i.e., structured arrays with the
+fields `text_id`, `chapter`, `sent_id` and `position` (POSTING_DTYPE).
+"""
+
+import os
+import json
+import shutil
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+###############################################################################
+
+MANIFEST_FILE = "index.json"
+TEXTS_DIR = "texts"
+
+POSTING_DTYPE = np.dtype([
+    ("text_id", np.int32),
+    ("chapter", np.int32),
+    ("sent_id", np.int64),
+    ("position", np.int32),
+])
+POSTING_ARRAYS = ["chapter", "sent_id", "position"]
+
+###############################################################################
+
+
+def make_postings(text_id: int, arrays: Dict, selection) -> np.ndarray:
+    """
+    Postings of the tokens of a text
+
+    Parameters
+    ----------
+    text_id : int
+        ID of the text
+    arrays : Dict
+        Arrays of the text, including POSTING_ARRAYS
+    selection : slice or np.ndarray
+        Tokens to select from the arrays (slice or indices)
+
+    Returns
+    -------
+    np.ndarray
+        Postings (POSTING_DTYPE)
+    """
+    columns = {name: arrays[name][selection] for name in POSTING_ARRAYS}
+    postings = np.empty(len(columns["position"]), dtype=POSTING_DTYPE)
+    postings["text_id"] = text_id
+    for name, values in columns.items():
+        postings[name] = values
+    return postings
+
+
+###############################################################################
+
+
+class ArrayIndex:
+    """Base Class of Indexes storing Arrays per Text"""
+
+    # version of the layout of the index, checked when it is opened
+    version = None
+    # names of the arrays of every text (`<name>.npy`)
+    text_arrays = []
+
+    def __init__(self, index_dir: str or Path):
+        """
+        Open (or create) an index
+
+        Parameters
+        ----------
+        index_dir : str or Path
+            Directory of the index.
+            An existing index in this directory is opened.
+        """
+        self.index_dir = Path(index_dir)
+        self.manifest = {"version": self.version, "texts": {}}
+        self._arrays = {}
+
+        manifest_path = self.index_dir / MANIFEST_FILE
+        if manifest_path.is_file():
+            self.manifest = json.loads(manifest_path.read_text())
+            if self.manifest["version"] != self.version:
+                raise ValueError(
+                    f"Unsupported index version: {self.manifest['version']}"
+                )
+
+    # ----------------------------------------------------------------------- #
+
+    def save_text(
+        self,
+        text_id: int,
+        arrays: Dict[str, np.ndarray],
+        text_info: Dict,
+        tables: Dict = None,
+    ):
+        """
+        Save the arrays of a text, replacing the previous ones (if any)
+
+        Parameters
+        ----------
+        text_id : int
+            ID of the text
+        arrays : Dict[str, np.ndarray]
+            Arrays of the text, by name
+        text_info : Dict
+            Information about the text to keep in the manifest
+        tables : Dict, optional
+            Other tables (e.g., `store.StringTable`) of the text, by name,
+            saved using their `save(path, name)` method.
+            The default is None.
+        """
+        old_info = self.manifest["texts"].get(str(text_id))
+        generation = old_info["generation"] + 1 if old_info else 1
+        directory = f"{text_id}.{generation}"
+        text_dir = self.index_dir / TEXTS_DIR / directory
+        # left over by an interrupted write, if any
+        shutil.rmtree(text_dir, ignore_errors=True)
+        text_dir.mkdir(parents=True)
+        for name, values in arrays.items():
+            np.save(text_dir / f"{name}.npy", values)
+        for name, table in (tables or {}).items():
+            table.save(text_dir, name)
+
+        self.manifest["texts"][str(text_id)] = {
+            "directory": directory,
+            "generation": generation,
+            **text_info,
+        }
+        self.save()
+        self._remove_text_files(text_id, old_info)
+
+    def remove_text(self, text_id: int):
+        """Remove a text from the index"""
+        text_info = self.manifest["texts"].pop(str(text_id), None)
+        if text_info is None:
+            return
+        self.save()
+        self._remove_text_files(text_id, text_info)
+
+    def _remove_text_files(self, text_id: int, text_info: Dict or None):
+        """Drop cached arrays of a text and remove its (replaced) files"""
+        self.clear_text_cache(text_id)
+        if text_info is not None:
+            shutil.rmtree(
+                self.index_dir / TEXTS_DIR / text_info["directory"],
+                ignore_errors=True,
+            )
+
+    def clear_text_cache(self, text_id: int):
+        """Drop the cached (memory-mapped) arrays of a text"""
+        self._arrays.pop(text_id, None)
+
+    def save(self):
+        """Save the manifest of the index (atomically)"""
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = self.index_dir / MANIFEST_FILE
+        temp_path = manifest_path.with_name(
+            f"{manifest_path.name}.{os.getpid()}"
+        )
+        temp_path.write_text(json.dumps(self.manifest, ensure_ascii=False))
+        os.replace(temp_path, manifest_path)
+
+    # ----------------------------------------------------------------------- #
+
+    def get_text_dir(self, text_id: int) -> Path:
+        text_info = self.manifest["texts"][str(text_id)]
+        return self.index_dir / TEXTS_DIR / text_info["directory"]
+
+    def get_text_arrays(self, text_id: int) -> Dict[str, np.ndarray]:
+        if text_id not in self._arrays:
+            text_dir = self.get_text_dir(text_id)
+            self._arrays[text_id] = {
+                name: np.load(text_dir / f"{name}.npy", mmap_mode="r")
+                for name in self.text_arrays
+            }
+        return self._arrays[text_id]
+
+    @property
+    def text_ids(self) -> List[int]:
+        return [int(text_id) for text_id in self.manifest["texts"]]
+
+    def get_chapter_name(self, text_id: int, chapter: int) -> str:
+        return self.manifest["texts"][str(text_id)]["chapters"][chapter]
+
+    def concordance(self, postings: np.ndarray):
+        """
+        Resolve postings to (text_id, chapter name, sent_id, position)
+
+        Parameters
+        ----------
+        postings : np.ndarray
+            Postings (POSTING_DTYPE), e.g., returned by a query
+
+        Yields
+        ------
+        tuple
+            (text_id, chapter name, sent_id, position)
+        """
+        for text_id, chapter, sent_id, position in postings.tolist():
+            yield (
+                text_id,
+                self.get_chapter_name(text_id, chapter),
+                sent_id,
+                position,
+            )
+
+
+###############################################################################
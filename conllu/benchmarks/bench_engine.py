@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Parsing Engines
+
+Compare the throughput (tokens/sec) of the `conllu` library engine and the
+DCS engine, and verify that both produce identical `read_conllu_data` output.
+
+Usage:
+    $ python bench_engine.py PATH [PATH ...] [--repeat N] [--no-transliterate]
+
+PATH can be a CoNLL-U file or a directory (searched recursively).
+"""
+
+###############################################################################
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+BASE_DIR = BENCHMARKS_DIR.parent
+
+sys.path.insert(0, str(BASE_DIR))
+
+from dcs import DCS_CONLLU_CONFIG  # noqa: E402
+from utils import CoNLLUParser  # noqa: E402
+from engine import ENGINE_CONLLU, ENGINE_DCS  # noqa: E402
+
+###############################################################################
+
+
+def find_files(paths):
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(path.rglob("*.conllu"))
+        else:
+            yield path
+
+
+def benchmark(parser, contents, function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for content in contents:
+            function(parser, content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+###############################################################################
+
+
+def main():
+    argparser = argparse.ArgumentParser(description="Benchmark engines")
+    argparser.add_argument("paths", nargs="+", help="CoNLL-U files/dirs")
+    argparser.add_argument("--repeat", type=int, default=3)
+    argparser.add_argument(
+        "--no-transliterate",
+        action="store_true",
+        help="keep the input scheme (measure parsing alone)",
+    )
+    args = argparser.parse_args()
+
+    config = DCS_CONLLU_CONFIG.copy()
+    if args.no_transliterate:
+        config["store_scheme"] = config["input_scheme"]
+
+    contents = [
+        path.read_text(encoding="utf-8") for path in find_files(args.paths)
+    ]
+    parsers = {
+        engine: CoNLLUParser(engine=engine, **config)
+        for engine in [ENGINE_CONLLU, ENGINE_DCS]
+    }
+
+    reference = parsers[ENGINE_CONLLU]
+    n_tokens = sum(
+        len(line) for content in contents
+        for line in reference.parse_conllu(content)
+    )
+    for content in contents:
+        if (
+            parsers[ENGINE_DCS].read_conllu_data(content)
+            != reference.read_conllu_data(content)
+        ):
+            raise AssertionError("Engines produced different output")
+
+    print(f"Files: {len(contents)}, Tokens: {n_tokens}")
+    print(f"{'stage':<18} {'engine':<8} {'seconds':>9} {'tokens/sec':>12}")
+
+    stages = {
+        "parse_conllu": CoNLLUParser.parse_conllu,
+        "read_conllu_data": CoNLLUParser.read_conllu_data,
+    }
+    for stage, function in stages.items():
+        timings = {}
+        for engine, parser in parsers.items():
+            timings[engine] = benchmark(
+                parser, contents, function, args.repeat
+            )
+            print(
+                f"{stage:<18} {engine:<8} {timings[engine]:>9.3f} "
+                f"{n_tokens / timings[engine]:>12.0f}"
+            )
+        speedup = timings[ENGINE_CONLLU] / timings[ENGINE_DCS]
+        print(f"{stage:<18} {'speedup':<8} {speedup:>9.2f}x")
+
+
+###############################################################################
+
+if __name__ == "__main__":
+    main()
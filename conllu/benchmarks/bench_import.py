@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Cold Import Time
+
+Measure the time taken to import modules of the CoNLL-U utilities in fresh
+interpreters (`python -X importtime`), and check that heavy dependencies are
+not imported eagerly.
+
+Usage:
+    $ python bench_import.py [MODULE ...] [--runs N] [--max-ms MS]
+
+Exit status is non-zero if the median import time of any module exceeds
+`--max-ms`, or if a module imports any of the `--forbid` dependencies.
+"""
+
+###############################################################################
+
+import sys
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+BASE_DIR = BENCHMARKS_DIR.parent
+
+DEFAULT_MODULES = ["utils", "dcs"]
+DEFAULT_FORBIDDEN = ["pandas", "numpy", "natsort", "indic_transliteration"]
+
+###############################################################################
+
+
+def import_time(module: str) -> float:
+    """Cumulative import time of a module in a fresh interpreter (in ms)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        if line.startswith("import time:"):
+            _, cumulative, name = line.split("|")
+            if name.strip() == module:
+                return int(cumulative) / 1000
+    raise RuntimeError(f"Could not measure import time of '{module}'")
+
+
+def imported_modules(module: str, candidates: list) -> list:
+    """Candidate modules imported (transitively) by a module"""
+    code = (
+        f"import sys, {module}; "
+        f"print(' '.join(m for m in {candidates!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.split()
+
+
+###############################################################################
+
+
+def main():
+    argparser = argparse.ArgumentParser(description="Measure import time")
+    argparser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    argparser.add_argument("--runs", type=int, default=5)
+    argparser.add_argument(
+        "--max-ms",
+        type=float,
+        default=None,
+        help="fail if the median import time exceeds this (milliseconds)",
+    )
+    argparser.add_argument(
+        "--forbid",
+        default=",".join(DEFAULT_FORBIDDEN),
+        help="comma-separated modules that must not be imported eagerly",
+    )
+    args = argparser.parse_args()
+    forbidden = [m for m in args.forbid.split(",") if m]
+
+    failed = False
+    print(f"{'module':<12} {'median ms':>10} {'min ms':>8}  eager imports")
+    for module in args.modules:
+        timings = [import_time(module) for _ in range(args.runs)]
+        median = statistics.median(timings)
+        eager = imported_modules(module, forbidden)
+        print(
+            f"{module:<12} {median:>10.1f} {min(timings):>8.1f}  "
+            f"{', '.join(eager) or '-'}"
+        )
+        if eager or (args.max_ms is not None and median > args.max_ms):
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+###############################################################################
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: CoNLL-U Ingestion Pipeline
+
+Measure every stage of the ingestion pipeline on a synthetic DCS corpus
+(generated using `generate.py`, hence runs entirely offline), reporting
+wall-clock time, tokens/sec and peak RSS per stage. Each stage is run in a
+fresh interpreter, so that peak RSS is attributable to that stage alone.
+
+Stages
+------
+* read: reading the chapter files
+* parse: `parse_conllu` without transliteration
+* transliterate: `transliterate_lines` on parsed lines
+* read_conllu_data: `read_conllu_data` (parse, transliterate, group verses)
+* get_corpus: `DigitalCorpusSanskrit.get_corpus` over all texts
+* get_corpus_dcs: same as `get_corpus`, using the DCS parsing engine
+
+Results can be saved as a baseline (`--save-baseline`) and later compared
+against it (`--compare`), in which case the exit status is non-zero if any
+stage is slower than the baseline by more than `--tolerance`.
+
+Usage:
+    $ python bench_pipeline.py [--data-dir DIR] [--repeat N]
+                               [--save-baseline | --compare] [--tolerance T]
+"""
+
+###############################################################################
+
+import sys
+import json
+import time
+import resource
+import argparse
+import platform
+import subprocess
+import tempfile
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+BASE_DIR = BENCHMARKS_DIR.parent
+BASELINE_PATH = BENCHMARKS_DIR / "baseline.json"
+
+sys.path.insert(0, str(BASE_DIR))
+
+###############################################################################
+
+STAGES = [
+    "read",
+    "parse",
+    "transliterate",
+    "read_conllu_data",
+    "get_corpus",
+    "get_corpus_dcs",
+]
+
+CORPUS_OPTIONS = {
+    "n_texts": 3,
+    "n_chapters": 5,
+    "n_sentences": 400,
+    "vocabulary_size": 5000,
+    "seed": 42,
+}
+
+###############################################################################
+
+
+def run_stage(stage: str, data_dir: Path, repeat: int) -> dict:
+    """Run a stage `repeat` times and report the best time"""
+    from dcs import (
+        DigitalCorpusSanskrit,
+        DCS_CONLLU_CONFIG,
+        IAST,
+        get_texts_catalog,
+    )
+    import transliteration
+
+    parser = DigitalCorpusSanskrit(data_dir, **DCS_CONLLU_CONFIG)
+    texts = [
+        text_id
+        for text_id, textname in get_texts_catalog().items()
+        if (data_dir / "files" / textname).is_dir()
+    ]
+    files = [
+        conllu_file
+        for text_id in texts
+        for conllu_file in parser.get_corpus_files(text_id)
+    ]
+    contents = [
+        Path(conllu_file).read_text(encoding="utf-8") for conllu_file in files
+    ]
+    n_tokens = sum(
+        len(line) for content in contents
+        for line in parser.parse_conllu(content, stream=True)
+    )
+
+    plain_config = DCS_CONLLU_CONFIG.copy()
+    plain_config["store_scheme"] = IAST
+    plain_parser = DigitalCorpusSanskrit(data_dir, **plain_config)
+    dcs_parser = DigitalCorpusSanskrit(
+        data_dir, engine="dcs", **DCS_CONLLU_CONFIG
+    )
+
+    def stage_read():
+        for conllu_file in files:
+            Path(conllu_file).read_text(encoding="utf-8")
+
+    def stage_parse():
+        for content in contents:
+            plain_parser.parse_conllu(content)
+
+    def stage_read_conllu_data():
+        for content in contents:
+            parser.read_conllu_data(content)
+
+    def stage_get_corpus():
+        for text_id in texts:
+            for _ in parser.get_corpus(text_id):
+                pass
+
+    def stage_get_corpus_dcs():
+        for text_id in texts:
+            for _ in dcs_parser.get_corpus(text_id):
+                pass
+
+    functions = {
+        "read": stage_read,
+        "parse": stage_parse,
+        "read_conllu_data": stage_read_conllu_data,
+        "get_corpus": stage_get_corpus,
+        "get_corpus_dcs": stage_get_corpus_dcs,
+    }
+
+    best = float("inf")
+    for _ in range(repeat):
+        transliteration.cache_clear()
+        if stage == "transliterate":
+            parsed = [
+                plain_parser.parse_conllu(content) for content in contents
+            ]
+            start = time.perf_counter()
+            for conllu_lines in parsed:
+                parser.transliterate_lines(conllu_lines)
+        else:
+            start = time.perf_counter()
+            functions[stage]()
+        best = min(best, time.perf_counter() - start)
+
+    return {
+        "seconds": best,
+        "tokens": n_tokens,
+        "tokens_per_second": n_tokens / best,
+        # kilobytes on Linux, bytes on macOS
+        "peak_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def run_stage_subprocess(stage: str, data_dir: Path, repeat: int) -> dict:
+    result = subprocess.run(
+        [
+            sys.executable, __file__,
+            "--run-stage", stage,
+            "--data-dir", str(data_dir),
+            "--repeat", str(repeat),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+###############################################################################
+
+
+def run_benchmarks(data_dir: Path, repeat: int) -> dict:
+    results = {}
+    print(
+        f"{'stage':<18} {'seconds':>9} {'tokens/sec':>12} {'peak RSS':>10}"
+    )
+    for stage in STAGES:
+        result = run_stage_subprocess(stage, data_dir, repeat)
+        results[stage] = result
+        print(
+            f"{stage:<18} {result['seconds']:>9.3f} "
+            f"{result['tokens_per_second']:>12.0f} "
+            f"{result['peak_rss'] / 1024:>8.1f}MB"
+        )
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> bool:
+    """Compare results with the baseline, return True if within tolerance"""
+    passed = True
+    print(f"\n{'stage':<18} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for stage, result in results.items():
+        if stage not in baseline["results"]:
+            continue
+        expected = baseline["results"][stage]["tokens_per_second"]
+        current = result["tokens_per_second"]
+        ratio = current / expected
+        status = ""
+        if ratio < 1 - tolerance:
+            status = "  SLOWER"
+            passed = False
+        print(
+            f"{stage:<18} {expected:>12.0f} {current:>12.0f} "
+            f"{ratio:>7.2f}{status}"
+        )
+    return passed
+
+
+###############################################################################
+
+
+def main():
+    argparser = argparse.ArgumentParser(
+        description="Benchmark the CoNLL-U ingestion pipeline"
+    )
+    argparser.add_argument(
+        "--data-dir",
+        help="existing synthetic corpus (generated if not provided)",
+    )
+    argparser.add_argument("--repeat", type=int, default=3)
+    argparser.add_argument("--save-baseline", action="store_true")
+    argparser.add_argument("--compare", action="store_true")
+    argparser.add_argument("--tolerance", type=float, default=0.25)
+    argparser.add_argument(
+        "--run-stage", choices=STAGES, help=argparse.SUPPRESS
+    )
+    args = argparser.parse_args()
+
+    if args.run_stage:
+        result = run_stage(args.run_stage, Path(args.data_dir), args.repeat)
+        print(json.dumps(result))
+        return
+
+    from generate import generate_corpus
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_dir = Path(args.data_dir or temp_dir)
+        if args.data_dir is None:
+            summary = generate_corpus(data_dir, **CORPUS_OPTIONS)
+            print(
+                f"Synthetic corpus: {summary['files']} files, "
+                f"{summary['sentences']} sentences, "
+                f"{summary['tokens']} tokens"
+            )
+        results = run_benchmarks(data_dir, args.repeat)
+
+    if args.save_baseline:
+        baseline = {
+            # command and corpus behind the numbers, to reproduce them
+            "command": " ".join(
+                ["python", "benchmarks/bench_pipeline.py"] + sys.argv[1:]
+            ),
+            "corpus": (
+                CORPUS_OPTIONS
+                if args.data_dir is None else
+                {"data_dir": args.data_dir}
+            ),
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"\nBaseline saved to {BASELINE_PATH}")
+
+    if args.compare:
+        baseline = json.loads(BASELINE_PATH.read_text())
+        if not compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+###############################################################################
+
+if __name__ == "__main__":
+    main()
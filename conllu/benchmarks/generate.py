@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetic DCS Corpus Generator
+
+Generate a deterministic, DCS-shaped CoNLL-U corpus for benchmarks, laid out
+like the DCS repository (`files/<textname>/<textname>-<n>.conllu` and
+`lookup/*.csv`), so that `DigitalCorpusSanskrit` can be pointed at it.
+
+* Metadata: `text`, `sent_id` (globally unique), `sent_counter` (verse),
+  `sent_subcounter`
+* Misc: `LemmaId`, `OccId`, `Unsandhied`, `WordSem`
+* Vocabulary: synthetic IAST words, drawn from a Zipfian distribution
+
+Usage:
+    $ python generate.py OUTPUT_DIR [--texts N] [--chapters N]
+                                    [--sentences N] [--seed N]
+"""
+
+###############################################################################
+
+import csv
+import random
+import argparse
+import itertools
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+BASE_DIR = BENCHMARKS_DIR.parent
+TEXTS_PATH = BASE_DIR / "texts.csv"
+
+###############################################################################
+
+ONSETS = [
+    "", "k", "g", "c", "j", "t", "d", "n", "p", "b", "m", "y", "r",
+    "v", "ś", "ṣ", "s", "h", "kṣ", "tr", "dh", "bh", "pr", "ṭ", "ṇ",
+]
+VOWELS = ["a", "ā", "i", "ī", "u", "ū", "ṛ", "e", "ai", "o", "au"]
+CODAS = ["", "", "", "ḥ", "ṃ", "t", "n", "s", "m"]
+
+POS_FEATS = {
+    "NOUN": [
+        f"Case={case}|Gender={gender}|Number={number}"
+        for case in ["Nom", "Acc", "Ins", "Dat", "Abl", "Gen", "Loc", "Voc"]
+        for gender in ["Masc", "Fem", "Neut"]
+        for number in ["Sing", "Dual", "Plur"]
+    ],
+    "VERB": [
+        f"Mood={mood}|Number={number}|Person={person}|Tense={tense}"
+        for mood in ["Ind", "Opt", "Imp"]
+        for number in ["Sing", "Dual", "Plur"]
+        for person in ["1", "2", "3"]
+        for tense in ["Pres", "Past", "Fut"]
+    ],
+    "ADJ": [
+        f"Case={case}|Gender={gender}|Number=Sing"
+        for case in ["Nom", "Acc", "Gen", "Loc"]
+        for gender in ["Masc", "Fem", "Neut"]
+    ],
+    "ADV": ["_"],
+    "CCONJ": ["_"],
+    "PART": ["_"],
+    "PRON": ["Case=Nom|Number=Sing", "Case=Gen|Number=Plur"],
+}
+POS_WEIGHTS = {
+    "NOUN": 40, "VERB": 20, "ADJ": 12, "ADV": 8,
+    "CCONJ": 8, "PART": 6, "PRON": 6,
+}
+XPOS = {
+    "NOUN": "NC", "VERB": "V", "ADJ": "JJ", "ADV": "AV",
+    "CCONJ": "CC", "PART": "PRT", "PRON": "PPR",
+}
+
+###############################################################################
+
+
+def make_word(rng: random.Random) -> str:
+    return "".join(
+        rng.choice(ONSETS) + rng.choice(VOWELS)
+        for _ in range(rng.randint(1, 4))
+    ) + rng.choice(CODAS)
+
+
+def make_vocabulary(rng: random.Random, size: int):
+    """(lemma_id, lemma, upos, forms) for every lemma"""
+    pos_list = list(POS_WEIGHTS)
+    pos_weights = list(POS_WEIGHTS.values())
+    vocabulary = []
+    for lemma_id in range(1, size + 1):
+        lemma = make_word(rng)
+        upos = rng.choices(pos_list, pos_weights)[0]
+        forms = [lemma] + [
+            lemma + rng.choice(["ḥ", "m", "sya", "ena", "āt", "ti", "nti"])
+            for _ in range(rng.randint(0, 4))
+        ]
+        vocabulary.append((lemma_id, lemma, upos, forms))
+    return vocabulary
+
+
+def zipf_weights(size: int, exponent: float = 1.05):
+    return list(
+        itertools.accumulate(
+            1 / rank ** exponent for rank in range(1, size + 1)
+        )
+    )
+
+
+###############################################################################
+
+
+def generate_corpus(
+    output_dir: str or Path,
+    n_texts: int = 3,
+    n_chapters: int = 5,
+    n_sentences: int = 200,
+    vocabulary_size: int = 5000,
+    seed: int = 42,
+):
+    """
+    Generate a Synthetic DCS Corpus
+
+    Texts are named after the first `n_texts` entries of `texts.csv`, so that
+    they can be found using `DigitalCorpusSanskrit.get_corpus_files()`.
+
+    Parameters
+    ----------
+    output_dir : str or Path
+        Data directory to generate (equivalent of `dcs/data/conllu`)
+    n_texts : int, optional
+        Number of texts. The default is 3.
+    n_chapters : int, optional
+        Number of chapters per text. The default is 5.
+    n_sentences : int, optional
+        Number of sentences per chapter. The default is 200.
+    vocabulary_size : int, optional
+        Number of distinct lemmas. The default is 5000.
+    seed : int, optional
+        Seed of the random number generator. The default is 42.
+
+    Returns
+    -------
+    dict
+        Summary of the generated corpus (text ids, files, sentences, tokens)
+    """
+    output_dir = Path(output_dir)
+    rng = random.Random(seed)
+
+    vocabulary = make_vocabulary(rng, vocabulary_size)
+    cumulative_weights = zipf_weights(vocabulary_size)
+
+    with open(TEXTS_PATH, encoding="utf-8", newline="") as f:
+        texts = [
+            (int(row["id"]), row["textname"])
+            for row in itertools.islice(csv.DictReader(f), n_texts)
+        ]
+
+    sent_id = 0
+    occurrence_id = 0
+    n_files = 0
+    n_tokens = 0
+    for _, textname in texts:
+        text_dir = output_dir / "files" / textname
+        text_dir.mkdir(parents=True, exist_ok=True)
+        for chapter in range(1, n_chapters + 1):
+            blocks = []
+            sent_counter = 0
+            subcounter = 0
+            for _ in range(n_sentences):
+                # verses have one to four lines
+                if subcounter == 0 or rng.random() < 0.4:
+                    sent_counter += 1
+                    subcounter = 0
+                subcounter += 1
+                sent_id += 1
+
+                words = rng.choices(
+                    vocabulary,
+                    cum_weights=cumulative_weights,
+                    k=rng.randint(3, 12),
+                )
+                forms = [rng.choice(word[3]) for word in words]
+                lines = [
+                    f"# text = {' '.join(forms)}",
+                    f"# sent_id = {sent_id}",
+                    f"# sent_counter = {sent_counter}",
+                    f"# sent_subcounter = {subcounter}",
+                ]
+                for position, ((lemma_id, lemma, upos, _), form) in enumerate(
+                    zip(words, forms), start=1
+                ):
+                    occurrence_id += 1
+                    feats = rng.choice(POS_FEATS[upos])
+                    misc = (
+                        f"LemmaId={lemma_id}|OccId={occurrence_id}|"
+                        f"Unsandhied={form}|WordSem={lemma_id % 97 + 1}"
+                    )
+                    lines.append("\t".join([
+                        str(position), form, lemma, upos, XPOS[upos], feats,
+                        "_", "_", "_", misc,
+                    ]))
+                blocks.append("\n".join(lines))
+                n_tokens += len(words)
+
+            chapter_path = text_dir / f"{textname}-{chapter}.conllu"
+            chapter_path.write_text(
+                "\n\n".join(blocks) + "\n\n", encoding="utf-8"
+            )
+            n_files += 1
+
+    lookup_dir = output_dir / "lookup"
+    lookup_dir.mkdir(parents=True, exist_ok=True)
+    with open(lookup_dir / "dictionary.csv", "w", encoding="utf-8") as f:
+        f.write("id\tlemma\tgrammar\tpos\n")
+        for lemma_id, lemma, upos, _ in vocabulary:
+            f.write(f"{lemma_id}\t{lemma}\t{upos.lower()}\t{upos}\n")
+    with open(lookup_dir / "word-senses.csv", "w", encoding="utf-8") as f:
+        f.write("id\tsense\n")
+        for sense_id in range(1, 98):
+            f.write(f"{sense_id}\tsense {sense_id}\n")
+
+    return {
+        "texts": [text_id for text_id, _ in texts],
+        "files": n_files,
+        "sentences": sent_id,
+        "tokens": n_tokens,
+    }
+
+
+###############################################################################
+
+
+def main():
+    argparser = argparse.ArgumentParser(
+        description="Generate a synthetic DCS CoNLL-U corpus"
+    )
+    argparser.add_argument("output_dir")
+    argparser.add_argument("--texts", type=int, default=3)
+    argparser.add_argument("--chapters", type=int, default=5)
+    argparser.add_argument("--sentences", type=int, default=200)
+    argparser.add_argument("--vocabulary", type=int, default=5000)
+    argparser.add_argument("--seed", type=int, default=42)
+    args = argparser.parse_args()
+
+    summary = generate_corpus(
+        args.output_dir,
+        n_texts=args.texts,
+        n_chapters=args.chapters,
+        n_sentences=args.sentences,
+        vocabulary_size=args.vocabulary,
+        seed=args.seed,
+    )
+    print(summary)
+
+
+###############################################################################
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Persistent Cache of Parsed CoNLL-U Files
+
+Parsed (and transliterated) output of a CoNLL-U file is stored as a pickle,
+keyed by the path of the file, the kind of output and the parser
+configuration. Every cache file starts with a small header containing the
+size, modification time and content hash of the source file, which is used
+to detect stale entries without loading the cached data. The header is taken
+before the data is derived, so a file changed meanwhile is parsed again.
+"""
+
+import os
+import pickle
+import hashlib
+from pathlib import Path
+
+###############################################################################
+
+CACHE_VERSION = 1
+CACHE_SUFFIX = ".pickle"
+
+###############################################################################
+
+
+def file_hash(path: str or Path, block_size: int = 2 ** 20) -> str:
+    """SHA-1 hash of the content of a file"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_source_info(path: str or Path) -> dict:
+    """
+    Size, modification time and content hash of a source file
+
+    The information is taken before deriving data from the file, so that
+    any change made to the file meanwhile invalidates the cache entry.
+    """
+    # stat before hashing, a change in between is detected by the hash
+    stat = os.stat(path)
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "hash": file_hash(path),
+    }
+
+
+def config_hash(config: dict) -> str:
+    """Stable hash of a (JSON-like) configuration dictionary"""
+
+    def _freeze(value):
+        if isinstance(value, dict):
+            return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(_freeze(v) for v in value)
+        return value
+
+    return hashlib.sha1(repr(_freeze(config)).encode()).hexdigest()
+
+
+###############################################################################
+
+
+class FileCache:
+    def __init__(self, cache_dir: str or Path, config: dict = None):
+        """
+        On-disk Cache of Data Derived from Files
+
+        Parameters
+        ----------
+        cache_dir : str or Path
+            Directory to store the cache files in
+        config : dict, optional
+            Configuration used to derive the data.
+            Entries created with a different configuration are never used.
+            The default is None.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.config = config or {}
+        self.config_key = config_hash(
+            {"version": CACHE_VERSION, "config": self.config}
+        )
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get_cache_path(self, path: str or Path, kind: str) -> Path:
+        key = "\0".join([str(Path(path).resolve()), kind, self.config_key])
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return self.cache_dir / f"{Path(path).stem}-{digest}{CACHE_SUFFIX}"
+
+    # ----------------------------------------------------------------------- #
+
+    def get(self, path: str or Path, kind: str, default=None):
+        """
+        Get cached data for a file
+
+        Parameters
+        ----------
+        path : str or Path
+            Path to the source file
+        kind : str
+            Kind of the derived data
+        default : object, optional
+            Value to return if there is no valid cache entry.
+            The default is None.
+
+        Returns
+        -------
+        object
+            Cached data, or `default` if there is no entry or the source file
+            has changed since the entry was created
+        """
+        cache_path = self.get_cache_path(path, kind)
+        try:
+            stat = os.stat(path)
+            with open(cache_path, "rb") as f:
+                header = pickle.load(f)
+                if header["size"] != stat.st_size:
+                    stale = True
+                elif header["mtime_ns"] == stat.st_mtime_ns:
+                    return pickle.load(f)
+                else:
+                    # file was touched, check whether the content changed
+                    stale = header["hash"] != file_hash(path)
+                    if not stale:
+                        data = pickle.load(f)
+        except (OSError, EOFError, KeyError, pickle.UnpicklingError):
+            return default
+
+        if stale:
+            self.invalidate(path, kind)
+            return default
+
+        # refresh the header with the new modification time
+        source_info = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "hash": header["hash"],
+        }
+        self.set(path, kind, data, source_info)
+        return data
+
+    def set(
+        self,
+        path: str or Path,
+        kind: str,
+        data,
+        source_info: dict = None,
+    ):
+        """
+        Store data derived from a file
+
+        The entry is written to a temporary file first and moved in place,
+        so that concurrent readers never see a partially written entry.
+
+        Parameters
+        ----------
+        path : str or Path
+            Path to the source file
+        kind : str
+            Kind of the derived data
+        data : object
+            Picklable data
+        source_info : dict, optional
+            Information about the source file (`get_source_info()`), taken
+            before the data was derived from it.
+            If None, it is taken now, which is only correct if the file has
+            not changed since the data was derived.
+            The default is None.
+        """
+        header = source_info or get_source_info(path)
+        cache_path = self.get_cache_path(path, kind)
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}")
+        with open(temp_path, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+
+    def invalidate(self, path: str or Path, kind: str):
+        """Remove the cache entry for a file, if any"""
+        try:
+            self.get_cache_path(path, kind).unlink()
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        """Remove all cache entries"""
+        for cache_path in self.cache_dir.glob(f"*{CACHE_SUFFIX}"):
+            cache_path.unlink()
+
+
+###############################################################################
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Import Path of the Shared Modules
+
+Importing this module makes the modules of `common/` (e.g.,
+`transliteration`) importable. Every module using them imports it first,
+hence they resolve regardless of how (or in which order) modules are
+imported.
+"""
+
+import sys
+from pathlib import Path
+
+###############################################################################
+
+COMMON_DIR = str(Path(__file__).resolve().parents[1] / "common")
+
+if COMMON_DIR not in sys.path:
+    sys.path.append(COMMON_DIR)
+
+###############################################################################
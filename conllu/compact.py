@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compact Verse > Line > Token Objects
+
+Slotted alternatives to the dictionaries produced by
+`CoNLLUParser.read_conllu_data()`. Fields are accessible as attributes
+(e.g., `token.lemma`, `line.tokens`) and as items (e.g., `token["lemma"]`),
+and every object can be converted to the dictionary format using `to_dict()`.
+
+String values of tokens are interned, and equal values of the shared fields
+(`feats`) are represented by the same dictionary object, hence these must be
+treated as read-only.
+"""
+
+import sys
+from typing import Dict, List, Tuple
+
+###############################################################################
+
+SHARED_FIELDS = ["feats"]
+
+###############################################################################
+
+
+def compact_value(value, shared: Dict = None):
+    """
+    Compact representation of a token value
+
+    Strings are interned. Dictionaries are copied with interned keys and
+    values, and if `shared` is provided, equal dictionaries are shared.
+
+    Parameters
+    ----------
+    value : object
+        Value of a token field
+    shared : Dict, optional
+        Previously seen dictionaries, keyed by their items.
+        The default is None.
+
+    Returns
+    -------
+    object
+        Compact value
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        items = tuple(
+            (sys.intern(key), sys.intern(_value))
+            if isinstance(_value, str) else
+            (sys.intern(key), _value)
+            for key, _value in value.items()
+        )
+        if shared is None:
+            return dict(items)
+        shared_value = shared.get(items)
+        if shared_value is None:
+            shared_value = shared[items] = dict(items)
+        return shared_value
+    return value
+
+
+###############################################################################
+
+
+class Token:
+    FIELDS = ("id", "form", "lemma", "upos", "xpos", "feats", "misc")
+
+    __slots__ = ("_fields",) + FIELDS
+
+    def __init__(
+        self,
+        _fields: Tuple[str],
+        id=None,
+        form=None,
+        lemma=None,
+        upos=None,
+        xpos=None,
+        feats=None,
+        misc=None,
+    ):
+        """
+        Compact Token
+
+        Parameters
+        ----------
+        _fields : Tuple[str]
+            Names of the (relevant) fields of the token, in output order.
+            The tuple is shared by all tokens.
+        """
+        self._fields = _fields
+        self.id = id
+        self.form = form
+        self.lemma = lemma
+        self.upos = upos
+        self.xpos = xpos
+        self.feats = feats
+        self.misc = misc
+
+    def __getitem__(self, key: str):
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        if key not in self._fields:
+            return default
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __eq__(self, other):
+        if isinstance(other, Token):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.to_dict()})"
+
+
+class Line:
+    FIELDS = ("id", "verse_id", "text", "tokens")
+
+    __slots__ = FIELDS
+
+    def __init__(self, id, verse_id, text, tokens: List[Token]):
+        """Compact Line"""
+        self.id = id
+        self.verse_id = verse_id
+        self.text = text
+        self.tokens = tokens
+
+    def __getitem__(self, key: str):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        if key not in self.FIELDS:
+            return default
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "verse_id": self.verse_id,
+            "text": self.text,
+            "tokens": [token.to_dict() for token in self.tokens],
+        }
+
+    def __eq__(self, other):
+        if isinstance(other, Line):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(id={self.id}, "
+            f"verse_id={self.verse_id}, text={self.text!r}, "
+            f"tokens={len(self.tokens)})"
+        )
+
+
+class Verse(list):
+    """Compact Verse, i.e., list of compact lines"""
+
+    __slots__ = ()
+
+    def to_dict(self) -> List[Dict]:
+        return [line.to_dict() for line in self]
+
+
+###############################################################################
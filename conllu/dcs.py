@@ -4,28 +4,69 @@
 Created on Mon May 10 15:27:51 2021
 
 @author: Hrishikesh Terdalkar
+
+Heavy dependencies (pandas, numpy, natsort, indic_transliteration) are
+imported on first use, and the catalog of texts is loaded lazily, so that
+importing this module is cheap. (Check `benchmarks/bench_import.py`)
 """
 
+import re
+import csv
 from pathlib import Path
-
-import pandas as pd
-from natsort import natsorted, ns
-from indic_transliteration import sanscript
-from indic_transliteration.sanscript import transliterate
-
-from utils import CoNLLUParser
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from utils import (
+    CoNLLUParser,
+    imap_ordered,
+    _initialize_worker,
+    _process_files_worker,
+)
+from manifest import Manifest, ADDED, CHANGED, REMOVED
+from shards import (
+    plan_shards,
+    save_shard_manifest,
+    load_shard_manifest,
+    WEIGHT_BYTES,
+)
+import common_path  # noqa: F401
+from transliteration import transliterate, IAST, DEVANAGARI
 
 ###############################################################################
 
 BASE_DIR = Path(__file__).parent
 TEXTS_PATH = BASE_DIR / "texts.csv"
-TEXTS = pd.read_csv(TEXTS_PATH)
+
+_TEXTS_CATALOG = None
+
+###############################################################################
+
+
+def get_texts_catalog() -> Dict[int, str]:
+    """Catalog of texts (id -> textname), loaded from TEXTS_PATH once"""
+    global _TEXTS_CATALOG
+    if _TEXTS_CATALOG is None:
+        with open(TEXTS_PATH, encoding="utf-8", newline="") as f:
+            _TEXTS_CATALOG = {
+                int(row["id"]): row["textname"] for row in csv.DictReader(f)
+            }
+    return _TEXTS_CATALOG
+
+
+def __getattr__(name: str):
+    # NOTE: `TEXTS` (pandas.DataFrame) is loaded on access
+    if name == "TEXTS":
+        import pandas as pd
+
+        globals()["TEXTS"] = pd.read_csv(TEXTS_PATH)
+        return globals()["TEXTS"]
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
 
 ###############################################################################
 
 DCS_CONLLU_CONFIG = {
-    "input_scheme": sanscript.IAST,
-    "store_scheme": sanscript.DEVANAGARI,
+    "input_scheme": IAST,
+    "store_scheme": DEVANAGARI,
     "input_fields": [
         "id",      # 01
         "form",    # 02 word form or punctuation symbol
@@ -72,23 +113,159 @@ class CSVData:
         separator: str = ",",
         index_column: str = None,
     ):
+        """
+        Lazily Loaded and Indexed CSV Data
+
+        The CSV file is read on first use. Lookups by index are backed by
+        a dictionary of row positions, and prefix searches are backed by
+        sorted column values, both of which are built on first use.
+
+        Parameters
+        ----------
+        csv_path : str or Path
+            Path to the CSV file
+        separator : str, optional
+            Column separator.
+            The default is ",".
+        index_column : str, optional
+            Column to use as index, i.e., as the `id` for `get()`.
+            The default is None.
+        """
         self.path = csv_path
         self.separator = separator
-        self.data = pd.read_csv(csv_path, sep=separator, keep_default_na=False)
-        if index_column:
-            self.data = self.data.set_index(index_column)
+        self.index_column = index_column
+        self._data = None
+        self._positions = None
+        self._records = None
+        self._prefix_index = {}
+
+    @property
+    def data(self) -> "pd.DataFrame":
+        if self._data is None:
+            import pandas as pd
+
+            try:
+                data = pd.read_csv(
+                    self.path, sep=self.separator, keep_default_na=False
+                )
+            except pd.errors.EmptyDataError:
+                # empty file, i.e., not even a header
+                data = pd.DataFrame(
+                    index=pd.RangeIndex(0, name=self.index_column)
+                )
+            else:
+                if self.index_column:
+                    data = data.set_index(self.index_column)
+            self._data = data
+        return self._data
+
+    @property
+    def positions(self) -> dict:
+        """Row position of every index value"""
+        if self._positions is None:
+            positions = {}
+            for position, id in enumerate(self.data.index.tolist()):
+                positions.setdefault(id, position)
+            self._positions = positions
+        return self._positions
+
+    # ----------------------------------------------------------------------- #
 
     def get(self, id: int):
-        try:
-            return self.data.loc[id]
-        except KeyError:
-            pass
+        position = self.positions.get(id)
+        if position is not None:
+            return self.data.iloc[position]
+
+    def get_record(self, id: int) -> dict or None:
+        """Row as a dictionary (without constructing a pandas.Series)"""
+        if self._records is None:
+            self._records = self.data.to_dict("records")
+        position = self.positions.get(id)
+        if position is not None:
+            return self._records[position]
+
+    def get_many(self, ids) -> "pd.DataFrame":
+        """
+        Rows for multiple ids at once
+
+        Parameters
+        ----------
+        ids : Iterable
+            Index values. Duplicates are allowed.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per id in the same order, with missing values for
+            the ids that do not exist
+        """
+        import numpy as np
+        import pandas as pd
+
+        ids = list(ids)
+        if self.data.empty:
+            # no rows to take, every id is missing
+            return pd.DataFrame(
+                np.nan,
+                index=pd.Index(ids, name=self.data.index.name),
+                columns=self.data.columns,
+                dtype=object,
+            )
+
+        positions = self.positions
+        indices = np.array([positions.get(id, -1) for id in ids], dtype=int)
+        found = indices >= 0
+        rows = self.data.iloc[np.where(found, indices, 0)]
+        rows.index = pd.Index(ids, name=self.data.index.name)
+        if not found.all():
+            rows = rows.astype(object)
+            rows.loc[~found] = np.nan
+        return rows
+
+    # ----------------------------------------------------------------------- #
+
+    def get_prefix_index(self, column: str):
+        """Sorted values of a column along with their row positions"""
+        if column not in self._prefix_index:
+            import numpy as np
+
+            values = self.data[column].astype(str).to_numpy()
+            order = np.argsort(values, kind="stable")
+            self._prefix_index[column] = (values[order], order)
+        return self._prefix_index[column]
+
+    def match(self, column: str, pattern: str) -> "np.ndarray":
+        """
+        Rows where the value of a column matches a pattern (`re.match`)
+
+        Literal patterns are looked up in the prefix index, other regular
+        expressions are matched (vectorised) against the whole column.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of matching rows
+        """
+        import numpy as np
+
+        mask = np.zeros(len(self.data), dtype=bool)
+        if re.escape(pattern) == pattern:
+            values, order = self.get_prefix_index(column)
+            start = np.searchsorted(values, pattern, side="left")
+            end = np.searchsorted(values, pattern + "\U0010ffff", side="left")
+            mask[order[start:end]] = True
+        else:
+            matches = self.data[column].astype(str).str.match(pattern)
+            mask[matches.to_numpy(dtype=bool)] = True
+        return mask
 
     def search(self, **kwargs):
-        query = " and ".join(
-            f"{key}.str.match('{value}')" for key, value in kwargs.items()
-        )
-        return self.data.query(query)
+        import numpy as np
+
+        mask = np.ones(len(self.data), dtype=bool)
+        for key, value in kwargs.items():
+            mask &= self.match(key, value)
+        return self.data[mask]
 
     def __iter__(self):
         yield from self.data.iterrows()
@@ -115,30 +292,94 @@ class DigitalCorpusSanskrit(CoNLLUParser):
             wordsenses_path, separator="\t", index_column="id"
         )
 
-    def get_corpus(self, corpus_id_or_name: str):
-        for conllu_file in self.get_corpus_files(corpus_id_or_name):
-            yield from self.parse_conllu_file(conllu_file)
+    def get_corpus(
+        self,
+        corpus_id_or_name: str,
+        stream: bool = False,
+        group_verse: bool = False,
+        workers: int = None,
+    ):
+        """
+        Get Lines (or Verses) from a Corpus
+
+        Parameters
+        ----------
+        corpus_id_or_name : str
+            ID or name of the corpus (text)
+        stream : bool, optional
+            If True, every chapter file is parsed incrementally, and lines
+            are yielded as soon as they are parsed and transliterated, so
+            that memory usage stays flat irrespective of the file size.
+            The default is False.
+        group_verse : bool, optional
+            If True, lines are prepared using `read_conllu_file()` and
+            grouped into verses, i.e., verses are yielded instead of lines.
+            The default is False.
+        workers : int, optional
+            If more than 1, chapter files are parsed and transliterated on
+            a process pool with those many workers. Chapters are still
+            yielded in the original order, and only a bounded number of
+            chapters is in flight at any time. `stream` has no effect in
+            this mode, as every chapter is parsed as a whole by a worker.
+            The default is None.
+
+        Yields
+        ------
+        TokenList or list
+            Line, or Verse (if `group_verse` is True)
+        """
+        conllu_files = self.get_corpus_files(corpus_id_or_name) or []
+
+        if workers and workers > 1:
+            for chapter in self.parse_conllu_files(
+                conllu_files, workers=workers, group_verse=group_verse
+            ):
+                yield from chapter
+            return
 
-    def find_corpus(self, corpus_name: str):
+        read_function = (
+            self.read_conllu_file if group_verse else self.parse_conllu_file
+        )
+        for conllu_file in conllu_files:
+            yield from read_function(conllu_file, stream=stream)
+
+    def find_corpus(self, corpus_name: str) -> List[Tuple[int, str]]:
         transliterate_name = transliterate(
             corpus_name, self.store_scheme, self.input_scheme
         )
-        record = TEXTS.query(
-            f"textname.str.contains('(?i){transliterate_name}')",
-            engine="python"
-        )
-        return [(t.id, t.textname) for t in record.itertuples()]
+        pattern = re.compile(transliterate_name, flags=re.IGNORECASE)
+        return [
+            (text_id, textname)
+            for text_id, textname in get_texts_catalog().items()
+            if pattern.search(textname)
+        ]
+
+    def get_corpus_record(self, corpus_id_or_name) -> Dict or None:
+        catalog = get_texts_catalog()
+        try:
+            text_id = int(corpus_id_or_name)
+        except (TypeError, ValueError):
+            text_id = None
 
-    def get_corpus_files(self, corpus_id_or_name):
-        record = TEXTS.query(f"id == {corpus_id_or_name}")
-        if record.empty:
-            record = TEXTS.query(f"textname == '{corpus_id_or_name}'")
+        if text_id in catalog:
+            return {"id": text_id, "textname": catalog[text_id]}
+
+        for text_id, textname in catalog.items():
+            if textname == corpus_id_or_name:
+                return {"id": text_id, "textname": textname}
 
-        if record.empty:
+    def get_corpus_id(self, corpus_id_or_name) -> int or None:
+        record = self.get_corpus_record(corpus_id_or_name)
+        if record is not None:
+            return record["id"]
+
+    def get_corpus_files(self, corpus_id_or_name):
+        record = self.get_corpus_record(corpus_id_or_name)
+        if record is None:
             print(f"Corpus not found: id/texname: '{corpus_id_or_name}'.")
             return
 
-        corpus_name = record.iloc[0]["textname"]
+        corpus_name = record["textname"]
 
         # corpus_file = self.data_dir / "files" / f"{corpus_name}-all.conllu"
         # if corpus_file.is_file():
@@ -146,8 +387,264 @@ class DigitalCorpusSanskrit(CoNLLUParser):
 
         corpus_path = self.data_dir / "files" / f"{corpus_name}"
         if corpus_path.is_dir():
+            from natsort import natsorted, ns
+
             return natsorted(corpus_path.glob("*.conllu"), alg=ns.PATH)
 
+    # ----------------------------------------------------------------------- #
+
+    def get_all_corpus_files(self, corpus_ids: List[int] = None) -> List[Dict]:
+        """
+        Chapter files of all the texts (or of the specified texts)
+
+        Returns
+        -------
+        List[Dict]
+            Files, as dictionaries with keys "text_id" and "path"
+        """
+        if corpus_ids is None:
+            corpus_ids = list(get_texts_catalog())
+        return [
+            {"text_id": self.get_corpus_id(corpus_id), "path": conllu_file}
+            for corpus_id in corpus_ids
+            for conllu_file in self.get_corpus_files(corpus_id) or []
+        ]
+
+    def iter_corpus(
+        self,
+        corpus_ids: List[int] = None,
+        stream: bool = False,
+        group_verse: bool = False,
+        workers: int = None,
+    ) -> Iterator[Tuple[int, object]]:
+        """
+        Iterate over the Whole Corpus
+
+        Parameters
+        ----------
+        corpus_ids : List[int], optional
+            IDs (or names) of the texts to iterate over.
+            If None, all texts from the catalog are used.
+            The default is None.
+        stream, group_verse, workers
+            Same as `get_corpus()`
+
+        Yields
+        ------
+        Tuple[int, object]
+            Text ID and line (or verse, if `group_verse` is True)
+        """
+        items = self.get_all_corpus_files(corpus_ids)
+        if workers and workers > 1:
+            chapters = self.parse_conllu_files(
+                [item["path"] for item in items],
+                workers=workers,
+                group_verse=group_verse,
+            )
+        else:
+            read_function = (
+                self.read_conllu_file
+                if group_verse
+                else self.parse_conllu_file
+            )
+            chapters = (
+                read_function(item["path"], stream=stream) for item in items
+            )
+
+        for item, chapter in zip(items, chapters):
+            for line_or_verse in chapter:
+                yield item["text_id"], line_or_verse
+
+    def plan_corpus(
+        self,
+        n_shards: int,
+        weight: str = WEIGHT_BYTES,
+        corpus_ids: List[int] = None,
+        manifest_path: str or Path = None,
+    ) -> List[Dict]:
+        """
+        Split the corpus files into size-balanced shards
+
+        Parameters
+        ----------
+        n_shards : int
+            Number of shards, e.g., number of workers or nodes
+        weight : str, optional
+            Weight of a file, WEIGHT_BYTES or WEIGHT_TOKENS.
+            The default is WEIGHT_BYTES.
+        corpus_ids : List[int], optional
+            IDs (or names) of the texts to include.
+            If None, all texts from the catalog are used.
+            The default is None.
+        manifest_path : str or Path, optional
+            If provided, shards are also saved to a shard manifest, from
+            which separate nodes can pick their shard using `get_shard()`.
+            The default is None.
+
+        Returns
+        -------
+        List[Dict]
+            Shards, as dictionaries with keys "id", "weight" and "files"
+        """
+        shards = plan_shards(
+            self.get_all_corpus_files(corpus_ids), n_shards, weight=weight
+        )
+        if manifest_path is not None:
+            save_shard_manifest(
+                manifest_path,
+                shards,
+                base_dir=self.data_dir / "files",
+                weight=weight,
+            )
+        return shards
+
+    def get_shard(self, manifest_path: str or Path, shard_id: int) -> Dict:
+        """Shard from a shard manifest, with paths under this `data_dir`"""
+        shards = load_shard_manifest(manifest_path, self.data_dir / "files")
+        for shard in shards:
+            if shard["id"] == shard_id:
+                return shard
+        raise KeyError(f"Shard not found: {shard_id}")
+
+    def process_corpus(
+        self,
+        function: Callable,
+        workers: int,
+        weight: str = WEIGHT_BYTES,
+        corpus_ids: List[int] = None,
+        shards: List[Dict] = None,
+    ) -> Iterator[Tuple[Path, object]]:
+        """
+        Process corpus files on a process pool, one shard per worker
+
+        Parameters
+        ----------
+        function : Callable
+            Picklable (module-level) function called for every file as
+            `function(parser, conllu_file)`.
+            The results of a shard are held in memory until the whole shard
+            is processed, so the function should return a reduced result
+            (e.g., counts) rather than the parsed lines.
+        workers : int
+            Number of worker processes (and of shards)
+        weight : str, optional
+            Weight of a file, WEIGHT_BYTES or WEIGHT_TOKENS.
+            The default is WEIGHT_BYTES.
+        corpus_ids : List[int], optional
+            IDs (or names) of the texts to process.
+            If None, all texts from the catalog are used.
+            The default is None.
+        shards : List[Dict], optional
+            Pre-planned shards, e.g., from `get_shard()`.
+            If None, the corpus is planned into `workers` shards.
+            The default is None.
+
+        Yields
+        ------
+        Tuple[Path, object]
+            File and the result of `function` for it
+        """
+        if shards is None:
+            shards = self.plan_corpus(
+                workers, weight=weight, corpus_ids=corpus_ids
+            )
+        tasks = (
+            (function, [item["path"] for item in shard["files"]])
+            for shard in shards
+        )
+        for results in imap_ordered(
+            _process_files_worker,
+            tasks,
+            workers=workers,
+            max_pending=max(len(shards), 2 * workers),
+            initializer=_initialize_worker,
+            initargs=(self,),
+        ):
+            for conllu_file, result, stats in results:
+                if stats is not None:
+                    self.profiler.record(
+                        conllu_file, stats, self.get_text_of_file(conllu_file)
+                    )
+                yield conllu_file, result
+
+    # ----------------------------------------------------------------------- #
+
+    def get_text_of_file(self, conllu_file: str or Path) -> str or None:
+        """Name of the text (corpus) a chapter file belongs to"""
+        files_dir = self.data_dir / "files"
+        try:
+            return Path(conllu_file).relative_to(files_dir).parts[0]
+        except ValueError:
+            return None
+
+    def sync(
+        self,
+        manifest_path: str or Path,
+        callback: Callable = None,
+        group_verse: bool = False,
+        workers: int = None,
+    ) -> Dict[str, List[Path]]:
+        """
+        Process only the chapter files changed since the last sync
+
+        Chapter files under `data_dir/files` are compared with the manifest.
+        Files that were added or changed are parsed (or read as verses) and
+        passed to the `callback`, along with the files that were removed, so
+        that derived artefacts (cache, indexes, database) can be refreshed.
+        The manifest is updated only after all the changes are processed, so
+        an interrupted sync is resumed on the next call.
+
+        Parameters
+        ----------
+        manifest_path : str or Path
+            Path to the manifest file (created if it does not exist)
+        callback : Callable, optional
+            Function called for every change as,
+            `callback(conllu_file, status, data)`, where `status` is one of
+            ADDED, CHANGED or REMOVED, and `data` is the list of lines (or
+            verses, if `group_verse` is True) of the file, or None if the
+            file was removed.
+            The default is None.
+        group_verse : bool, optional
+            If True, verses are passed to the callback instead of lines.
+            The default is False.
+        workers : int, optional
+            If more than 1, changed files are parsed on a process pool.
+            The default is None.
+
+        Returns
+        -------
+        Dict[str, List[Path]]
+            Files that have been ADDED, CHANGED or REMOVED, and "texts", the
+            names of the texts affected by any of the changes
+        """
+        files_dir = self.data_dir / "files"
+        manifest = Manifest(manifest_path, files_dir)
+        changes = manifest.scan(sorted(files_dir.glob("*/*.conllu")))
+        entries = changes.pop("entries")
+
+        if callback is not None:
+            modified = changes[ADDED] + changes[CHANGED]
+            statuses = [ADDED] * len(changes[ADDED])
+            statuses += [CHANGED] * len(changes[CHANGED])
+            chapters = self.parse_conllu_files(
+                modified, workers=workers, group_verse=group_verse
+            )
+            for conllu_file, status, data in zip(modified, statuses, chapters):
+                callback(conllu_file, status, data)
+            for conllu_file in changes[REMOVED]:
+                callback(conllu_file, REMOVED, None)
+
+        manifest.update(entries)
+        changes["texts"] = sorted(
+            {
+                self.get_text_of_file(conllu_file)
+                for status in [ADDED, CHANGED, REMOVED]
+                for conllu_file in changes[status]
+            }
+        )
+        return changes
+
 
 ###############################################################################
 
@@ -155,7 +652,7 @@ class DigitalCorpusSanskrit(CoNLLUParser):
 def main():
     home_dir = Path.home()
     data_dir = home_dir / "git" / "oliverhellwig" / "dcs" / "data" / "conllu"
-    scheme = sanscript.DEVANAGARI
+    scheme = DEVANAGARI
 
     dcs_conllu_config = DCS_CONLLU_CONFIG.copy()
     dcs_conllu_config["store_scheme"] = scheme
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fast CoNLL-U Parsing Engine for DCS
+
+Alternative to `conllu.parse` tuned to the column layout of the Digital
+Corpus of Sanskrit. Only the columns that are used later (relevant fields,
+transliterated fields and `id`) are materialised, and the key-value columns
+(`feats`, `misc`) are parsed only when they are accessed.
+
+Values of the retained columns are identical to those produced by the
+`conllu` library.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, TextIO
+
+from conllu.models import Metadata, Token, TokenList
+from conllu.parser import (
+    DEFAULT_FIELD_PARSERS,
+    ParseException,
+    parse_id_value,
+    parse_line,
+    parse_sentences,
+)
+
+###############################################################################
+
+ENGINE_CONLLU = "conllu"
+ENGINE_DCS = "dcs"
+
+LAZY_FIELDS = ["feats", "misc"]
+METADATA_KEYS_WITHOUT_VALUE = ["newpar", "newdoc"]
+
+# sentences are separated by one or more blank (or whitespace-only) lines
+SENTENCE_SEPARATOR = re.compile(r"\n(?:[^\S\n]*\n)+")
+
+###############################################################################
+
+
+def parse_key_value(value: str) -> Dict[str, str or None]:
+    """Faster equivalent of `conllu.parser.parse_dict_value` (non-null)"""
+    result = {}
+    for part in value.split("|"):
+        key, separator, _value = part.partition("=")
+        if not key or key == "_":
+            continue
+        if separator:
+            _value = _value.partition("=")[0]
+            result[key] = _value if _value and _value != "_" else None
+        else:
+            result[key] = ""
+    return result
+
+
+###############################################################################
+
+
+class LazyDict(dict):
+    """
+    Dictionary parsed from a CoNLL-U key-value column on first access
+
+    The raw column value is kept until the dictionary is accessed through any
+    of the Python-level methods, at which point it is parsed (exactly like
+    `conllu.parser.parse_dict_value`) and stored in the dictionary itself.
+    Only the truth value is computed without parsing.
+
+    NOTE: Code accessing the underlying storage directly (e.g., the C JSON
+    encoder) does not trigger parsing; call `materialize()` before that.
+    """
+
+    __slots__ = ["_raw"]
+
+    def __init__(self, raw: str):
+        super().__init__()
+        self._raw = raw
+
+    def materialize(self) -> "LazyDict":
+        raw = self._raw
+        if raw is not None:
+            self._raw = None
+            dict.update(self, parse_key_value(raw))
+        return self
+
+    # ----------------------------------------------------------------------- #
+
+    def __getitem__(self, key):
+        return dict.__getitem__(self.materialize(), key)
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self.materialize(), key, value)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self.materialize(), key)
+
+    def __contains__(self, key):
+        return dict.__contains__(self.materialize(), key)
+
+    def __iter__(self):
+        return dict.__iter__(self.materialize())
+
+    def __len__(self):
+        return dict.__len__(self.materialize())
+
+    def __bool__(self):
+        # truth value without parsing (e.g., `token.get(field) or default`)
+        raw = self._raw
+        if raw is None:
+            return dict.__len__(self) > 0
+        return any(
+            key and key != "_"
+            for key, _, _ in (part.partition("=") for part in raw.split("|"))
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, LazyDict):
+            other.materialize()
+        return dict.__eq__(self.materialize(), other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return dict.__repr__(self.materialize())
+
+    def __reduce__(self):
+        return (dict, (dict(self.items()),))
+
+    __hash__ = None
+
+    def get(self, key, default=None):
+        return dict.get(self.materialize(), key, default)
+
+    def keys(self):
+        return dict.keys(self.materialize())
+
+    def values(self):
+        return dict.values(self.materialize())
+
+    def items(self):
+        return dict.items(self.materialize())
+
+    def copy(self):
+        return dict(self.items())
+
+    def update(self, *args, **kwargs):
+        dict.update(self.materialize(), *args, **kwargs)
+
+    def pop(self, *args):
+        return dict.pop(self.materialize(), *args)
+
+    def setdefault(self, key, default=None):
+        return dict.setdefault(self.materialize(), key, default)
+
+
+###############################################################################
+
+
+class DCSEngine:
+    def __init__(
+        self,
+        fields: List[str],
+        relevant_fields: Iterable[str],
+        lazy_fields: Iterable[str] = None,
+    ):
+        """
+        Fast CoNLL-U Parser
+
+        Parameters
+        ----------
+        fields : List[str]
+            CoNLL-U Fields (columns), in order
+        relevant_fields : Iterable[str]
+            Fields to materialise, other columns are skipped
+            `id` is always materialised.
+        lazy_fields : Iterable[str], optional
+            Key-value fields to parse on first access.
+            The default is LAZY_FIELDS, i.e., `feats` and `misc`.
+        """
+        if lazy_fields is None:
+            lazy_fields = LAZY_FIELDS
+
+        self.fields = list(fields)
+        relevant_fields = set(relevant_fields) | {"id"}
+        lazy_fields = set(lazy_fields)
+
+        # (column index, field name, parser)
+        self.columns = []
+        for index, field in enumerate(self.fields):
+            if field not in relevant_fields:
+                continue
+            if field in lazy_fields:
+                parser = self._parse_lazy_dict
+            elif field == "id":
+                parser = self._parse_id
+            elif field in DEFAULT_FIELD_PARSERS:
+                parser = DEFAULT_FIELD_PARSERS[field]
+            else:
+                parser = None
+            self.columns.append((index, field, parser))
+
+        self._field_parsers = DEFAULT_FIELD_PARSERS.copy()
+
+    # ----------------------------------------------------------------------- #
+
+    @staticmethod
+    def _parse_id(line_split: List[str], index: int):
+        value = line_split[index]
+        if value.isdigit():
+            return int(value)
+        return parse_id_value(value)
+
+    @staticmethod
+    def _parse_lazy_dict(line_split: List[str], index: int):
+        value = line_split[index]
+        if not value or value == "_":
+            return None
+        return LazyDict(value)
+
+    def parse_token(self, line: str) -> Token:
+        """Parse a (stripped) token line"""
+        line_split = line.split("\t")
+        if len(line_split) == 1:
+            # not tab-separated, leave it to the reference implementation
+            token = parse_line(line, self.fields, self._field_parsers)
+            return Token(
+                (field, token[field])
+                for _, field, _ in self.columns
+                if field in token
+            )
+
+        n_columns = len(line_split)
+        token = Token()
+        for index, field, parser in self.columns:
+            if index >= n_columns:
+                break
+            if parser is None:
+                token[field] = line_split[index]
+            else:
+                try:
+                    token[field] = parser(line_split, index)
+                except ParseException as e:
+                    raise ParseException(
+                        f"Failed parsing field '{field}': {e}"
+                    )
+        return token
+
+    @staticmethod
+    def parse_metadata(line: str, metadata: Dict):
+        """Parse a (stripped) comment line into metadata"""
+        key, separator, value = line[1:].partition("=")
+        key = key.strip()
+        value = value.strip() if separator else None
+        if key in METADATA_KEYS_WITHOUT_VALUE:
+            metadata[key] = value
+        elif key and value:
+            metadata[key] = value
+
+    def parse_sentence(self, data: str) -> TokenList:
+        """Parse a single sentence"""
+        tokens = []
+        metadata = Metadata()
+        for line in data.split("\n"):
+            line = line.strip()
+            if not line:
+                continue
+            if line[0] == "#":
+                self.parse_metadata(line, metadata)
+            else:
+                tokens.append(self.parse_token(line))
+        return TokenList(tokens, metadata, default_fields=self.fields)
+
+    # ----------------------------------------------------------------------- #
+
+    def parse(self, conllu_content: str) -> List[TokenList]:
+        """Parse CoNLL-U Data, equivalent of `conllu.parse`"""
+        return [
+            self.parse_sentence(sentence)
+            for sentence in SENTENCE_SEPARATOR.split(conllu_content)
+            if not sentence.isspace() and sentence
+        ]
+
+    def parse_incr(self, conllu_file: TextIO) -> Iterator[TokenList]:
+        """Parse CoNLL-U Data incrementally (`conllu.parse_incr`)"""
+        for sentence in parse_sentences(conllu_file):
+            yield self.parse_sentence(sentence)
+
+
+###############################################################################
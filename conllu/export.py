@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parquet Export of the Corpus
+
+Writes token-level and sentence-level tables to Parquet, partitioned by
+text id and chapter (Hive-style directories), e.g.,
+
+    output_dir/tokens/text_id=154/chapter=3/part-0.parquet
+    output_dir/sentences/text_id=154/chapter=3/part-0.parquet
+
+so that downstream jobs (pyarrow, pandas, polars, duckdb, spark) can prune
+partitions and columns, and push predicates down to row groups, e.g.,
+
+>>> import pyarrow.dataset as ds
+>>> tokens = ds.dataset("output_dir/tokens", partitioning="hive")
+>>> tokens.to_table(columns=["lemma"], filter=ds.field("upos") == "NOUN")
+
+Chapter files are parsed incrementally, and rows are written in row groups
+of bounded size, so memory usage does not depend on the size of a chapter.
+`chapter` is the position of the chapter file in the text (as listed by
+`get_corpus_files()`); the file name is stored in the sentence table.
+Partitions of a text are written to a hidden staging directory, which then
+replaces the directory of the text, i.e., partitions of chapters which no
+longer exist do not survive a re-export.
+
+Tokens with range or decimal ids (multi-word tokens, empty nodes) are not
+exported. `feats` and `misc` are exported as strings in the CoNLL-U format
+(`Key=Value|...`), along with the DCS fields `LemmaId`, `Unsandhied` and
+`WordSem` of `misc` as separate columns.
+
+Requires `pyarrow` (optional dependency, `pip install pyarrow`).
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+###############################################################################
+
+TABLE_TOKENS = "tokens"
+TABLE_SENTENCES = "sentences"
+TABLES = [TABLE_TOKENS, TABLE_SENTENCES]
+
+# column name -> pyarrow type name
+COLUMNS = {
+    TABLE_TOKENS: {
+        "sent_id": "int64",
+        "verse_id": "int64",
+        "position": "int32",
+        "form": "string",
+        "lemma": "string",
+        "upos": "string",
+        "xpos": "string",
+        "feats": "string",
+        "misc": "string",
+        "lemma_id": "int64",
+        "unsandhied": "string",
+        "word_sem": "string",
+    },
+    TABLE_SENTENCES: {
+        "sent_id": "int64",
+        "verse_id": "int64",
+        "chapter_name": "string",
+        "text": "string",
+        "n_tokens": "int32",
+    },
+}
+
+DEFAULT_ROW_GROUP_SIZE = 2 ** 16
+DEFAULT_COMPRESSION = "zstd"
+PART_FILE = "part-0.parquet"
+
+###############################################################################
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet export requires 'pyarrow' (pip install pyarrow)"
+        ) from e
+    return pyarrow
+
+
+def format_dict(value: dict or None) -> str or None:
+    """
+    Key-value column in the CoNLL-U format
+
+    Inverse of the parsing done by `conllu`, i.e., None is written as
+    `Key=_` and an empty string as a bare `Key`.
+    """
+    if not value:
+        return None
+    return "|".join(
+        f"{key}=_" if _value is None else
+        key if _value == "" else
+        f"{key}={_value}"
+        for key, _value in value.items()
+    )
+
+
+def parse_int(value) -> int or None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def replace_directory(path: Path, new_path: Path):
+    """Replace a directory (if any) by a new one (if any)"""
+    old_path = path.with_name(f".{path.name}.old.{os.getpid()}")
+    if path.exists():
+        os.replace(path, old_path)
+    if new_path.exists():
+        os.replace(new_path, path)
+    shutil.rmtree(old_path, ignore_errors=True)
+
+
+###############################################################################
+
+
+class PartitionWriter:
+    def __init__(
+        self,
+        path: Path,
+        columns: List[str],
+        column_types: Dict[str, str],
+        compression: str,
+        row_group_size: int,
+    ):
+        """
+        Writer of a Parquet file in row groups of bounded size
+
+        The file is created on the first row group, i.e., no file is
+        created for a partition without rows.
+        """
+        self.pa = _import_pyarrow()
+        self.path = path
+        self.columns = columns
+        self.schema = self.pa.schema([
+            (column, getattr(self.pa, column_types[column])())
+            for column in columns
+        ])
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.buffer = {column: [] for column in columns}
+        self.n_buffered = 0
+        self.n_rows = 0
+        self.writer = None
+
+    def append(self, row: Dict):
+        for column in self.columns:
+            self.buffer[column].append(row[column])
+        self.n_buffered += 1
+        if self.n_buffered >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        if not self.n_buffered:
+            return
+        if self.writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.writer = self.pa.parquet.ParquetWriter(
+                self.path, self.schema, compression=self.compression
+            )
+        table = self.pa.Table.from_pydict(self.buffer, schema=self.schema)
+        self.writer.write_table(table, row_group_size=self.row_group_size)
+        self.n_rows += self.n_buffered
+        self.buffer = {column: [] for column in self.columns}
+        self.n_buffered = 0
+
+    def close(self):
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+###############################################################################
+
+
+def export_parquet(
+    parser,
+    output_dir: str or Path,
+    corpus_ids_or_names: Iterable[str or int] = None,
+    tables: List[str] = None,
+    columns: Dict[str, List[str]] = None,
+    compression: str = DEFAULT_COMPRESSION,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> Dict[str, int]:
+    """
+    Export the Corpus to Parquet
+
+    Parameters
+    ----------
+    parser : DigitalCorpusSanskrit
+        Parser used to locate and parse the chapter files
+    output_dir : str or Path
+        Output directory, containing one directory per table.
+        Existing partitions of the exported texts are replaced.
+    corpus_ids_or_names : Iterable[str or int], optional
+        IDs or names of the texts to export.
+        If None, all texts are exported.
+        The default is None.
+    tables : List[str], optional
+        Tables to export, out of TABLES.
+        The default is None, i.e., all tables.
+    columns : Dict[str, List[str]], optional
+        Columns to export per table (out of COLUMNS).
+        Tables missing from the dictionary are exported with all columns.
+        The default is None.
+    compression : str, optional
+        Parquet compression codec, e.g., "zstd", "snappy", "gzip" or "none".
+        The default is DEFAULT_COMPRESSION.
+    row_group_size : int, optional
+        Maximum number of rows per row group, which is also the maximum
+        number of rows held in memory per table.
+        The default is DEFAULT_ROW_GROUP_SIZE.
+
+    Returns
+    -------
+    Dict[str, int]
+        Number of rows written per table
+    """
+    _import_pyarrow()
+    output_dir = Path(output_dir)
+    tables = TABLES if tables is None else tables
+    columns = columns or {}
+    for table in tables:
+        if table not in COLUMNS:
+            raise ValueError(f"Invalid table: '{table}'")
+        invalid = set(columns.get(table, [])) - set(COLUMNS[table])
+        if invalid:
+            raise ValueError(f"Invalid columns for '{table}': {invalid}")
+
+    text_files = {}
+    for item in parser.get_all_corpus_files(corpus_ids_or_names):
+        text_files.setdefault(item["text_id"], []).append(item["path"])
+
+    counts = dict.fromkeys(tables, 0)
+    for text_id, conllu_files in text_files.items():
+        partition = f"text_id={text_id}"
+        staging_dirs = {
+            table: output_dir / table / f".{partition}.{os.getpid()}"
+            for table in tables
+        }
+        for staging_dir in staging_dirs.values():
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        try:
+            for chapter, conllu_file in enumerate(conllu_files):
+                writers = {
+                    table: PartitionWriter(
+                        staging_dirs[table] / f"chapter={chapter}" / PART_FILE,
+                        columns.get(table) or list(COLUMNS[table]),
+                        COLUMNS[table],
+                        compression=compression,
+                        row_group_size=row_group_size,
+                    )
+                    for table in tables
+                }
+                try:
+                    export_chapter(parser, conllu_file, writers)
+                finally:
+                    for table, writer in writers.items():
+                        writer.close()
+                        counts[table] += writer.n_rows
+        except BaseException:
+            for staging_dir in staging_dirs.values():
+                shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+
+        for table, staging_dir in staging_dirs.items():
+            replace_directory(output_dir / table / partition, staging_dir)
+    return counts
+
+
+def export_chapter(parser, conllu_file: str or Path, writers: Dict):
+    """Write rows of a chapter file using the writers of every table"""
+    tokens_writer = writers.get(TABLE_TOKENS)
+    sentences_writer = writers.get(TABLE_SENTENCES)
+    chapter_name = Path(conllu_file).name
+
+    for line in parser.parse_conllu_file(conllu_file, stream=True):
+        metadata = line.metadata
+        sent_id = parse_int(metadata.get(parser.metadata_field_line_id))
+        verse_id = parse_int(metadata.get(parser.metadata_field_verse_id))
+        n_tokens = 0
+        for token in line:
+            if not isinstance(token["id"], int):
+                continue
+            n_tokens += 1
+            if tokens_writer is None:
+                continue
+            misc = token.get("misc") or {}
+            tokens_writer.append({
+                "sent_id": sent_id,
+                "verse_id": verse_id,
+                "position": token["id"],
+                "form": token.get("form"),
+                "lemma": token.get("lemma"),
+                "upos": token.get("upos"),
+                "xpos": token.get("xpos"),
+                "feats": format_dict(token.get("feats")),
+                "misc": format_dict(misc),
+                "lemma_id": parse_int(misc.get("LemmaId")),
+                "unsandhied": misc.get("Unsandhied"),
+                "word_sem": misc.get("WordSem"),
+            })
+
+        if sentences_writer is not None:
+            sentences_writer.append({
+                "sent_id": sent_id,
+                "verse_id": verse_id,
+                "chapter_name": chapter_name,
+                "text": metadata.get(parser.metadata_field_line_text),
+                "n_tokens": n_tokens,
+            })
+
+
+###############################################################################
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Frequency and Collocation Statistics
+
+Frequencies of forms and lemmas, vocabulary sizes, type/token ratios and
+windowed co-occurrence counts of lemmas, computed in a single pass.
+
+Statistics are computed per chapter file (map), optionally on a process
+pool, and merged (reduce) into statistics of any set of texts. The partial
+statistics of every file are cached on disk (`FileCache`), and are
+recomputed only if the file changes, so queries for any subset of texts are
+answered by merging cached partials.
+"""
+
+from collections import Counter
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from cache import FileCache, get_source_info
+from shards import plan_shards, WEIGHT_BYTES
+
+###############################################################################
+
+STATISTICS_VERSION = 1
+DEFAULT_WINDOW = 2
+
+###############################################################################
+
+
+class Statistics:
+    __slots__ = ["sentences", "tokens", "forms", "lemmas", "collocations"]
+
+    def __init__(
+        self,
+        sentences: int = 0,
+        tokens: int = 0,
+        forms: Counter = None,
+        lemmas: Counter = None,
+        collocations: Counter = None,
+    ):
+        """
+        Frequency Statistics
+
+        Parameters
+        ----------
+        sentences : int, optional
+            Number of sentences
+        tokens : int, optional
+            Number of tokens
+        forms : Counter, optional
+            Frequency of every form
+        lemmas : Counter, optional
+            Frequency of every lemma
+        collocations : Counter, optional
+            Number of co-occurrences of every (unordered) pair of lemmas
+            within the window, as (lemma, lemma) in sorted order
+        """
+        self.sentences = sentences
+        self.tokens = tokens
+        self.forms = Counter() if forms is None else forms
+        self.lemmas = Counter() if lemmas is None else lemmas
+        self.collocations = Counter() if collocations is None else collocations
+
+    def update(self, other: "Statistics"):
+        """Merge another set of statistics into this one"""
+        self.sentences += other.sentences
+        self.tokens += other.tokens
+        self.forms.update(other.forms)
+        self.lemmas.update(other.lemmas)
+        self.collocations.update(other.collocations)
+        return self
+
+    @classmethod
+    def merge(cls, statistics: Iterable["Statistics"]) -> "Statistics":
+        merged = cls()
+        for _statistics in statistics:
+            merged.update(_statistics)
+        return merged
+
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def form_vocabulary_size(self) -> int:
+        return len(self.forms)
+
+    @property
+    def lemma_vocabulary_size(self) -> int:
+        return len(self.lemmas)
+
+    def type_token_ratio(self, kind: str = "lemma") -> float:
+        """Number of distinct forms (or lemmas) per token"""
+        types = self.lemmas if kind == "lemma" else self.forms
+        return len(types) / self.tokens if self.tokens else 0.0
+
+    def get_collocates(self, lemma: str) -> Counter:
+        """Lemmas co-occurring with a lemma, with their counts"""
+        collocates = Counter()
+        for (first, second), count in self.collocations.items():
+            if first == lemma:
+                collocates[second] += count
+            elif second == lemma:
+                collocates[first] += count
+        return collocates
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return (
+            f"Statistics(sentences={self.sentences}, tokens={self.tokens}, "
+            f"forms={len(self.forms)}, lemmas={len(self.lemmas)}, "
+            f"collocations={len(self.collocations)})"
+        )
+
+
+###############################################################################
+
+
+def compute_statistics(
+    conllu_lines: Iterable, window: int = DEFAULT_WINDOW
+) -> Statistics:
+    """
+    Compute statistics of parsed CoNLL-U lines
+
+    Parameters
+    ----------
+    conllu_lines : Iterable
+        Parsed CoNLL-U lines
+    window : int, optional
+        Two lemmas co-occur if they are in the same sentence, at most
+        `window` tokens apart (tokens without a lemma are not counted).
+        If 0, collocations are not counted.
+        The default is DEFAULT_WINDOW.
+
+    Returns
+    -------
+    Statistics
+        Statistics of the lines
+    """
+    statistics = Statistics()
+    forms = statistics.forms
+    lemmas = statistics.lemmas
+    collocations = statistics.collocations
+    for line in conllu_lines:
+        statistics.sentences += 1
+        line_lemmas = []
+        for token in line:
+            if not isinstance(token["id"], int):
+                continue
+            statistics.tokens += 1
+            forms[token.get("form")] += 1
+            lemma = token.get("lemma")
+            if lemma is not None:
+                lemmas[lemma] += 1
+                line_lemmas.append(lemma)
+
+        for i, first in enumerate(line_lemmas):
+            for second in line_lemmas[i + 1:i + 1 + window]:
+                pair = (first, second) if first <= second else (second, first)
+                collocations[pair] += 1
+    return statistics
+
+
+def compute_file_statistics(
+    parser, conllu_file: str or Path, window: int = DEFAULT_WINDOW
+) -> Statistics:
+    """Map phase: statistics of a single CoNLL-U file"""
+    return compute_statistics(
+        parser.parse_conllu_file(conllu_file, stream=True), window=window
+    )
+
+
+###############################################################################
+
+
+class CorpusStatistics:
+    CACHE_KIND = "statistics"
+
+    def __init__(
+        self,
+        parser,
+        cache_dir: str or Path = None,
+        window: int = DEFAULT_WINDOW,
+    ):
+        """
+        Frequency and Collocation Statistics of the Corpus
+
+        Parameters
+        ----------
+        parser : DigitalCorpusSanskrit
+            Parser used to locate and parse the chapter files
+        cache_dir : str or Path, optional
+            Directory for the cache of statistics per file.
+            If None, statistics are computed on every call.
+            The default is None.
+        window : int, optional
+            Window for collocations. (Refer: `compute_statistics()`)
+            The default is DEFAULT_WINDOW.
+        """
+        self.parser = parser
+        self.window = window
+        self.cache = None
+        if cache_dir is not None:
+            self.cache = FileCache(
+                cache_dir,
+                config={
+                    **parser.get_config(),
+                    "statistics_version": STATISTICS_VERSION,
+                    "window": window,
+                },
+            )
+
+    def _map(
+        self, items: List[Dict], workers: int = None
+    ) -> Iterable[Tuple[Dict, Statistics]]:
+        """Statistics of every file, from the cache or computed"""
+        missing = []
+        # taken before the files are parsed (Refer: `FileCache.set()`)
+        source_infos = {}
+        for item in items:
+            statistics = None
+            if self.cache is not None:
+                statistics = self.cache.get(item["path"], self.CACHE_KIND)
+            if statistics is None:
+                missing.append(item)
+                if self.cache is not None:
+                    source_infos[str(item["path"])] = get_source_info(
+                        item["path"]
+                    )
+            else:
+                yield item, statistics
+
+        function = partial(compute_file_statistics, window=self.window)
+        if workers and workers > 1 and len(missing) > 1:
+            items = {str(item["path"]): item for item in missing}
+            results = (
+                (items[str(conllu_file)], statistics)
+                for conllu_file, statistics in self.parser.process_corpus(
+                    function,
+                    workers=workers,
+                    shards=plan_shards(missing, workers, WEIGHT_BYTES),
+                )
+            )
+        else:
+            results = (
+                (item, function(self.parser, item["path"]))
+                for item in missing
+            )
+
+        for item, statistics in results:
+            if self.cache is not None:
+                self.cache.set(
+                    item["path"],
+                    self.CACHE_KIND,
+                    statistics,
+                    source_infos[str(item["path"])],
+                )
+            yield item, statistics
+
+    def get_text_statistics(
+        self,
+        corpus_ids_or_names: Iterable[str or int] = None,
+        workers: int = None,
+    ) -> Dict[int, Statistics]:
+        """
+        Statistics of every text
+
+        Parameters
+        ----------
+        corpus_ids_or_names : Iterable[str or int], optional
+            IDs or names of the texts.
+            If None, all texts are included.
+            The default is None.
+        workers : int, optional
+            If more than 1, statistics of the files missing from the cache
+            are computed on a process pool with those many workers.
+            The default is None.
+
+        Returns
+        -------
+        Dict[int, Statistics]
+            Statistics of every text (by text id)
+        """
+        items = self.parser.get_all_corpus_files(corpus_ids_or_names)
+        texts = {item["text_id"]: Statistics() for item in items}
+        for item, statistics in self._map(items, workers=workers):
+            texts[item["text_id"]].update(statistics)
+        return texts
+
+    def get_statistics(
+        self,
+        corpus_ids_or_names: Iterable[str or int] = None,
+        workers: int = None,
+    ) -> Statistics:
+        """Statistics of the texts, merged (Refer: `get_text_statistics()`)"""
+        return Statistics.merge(
+            self.get_text_statistics(corpus_ids_or_names, workers).values()
+        )
+
+    def get_vocabulary_sizes(
+        self,
+        corpus_ids_or_names: Iterable[str or int] = None,
+        workers: int = None,
+    ) -> Dict[int, Dict[str, int]]:
+        """Number of tokens, forms and lemmas of every text"""
+        return {
+            text_id: {
+                "tokens": statistics.tokens,
+                "forms": statistics.form_vocabulary_size,
+                "lemmas": statistics.lemma_vocabulary_size,
+            }
+            for text_id, statistics in self.get_text_statistics(
+                corpus_ids_or_names, workers
+            ).items()
+        }
+
+
+###############################################################################
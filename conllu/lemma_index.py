@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lemma Inverted Index
+
+Maps every lemma (DCS `misc.LemmaId`) to the list of its occurrences
+(postings) in the corpus. Postings are stored per text as compressed sparse
+rows of `numpy` arrays, i.e., sorted lemma ids with offsets into the posting
+columns (chapter, sent_id, position).
+
+The lemmas (strings) of every text are stored along with its postings, as
+a string table and the LemmaIds of every lemma (compressed sparse rows).
+
+The index is built incrementally, one text at a time, and is stored as a
+directory of memory-mappable arrays per text. (Refer: array_index.py)
+"""
+
+from array import array
+from functools import reduce
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+from store import StringTable
+from array_index import ArrayIndex, POSTING_DTYPE, make_postings
+
+###############################################################################
+
+INDEX_VERSION = 3
+
+TEXT_ARRAYS = [
+    "keys", "offsets", "chapter", "sent_id", "position",
+    "lemma_ids", "lemma_offsets",
+]
+LEMMA_TABLE = "lemmas"
+
+###############################################################################
+
+
+class LemmaIndex(ArrayIndex):
+    version = INDEX_VERSION
+    text_arrays = TEXT_ARRAYS
+
+    def __init__(self, index_dir: str or Path):
+        """
+        Inverted Index of Lemmas
+
+        Parameters
+        ----------
+        index_dir : str or Path
+            Directory of the index.
+            An existing index in this directory is opened.
+        """
+        super().__init__(index_dir)
+        self._lemmas = {}
+
+    # ----------------------------------------------------------------------- #
+
+    def add_text(self, parser, corpus_id_or_name: str or int):
+        """
+        Index (or re-index) a text
+
+        Parameters
+        ----------
+        parser : DigitalCorpusSanskrit
+            Parser used to locate and parse the chapter files
+        corpus_id_or_name : str or int
+            ID or name of the text
+        """
+        text_id = parser.get_corpus_id(corpus_id_or_name)
+        if text_id is None:
+            raise KeyError(f"Corpus not found: '{corpus_id_or_name}'")
+
+        lemma_ids = array("q")
+        chapters = array("i")
+        sent_ids = array("q")
+        positions = array("i")
+        lemmas = {}
+        chapter_names = []
+
+        for conllu_file in parser.get_corpus_files(text_id) or []:
+            chapter = len(chapter_names)
+            chapter_names.append(Path(conllu_file).name)
+            for line in parser.parse_conllu_file(conllu_file, stream=True):
+                sent_id = int(line.metadata[parser.metadata_field_line_id])
+                for token in line:
+                    lemma_id = (token.get("misc") or {}).get("LemmaId")
+                    if not lemma_id or not isinstance(token["id"], int):
+                        continue
+                    lemma_id = int(lemma_id)
+                    lemma_ids.append(lemma_id)
+                    chapters.append(chapter)
+                    sent_ids.append(sent_id)
+                    positions.append(token["id"])
+                    if token.get("lemma"):
+                        lemmas.setdefault(token["lemma"], set()).add(lemma_id)
+
+        lemma_strings = sorted(lemmas)
+        lemma_offsets = np.zeros(len(lemma_strings) + 1, dtype=np.int64)
+        np.cumsum(
+            [len(lemmas[lemma]) for lemma in lemma_strings],
+            out=lemma_offsets[1:],
+        )
+
+        lemma_ids = np.frombuffer(lemma_ids, dtype=np.int64)
+        order = np.argsort(lemma_ids, kind="stable")
+        keys, counts = np.unique(lemma_ids[order], return_counts=True)
+        offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        arrays = {
+            "keys": keys,
+            "offsets": offsets,
+            "chapter": np.frombuffer(chapters, dtype=np.int32)[order],
+            "sent_id": np.frombuffer(sent_ids, dtype=np.int64)[order],
+            "position": np.frombuffer(positions, dtype=np.int32)[order],
+            "lemma_ids": np.array(
+                [
+                    lemma_id
+                    for lemma in lemma_strings
+                    for lemma_id in sorted(lemmas[lemma])
+                ],
+                dtype=np.int64,
+            ),
+            "lemma_offsets": lemma_offsets,
+        }
+        self.save_text(
+            text_id,
+            arrays,
+            {"chapters": chapter_names, "postings": len(lemma_ids)},
+            tables={LEMMA_TABLE: StringTable.from_strings(lemma_strings)},
+        )
+
+    def clear_text_cache(self, text_id: int):
+        super().clear_text_cache(text_id)
+        self._lemmas.pop(text_id, None)
+
+    # ----------------------------------------------------------------------- #
+
+    def get_text_lemmas(self, text_id: int) -> StringTable:
+        if text_id not in self._lemmas:
+            self._lemmas[text_id] = StringTable.load(
+                self.get_text_dir(text_id), LEMMA_TABLE
+            )
+        return self._lemmas[text_id]
+
+    def get_lemma_ids(self, lemma: str or int) -> List[int]:
+        """LemmaIds of a lemma (LemmaId or lemma in the store scheme)"""
+        if not isinstance(lemma, str):
+            return [int(lemma)]
+
+        lemma_ids = set()
+        for text_id in self.text_ids:
+            code = self.get_text_lemmas(text_id).index(lemma)
+            if code < 0:
+                continue
+            arrays = self.get_text_arrays(text_id)
+            start, end = arrays["lemma_offsets"][code:code + 2]
+            lemma_ids.update(arrays["lemma_ids"][start:end].tolist())
+        return sorted(lemma_ids)
+
+    # ----------------------------------------------------------------------- #
+
+    def lookup(self, lemma: str or int, text_ids: List[int] = None):
+        """
+        Get all occurrences of a lemma
+
+        Parameters
+        ----------
+        lemma : str or int
+            LemmaId, or lemma (in the store scheme of the parser)
+        text_ids : List[int], optional
+            Restrict the search to these texts.
+            The default is None, i.e., all indexed texts.
+
+        Returns
+        -------
+        np.ndarray
+            Postings, i.e., structured array with the fields
+            `text_id`, `chapter`, `sent_id` and `position`,
+            sorted in the corpus order
+        """
+        if text_ids is None:
+            text_ids = self.text_ids
+
+        lemma_ids = self.get_lemma_ids(lemma)
+        results = []
+        for text_id in text_ids:
+            arrays = self.get_text_arrays(text_id)
+            keys = arrays["keys"]
+            for lemma_id in lemma_ids:
+                idx = np.searchsorted(keys, lemma_id)
+                if idx == len(keys) or keys[idx] != lemma_id:
+                    continue
+                start, end = arrays["offsets"][idx:idx + 2]
+                results.append(
+                    make_postings(text_id, arrays, slice(start, end))
+                )
+
+        if not results:
+            return np.empty(0, dtype=POSTING_DTYPE)
+        return np.sort(np.concatenate(results), kind="stable")
+
+    def union(self, *lemmas: str or int, text_ids: List[int] = None):
+        """Occurrences of any of the lemmas"""
+        postings = [self.lookup(lemma, text_ids) for lemma in lemmas]
+        if not postings:
+            return np.empty(0, dtype=POSTING_DTYPE)
+        return np.unique(np.concatenate(postings))
+
+    def intersection(self, *lemmas: str or int, text_ids: List[int] = None):
+        """
+        Occurrences of the lemmas in sentences containing all of them
+
+        Returns
+        -------
+        np.ndarray
+            Postings of every lemma, restricted to the sentences
+            (`sent_id`) in which all of the lemmas occur
+        """
+        postings = [self.lookup(lemma, text_ids) for lemma in lemmas]
+        if not postings:
+            return np.empty(0, dtype=POSTING_DTYPE)
+        sent_ids = reduce(
+            np.intersect1d, (np.unique(p["sent_id"]) for p in postings)
+        )
+        postings = np.unique(np.concatenate(postings))
+        return postings[np.isin(postings["sent_id"], sent_ids)]
+
+    def count(self, lemma: str or int, text_ids: List[int] = None) -> int:
+        """Number of occurrences of a lemma"""
+        return len(self.lookup(lemma, text_ids))
+
+
+###############################################################################
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Manifest of CoNLL-U Files
+
+Records size, modification time and content hash of every chapter file, so
+that the files added, changed or removed since the last run can be detected
+without reading unchanged files. A file is hashed only if its size or
+modification time differs from the recorded one.
+"""
+
+import os
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from cache import file_hash
+
+###############################################################################
+
+MANIFEST_VERSION = 1
+
+ADDED = "added"
+CHANGED = "changed"
+REMOVED = "removed"
+
+###############################################################################
+
+
+class Manifest:
+    def __init__(self, manifest_path: str or Path, base_dir: str or Path):
+        """
+        Manifest of Files
+
+        Parameters
+        ----------
+        manifest_path : str or Path
+            Path to the manifest (JSON) file.
+            An existing manifest is loaded.
+        base_dir : str or Path
+            Directory the recorded file paths are relative to
+        """
+        self.path = Path(manifest_path)
+        self.base_dir = Path(base_dir)
+        self.files = {}
+        if self.path.is_file():
+            manifest = json.loads(self.path.read_text(encoding="utf-8"))
+            if manifest["version"] == MANIFEST_VERSION:
+                self.files = manifest["files"]
+
+    def get_key(self, path: str or Path) -> str:
+        return Path(path).relative_to(self.base_dir).as_posix()
+
+    def get_path(self, key: str) -> Path:
+        return self.base_dir / key
+
+    # ----------------------------------------------------------------------- #
+
+    def scan(self, paths: Iterable[str or Path]) -> Dict[str, List[Path]]:
+        """
+        Compare files with the manifest
+
+        The manifest itself is not modified; use `update()` to record the
+        current state once the changes have been processed.
+
+        Parameters
+        ----------
+        paths : Iterable[str or Path]
+            Current files
+
+        Returns
+        -------
+        Dict[str, List[Path]]
+            Files that have been ADDED, CHANGED or REMOVED, along with
+            "entries", the current entries of all the files
+        """
+        entries = {}
+        changes = {ADDED: [], CHANGED: [], REMOVED: []}
+        for path in paths:
+            key = self.get_key(path)
+            stat = os.stat(path)
+            entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            recorded = self.files.get(key)
+            if recorded is None:
+                entry["hash"] = file_hash(path)
+                changes[ADDED].append(Path(path))
+            elif (
+                recorded["size"] == entry["size"]
+                and recorded["mtime_ns"] == entry["mtime_ns"]
+            ):
+                entry["hash"] = recorded["hash"]
+            else:
+                entry["hash"] = file_hash(path)
+                if entry["hash"] != recorded["hash"]:
+                    changes[CHANGED].append(Path(path))
+            entries[key] = entry
+
+        changes[REMOVED] = [
+            self.get_path(key) for key in self.files if key not in entries
+        ]
+        changes["entries"] = entries
+        return changes
+
+    def update(self, entries: Dict[str, Dict]):
+        """Record the entries returned by `scan()` and save the manifest"""
+        self.files = entries
+        self.save()
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}")
+        temp_path.write_text(
+            json.dumps(
+                {"version": MANIFEST_VERSION, "files": self.files},
+                ensure_ascii=False,
+                indent=1,
+            ),
+            encoding="utf-8",
+        )
+        os.replace(temp_path, self.path)
+
+
+###############################################################################
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Morphological Bitmap Index
+
+Keeps one bitmap per (feature, value) of `feats`, and per `upos` and `xpos`,
+over the token positions of a text. Bit `i` of a bitmap is set if token `i`
+of the text has that value. Bitmaps are packed (`numpy.packbits`), i.e., a
+text of `n` tokens needs `n / 8` bytes per bitmap, and queries combining
+several conditions are evaluated as vectorised bitwise operations over the
+packed bitmaps.
+
+Queries are built from `Q` objects,
+
+>>> Q(upos="NOUN", Case="Gen", Number="Plur", Gender="Fem")
+>>> Q(upos=["NOUN", "ADJ"]) & ~Q(Number="Sing")
+>>> Q(Tense="Past") | Q(VerbForm="Part")
+
+Keyword arguments of a `Q` are combined with AND, and a list of values for
+a key is combined with OR.
+
+The index is built once per text, and is stored as a directory of
+memory-mappable arrays per text. (Refer: array_index.py)
+"""
+
+from array import array
+from functools import reduce
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from array_index import ArrayIndex, POSTING_DTYPE, make_postings
+
+###############################################################################
+
+INDEX_VERSION = 2
+
+TEXT_ARRAYS = ["bitmaps", "chapter", "sent_id", "position"]
+TAG_FIELDS = ["upos", "xpos"]
+
+POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], np.int64)
+
+###############################################################################
+
+
+def get_key(name: str, value: str) -> str:
+    """Key of a bitmap, e.g., `upos=NOUN` or `Case=Gen`"""
+    return f"{name}={value}"
+
+
+def count_bits(bitmap: np.ndarray) -> int:
+    return int(POPCOUNT[bitmap].sum())
+
+
+###############################################################################
+
+
+class Q:
+    def __init__(self, **conditions):
+        """
+        Morphological Query
+
+        Parameters
+        ----------
+        **conditions
+            `upos`, `xpos` or feature name (e.g., `Case`) and the value
+            (or a list of values, any of which may match)
+        """
+        self.operator = "and"
+        self.operands = [
+            Q._any([get_key(name, value) for value in values])
+            if isinstance(values, (list, tuple, set)) else
+            get_key(name, values)
+            for name, values in conditions.items()
+        ]
+
+    @classmethod
+    def _node(cls, operator: str, operands: list):
+        query = cls.__new__(cls)
+        query.operator = operator
+        query.operands = operands
+        return query
+
+    @classmethod
+    def _any(cls, keys: List[str]):
+        return cls._node("or", keys)
+
+    def __and__(self, other):
+        return Q._node("and", [self, other])
+
+    def __or__(self, other):
+        return Q._node("or", [self, other])
+
+    def __invert__(self):
+        return Q._node("not", [self])
+
+    # ----------------------------------------------------------------------- #
+
+    def evaluate(self, get_bitmap: Callable, valid: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the query over packed bitmaps
+
+        Parameters
+        ----------
+        get_bitmap : Callable
+            Function returning the packed bitmap of a key
+        valid : np.ndarray
+            Packed bitmap with the bits of all tokens set
+
+        Returns
+        -------
+        np.ndarray
+            Packed bitmap of the matching tokens
+        """
+        bitmaps = [
+            get_bitmap(operand)
+            if isinstance(operand, str) else
+            operand.evaluate(get_bitmap, valid)
+            for operand in self.operands
+        ]
+        if self.operator == "not":
+            return np.bitwise_and(np.invert(bitmaps[0]), valid)
+        if not bitmaps:
+            # empty conjunction matches everything, empty disjunction nothing
+            if self.operator == "and":
+                return valid.copy()
+            return np.zeros_like(valid)
+        if self.operator == "and":
+            return reduce(np.bitwise_and, bitmaps)
+        return reduce(np.bitwise_or, bitmaps)
+
+    def __repr__(self):
+        if self.operator == "not":
+            return f"~{self.operands[0]!r}"
+        operator = " & " if self.operator == "and" else " | "
+        return "(" + operator.join(
+            repr(operand) if isinstance(operand, Q) else operand
+            for operand in self.operands
+        ) + ")"
+
+
+###############################################################################
+
+
+class MorphIndex(ArrayIndex):
+    version = INDEX_VERSION
+    text_arrays = TEXT_ARRAYS
+
+    def __init__(self, index_dir: str or Path):
+        """
+        Bitmap Index of Morphological Features
+
+        Parameters
+        ----------
+        index_dir : str or Path
+            Directory of the index.
+            An existing index in this directory is opened.
+        """
+        super().__init__(index_dir)
+        self._keys = {}
+
+    # ----------------------------------------------------------------------- #
+
+    def add_text(self, parser, corpus_id_or_name: str or int):
+        """
+        Index (or re-index) a text
+
+        Parameters
+        ----------
+        parser : DigitalCorpusSanskrit
+            Parser used to locate and parse the chapter files
+        corpus_id_or_name : str or int
+            ID or name of the text
+        """
+        text_id = parser.get_corpus_id(corpus_id_or_name)
+        if text_id is None:
+            raise KeyError(f"Corpus not found: '{corpus_id_or_name}'")
+
+        chapters = array("i")
+        sent_ids = array("q")
+        positions = array("i")
+        key_positions = {}
+        chapter_names = []
+
+        for conllu_file in parser.get_corpus_files(text_id) or []:
+            chapter = len(chapter_names)
+            chapter_names.append(Path(conllu_file).name)
+            for line in parser.parse_conllu_file(conllu_file, stream=True):
+                sent_id = int(line.metadata[parser.metadata_field_line_id])
+                for token in line:
+                    if not isinstance(token["id"], int):
+                        continue
+                    index = len(positions)
+                    values = [
+                        (field, token.get(field)) for field in TAG_FIELDS
+                    ]
+                    values.extend((token.get("feats") or {}).items())
+                    for name, value in values:
+                        if value is None or value == "_":
+                            continue
+                        key_positions.setdefault(
+                            get_key(name, value), array("i")
+                        ).append(index)
+                    chapters.append(chapter)
+                    sent_ids.append(sent_id)
+                    positions.append(token["id"])
+
+        n_tokens = len(positions)
+        keys = sorted(key_positions)
+        bitmaps = np.zeros((len(keys), (n_tokens + 7) // 8), dtype=np.uint8)
+        bits = np.zeros(n_tokens, dtype=bool)
+        for row, key in enumerate(keys):
+            bits[:] = False
+            bits[np.frombuffer(key_positions[key], dtype=np.int32)] = True
+            bitmaps[row] = np.packbits(bits)
+
+        arrays = {
+            "bitmaps": bitmaps,
+            "chapter": np.frombuffer(chapters, dtype=np.int32),
+            "sent_id": np.frombuffer(sent_ids, dtype=np.int64),
+            "position": np.frombuffer(positions, dtype=np.int32),
+        }
+        self.save_text(
+            text_id,
+            arrays,
+            {"chapters": chapter_names, "keys": keys, "tokens": n_tokens},
+        )
+
+    def clear_text_cache(self, text_id: int):
+        super().clear_text_cache(text_id)
+        self._keys.pop(text_id, None)
+
+    # ----------------------------------------------------------------------- #
+
+    def get_text_keys(self, text_id: int) -> Dict[str, int]:
+        """Row of the bitmap of every key of a text"""
+        if text_id not in self._keys:
+            keys = self.manifest["texts"][str(text_id)]["keys"]
+            self._keys[text_id] = {key: row for row, key in enumerate(keys)}
+        return self._keys[text_id]
+
+    @property
+    def keys(self) -> List[str]:
+        """All keys (`name=value`) present in the index"""
+        return sorted({
+            key
+            for text_info in self.manifest["texts"].values()
+            for key in text_info["keys"]
+        })
+
+    # ----------------------------------------------------------------------- #
+
+    def evaluate(self, query: Q, text_id: int) -> np.ndarray:
+        """Packed bitmap of the tokens of a text matching a query"""
+        arrays = self.get_text_arrays(text_id)
+        rows = self.get_text_keys(text_id)
+        bitmaps = arrays["bitmaps"]
+        n_tokens = self.manifest["texts"][str(text_id)]["tokens"]
+        empty = np.zeros(bitmaps.shape[1], dtype=np.uint8)
+        valid = np.packbits(np.ones(n_tokens, dtype=bool))
+
+        def get_bitmap(key: str) -> np.ndarray:
+            row = rows.get(key)
+            return empty if row is None else bitmaps[row]
+
+        return query.evaluate(get_bitmap, valid)
+
+    def count(self, query: Q, text_ids: List[int] = None) -> int:
+        """Number of tokens matching a query"""
+        return sum(self.count_by_text(query, text_ids).values())
+
+    def count_by_text(
+        self, query: Q, text_ids: List[int] = None
+    ) -> Dict[int, int]:
+        """Number of tokens matching a query in every text"""
+        if text_ids is None:
+            text_ids = self.text_ids
+        return {
+            text_id: count_bits(self.evaluate(query, text_id))
+            for text_id in text_ids
+        }
+
+    def locate(self, query: Q, text_ids: List[int] = None) -> np.ndarray:
+        """
+        Locations of the tokens matching a query
+
+        Parameters
+        ----------
+        query : Q
+            Query
+        text_ids : List[int], optional
+            Restrict the search to these texts.
+            The default is None, i.e., all indexed texts.
+
+        Returns
+        -------
+        np.ndarray
+            Postings, i.e., structured array with the fields `text_id`,
+            `chapter`, `sent_id` and `position` (same as `LemmaIndex`),
+            in the corpus order
+        """
+        if text_ids is None:
+            text_ids = self.text_ids
+
+        results = []
+        for text_id in text_ids:
+            arrays = self.get_text_arrays(text_id)
+            n_tokens = self.manifest["texts"][str(text_id)]["tokens"]
+            indices = np.flatnonzero(
+                np.unpackbits(self.evaluate(query, text_id), count=n_tokens)
+            )
+            results.append(make_postings(text_id, arrays, indices))
+
+        if not results:
+            return np.empty(0, dtype=POSTING_DTYPE)
+        return np.concatenate(results)
+
+
+###############################################################################
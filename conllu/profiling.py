@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Profiling of the CoNLL-U Pipeline
+
+Wall-clock time spent in every stage of reading a file,
+* STAGE_IO: reading the file
+* STAGE_PARSE: parsing CoNLL-U (includes reading, when streaming)
+* STAGE_TRANSLITERATE: transliteration of metadata and tokens
+* STAGE_BUILD: preparing lines and grouping them into verses
+
+along with counters (files, cache hits, bytes, sentences, tokens and
+transliteration calls), aggregated per file, per text and in total.
+
+A parser collects statistics only if it has a `Profiler`,
+
+>>> profiler = Profiler(callback=print)
+>>> parser = CoNLLUParser(..., profiler=profiler)
+
+otherwise the instrumentation is skipped entirely.
+"""
+
+import threading
+from pathlib import Path
+from typing import Callable, Dict
+
+###############################################################################
+
+STAGE_IO = "io"
+STAGE_PARSE = "parse"
+STAGE_TRANSLITERATE = "transliterate"
+STAGE_BUILD = "build"
+
+STAGES = [STAGE_IO, STAGE_PARSE, STAGE_TRANSLITERATE, STAGE_BUILD]
+COUNTERS = [
+    "files",
+    "cache_hits",
+    "bytes",
+    "sentences",
+    "tokens",
+    "transliterations",
+]
+
+###############################################################################
+
+
+class Stats:
+    __slots__ = ["time", "counts"]
+
+    def __init__(self, time: Dict[str, float] = None, counts: Dict = None):
+        """
+        Timers (seconds per stage) and Counters
+
+        Parameters
+        ----------
+        time : Dict[str, float], optional
+            Time spent in every stage.
+            The default is None.
+        counts : Dict[str, int], optional
+            Value of every counter.
+            The default is None.
+        """
+        self.time = dict.fromkeys(STAGES, 0.0)
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        if time:
+            self.time.update(time)
+        if counts:
+            self.counts.update(counts)
+
+    def add(self, other: "Stats"):
+        for stage, value in other.time.items():
+            self.time[stage] = self.time.get(stage, 0.0) + value
+        for counter, value in other.counts.items():
+            self.counts[counter] = self.counts.get(counter, 0) + value
+        return self
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.time.values())
+
+    def to_dict(self) -> Dict:
+        return {"time": dict(self.time), "counts": dict(self.counts)}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Stats":
+        return cls(data["time"], data["counts"])
+
+    def __reduce__(self):
+        return (Stats.from_dict, (self.to_dict(),))
+
+    def __repr__(self):
+        time = ", ".join(
+            f"{stage}={value:.3f}s" for stage, value in self.time.items()
+        )
+        counts = ", ".join(
+            f"{counter}={value}" for counter, value in self.counts.items()
+        )
+        return f"Stats({time}, {counts})"
+
+
+###############################################################################
+
+
+class Profiler:
+    def __init__(self, callback: Callable = None):
+        """
+        Statistics of a Parser, per File, per Text and in Total
+
+        Parameters
+        ----------
+        callback : Callable, optional
+            Function called as `callback(conllu_file, text, stats)` every
+            time a file has been read, e.g., to export metrics.
+            `text` is None if the parser does not know texts.
+            The callback is not sent to worker processes; statistics from
+            workers are recorded (and reported) in the main process.
+            The default is None.
+        """
+        self.callback = callback
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Discard all statistics"""
+        self.total = Stats()
+        self.files = {}
+        self.texts = {}
+
+    def record(self, conllu_file: str or Path, stats: Stats, text=None):
+        """Add the statistics of reading a file"""
+        conllu_file = str(conllu_file)
+        with self._lock:
+            self.total.add(stats)
+            self.files.setdefault(conllu_file, Stats()).add(stats)
+            if text is not None:
+                self.texts.setdefault(text, Stats()).add(stats)
+        if self.callback is not None:
+            self.callback(conllu_file, text, stats)
+
+    def to_dict(self) -> Dict:
+        return {
+            "total": self.total.to_dict(),
+            "files": {
+                conllu_file: stats.to_dict()
+                for conllu_file, stats in self.files.items()
+            },
+            "texts": {
+                text: stats.to_dict() for text, stats in self.texts.items()
+            },
+        }
+
+    def __getstate__(self):
+        # NOTE: callbacks (often lambdas or bound methods) are not pickled
+        state = self.__dict__.copy()
+        state["callback"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"Profiler(files={len(self.files)}, texts={len(self.texts)}, "
+            f"total={self.total})"
+        )
+
+
+###############################################################################
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sentence Offset Index
+
+Sidecar index mapping every sentence (`sent_id`) to its location in the
+CoNLL-U files, i.e., (file, byte offset, byte length). The index is built
+with a single pass over the raw bytes of every file, without parsing.
+
+A sentence (or a verse) is fetched by reading only its byte range through
+`mmap` and parsing that slice, instead of parsing the whole chapter.
+
+Layout
+------
+* sentence arrays, sorted by `sent_id`:
+  `sent_id`, `verse_id`, `file`, `offset`, `length`
+* verse arrays: `verse_key` (sorted `file << 32 | verse_id`) and
+  `verse_order` (position of the sentence in the sentence arrays)
+* `files.json`: path (relative to `data_dir/files`), size and
+  modification time of every indexed file
+"""
+
+import os
+import json
+import mmap
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+###############################################################################
+
+INDEX_VERSION = 1
+FILES_FILE = "files.json"
+
+MAX_OPEN_FILES = 64
+
+###############################################################################
+
+
+def scan_sentences(
+    conllu_file: str or Path,
+    id_key: str,
+    verse_key: str,
+) -> Iterable[Tuple[int, int, int, int]]:
+    """
+    Locate sentences in a CoNLL-U file
+
+    Parameters
+    ----------
+    conllu_file : str or Path
+        Path to the CoNLL-U File
+    id_key : str
+        Metadata key of the sentence id (e.g., `sent_id`)
+    verse_key : str
+        Metadata key of the verse id (e.g., `sent_counter`)
+
+    Yields
+    ------
+    Tuple[int, int, int, int]
+        sent_id, verse_id (-1 if missing), byte offset and byte length
+        of every sentence with a sentence id
+    """
+    id_key = id_key.encode("utf-8")
+    verse_key = verse_key.encode("utf-8") if verse_key else None
+
+    def get_value(value: bytes, default: int = None) -> int or None:
+        try:
+            return int(value)
+        except ValueError:
+            return default
+
+    offset = 0
+    start = None
+    end = None
+    sent_id = None
+    verse_id = -1
+    with open(conllu_file, "rb") as f:
+        for line in f:
+            if line.strip():
+                if start is None:
+                    start = offset
+                if line.startswith(b"#"):
+                    key, _, value = line[1:].partition(b"=")
+                    key = key.strip()
+                    if key == id_key:
+                        sent_id = get_value(value)
+                    elif verse_key and key == verse_key:
+                        verse_id = get_value(value, -1)
+                offset += len(line)
+                end = offset
+                continue
+
+            offset += len(line)
+            if start is not None and sent_id is not None:
+                yield sent_id, verse_id, start, end - start
+            start = None
+            sent_id = None
+            verse_id = -1
+
+    if start is not None and sent_id is not None:
+        yield sent_id, verse_id, start, end - start
+
+
+###############################################################################
+
+
+class SentenceIndex:
+    ARRAYS = [
+        "sent_id", "verse_id", "file", "offset", "length",
+        "verse_key", "verse_order",
+    ]
+
+    def __init__(self, parser, arrays: Dict, files: List[Dict]):
+        """
+        Byte Offset Index of Sentences
+
+        Use `SentenceIndex.build()` to create an index from the corpus, or
+        `SentenceIndex.open()` to open a saved index.
+
+        Parameters
+        ----------
+        parser : DigitalCorpusSanskrit
+            Parser used to parse (and transliterate) sentences
+        arrays : Dict
+            Arrays (see module docstring) by name
+        files : List[Dict]
+            Indexed files, as dictionaries with keys "path" (relative to
+            `data_dir/files`), "size" and "mtime_ns"
+        """
+        self.parser = parser
+        self.arrays = arrays
+        self.files = files
+        self.base_dir = Path(parser.data_dir) / "files"
+        self._mmaps = OrderedDict()
+        self._file_indices = None
+
+    @classmethod
+    def build(
+        cls,
+        parser,
+        corpus_ids_or_names: Iterable[str or int] = None,
+        path: str or Path = None,
+    ):
+        """
+        Build a Sentence Index from the Corpus
+
+        Parameters
+        ----------
+        parser : DigitalCorpusSanskrit
+            Parser used to locate the chapter files
+        corpus_ids_or_names : Iterable[str or int], optional
+            IDs or names of the texts to include.
+            If None, all texts are included.
+            The default is None.
+        path : str or Path, optional
+            If provided, the index is saved to this directory.
+            The default is None.
+
+        Returns
+        -------
+        SentenceIndex
+            Sentence index of the specified texts
+        """
+        base_dir = Path(parser.data_dir) / "files"
+        columns = {
+            "sent_id": array("q"),
+            "verse_id": array("q"),
+            "file": array("i"),
+            "offset": array("q"),
+            "length": array("i"),
+        }
+        files = []
+        for item in parser.get_all_corpus_files(corpus_ids_or_names):
+            stat = os.stat(item["path"])
+            file_index = len(files)
+            files.append({
+                "path": Path(item["path"]).relative_to(base_dir).as_posix(),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            })
+            for sent_id, verse_id, offset, length in scan_sentences(
+                item["path"],
+                parser.metadata_field_line_id,
+                parser.metadata_field_verse_id,
+            ):
+                columns["sent_id"].append(sent_id)
+                columns["verse_id"].append(verse_id)
+                columns["file"].append(file_index)
+                columns["offset"].append(offset)
+                columns["length"].append(length)
+
+        arrays = {
+            "sent_id": np.frombuffer(columns["sent_id"], dtype=np.int64),
+            "verse_id": np.frombuffer(columns["verse_id"], dtype=np.int64),
+            "file": np.frombuffer(columns["file"], dtype=np.int32),
+            "offset": np.frombuffer(columns["offset"], dtype=np.int64),
+            "length": np.frombuffer(columns["length"], dtype=np.int32),
+        }
+        order = np.argsort(arrays["sent_id"], kind="stable")
+        arrays = {name: values[order] for name, values in arrays.items()}
+
+        verse_key = (arrays["file"].astype(np.int64) << 32) | (
+            arrays["verse_id"] & 0xFFFFFFFF
+        )
+        arrays["verse_order"] = np.argsort(verse_key, kind="stable")
+        arrays["verse_key"] = verse_key[arrays["verse_order"]]
+
+        index = cls(parser, arrays, files)
+        if path is not None:
+            index.save(path)
+        return index
+
+    def save(self, path: str or Path):
+        """Save the index to a directory"""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(path / f"{name}.npy", np.ascontiguousarray(self[name]))
+        (path / FILES_FILE).write_text(
+            json.dumps(
+                {"version": INDEX_VERSION, "files": self.files},
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+
+    @classmethod
+    def open(cls, parser, path: str or Path, mmap_mode: str = "r"):
+        """
+        Open a saved index
+
+        Parameters
+        ----------
+        parser : DigitalCorpusSanskrit
+            Parser used to parse (and transliterate) sentences
+        path : str or Path
+            Directory containing the index
+        mmap_mode : str, optional
+            Memory-map mode passed to `numpy.load()`.
+            If None, arrays are read into memory.
+            The default is "r".
+
+        Returns
+        -------
+        SentenceIndex
+            Sentence index
+        """
+        path = Path(path)
+        meta = json.loads((path / FILES_FILE).read_text(encoding="utf-8"))
+        if meta["version"] != INDEX_VERSION:
+            raise ValueError(
+                f"Unsupported sentence index version: {meta['version']}"
+            )
+        return cls(
+            parser,
+            {
+                name: np.load(path / f"{name}.npy", mmap_mode=mmap_mode)
+                for name in cls.ARRAYS
+            },
+            meta["files"],
+        )
+
+    # ----------------------------------------------------------------------- #
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.arrays[name]
+
+    def __len__(self):
+        return len(self["sent_id"])
+
+    def get_path(self, file_index: int) -> Path:
+        return self.base_dir / self.files[file_index]["path"]
+
+    def get_stale_files(self) -> List[Path]:
+        """Indexed files that have changed since the index was built"""
+        stale = []
+        for file_index, info in enumerate(self.files):
+            path = self.get_path(file_index)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                stale.append(path)
+                continue
+            if (
+                stat.st_size != info["size"]
+                or stat.st_mtime_ns != info["mtime_ns"]
+            ):
+                stale.append(path)
+        return stale
+
+    def get_mmap(self, file_index: int) -> mmap.mmap:
+        """Memory-mapped file (at most MAX_OPEN_FILES are kept open)"""
+        if file_index in self._mmaps:
+            self._mmaps.move_to_end(file_index)
+            return self._mmaps[file_index]
+
+        path = self.get_path(file_index)
+        info = self.files[file_index]
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if (
+                stat.st_size != info["size"]
+                or stat.st_mtime_ns != info["mtime_ns"]
+            ):
+                raise RuntimeError(
+                    f"File has changed since it was indexed: '{path}'"
+                )
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._mmaps[file_index] = data
+        if len(self._mmaps) > MAX_OPEN_FILES:
+            self._mmaps.popitem(last=False)[1].close()
+        return data
+
+    def close(self):
+        while self._mmaps:
+            self._mmaps.popitem()[1].close()
+
+    def read(self, file_index: int, start: int, end: int) -> str:
+        return self.get_mmap(file_index)[start:end].decode("utf-8")
+
+    # ----------------------------------------------------------------------- #
+
+    def locate(self, sent_id: int) -> Tuple[Path, int, int] or None:
+        """(file, byte offset, byte length) of a sentence"""
+        position = self._get_position(sent_id)
+        if position is None:
+            return None
+        return (
+            self.get_path(int(self["file"][position])),
+            int(self["offset"][position]),
+            int(self["length"][position]),
+        )
+
+    def _get_position(self, sent_id: int) -> int or None:
+        sent_ids = self["sent_id"]
+        position = int(np.searchsorted(sent_ids, sent_id))
+        if position < len(sent_ids) and sent_ids[position] == sent_id:
+            return position
+        return None
+
+    def _read_sentences(self, positions: Iterable[int]) -> str:
+        """CoNLL-U data of the sentences, in the order of the files"""
+        locations = sorted(
+            (
+                int(self["file"][position]),
+                int(self["offset"][position]),
+                int(self["length"][position]),
+            )
+            for position in positions
+        )
+        return "\n".join(
+            self.read(file_index, offset, offset + length)
+            for file_index, offset, length in locations
+        )
+
+    def get_sentence(self, sent_id: int):
+        """
+        Get a Sentence by `sent_id`
+
+        Returns
+        -------
+        TokenList or None
+            Parsed and transliterated line, or None if the `sent_id` is not
+            present in the index
+        """
+        position = self._get_position(sent_id)
+        if position is None:
+            return None
+        lines = self.parser.parse_conllu(self._read_sentences([position]))
+        return lines[0] if lines else None
+
+    def get_verse(
+        self, verse_id: int, conllu_file: str or Path
+    ) -> List[Dict] or None:
+        """
+        Get a Verse by verse id (`sent_counter`)
+
+        Verse ids are unique only within a file, hence the file is required.
+        All the lines of the file with the verse id are returned as a single
+        verse, in the order of the file, even if lines of other verses occur
+        between them (`read_conllu_file()` yields every such run of lines
+        as a separate verse).
+
+        Parameters
+        ----------
+        verse_id : int
+            Verse id
+        conllu_file : str or Path
+            Path to the CoNLL-U File (or path relative to `data_dir/files`)
+
+        Returns
+        -------
+        list or None
+            Verse, i.e., list of lines in the format of `read_conllu_data()`
+        """
+        path = Path(conllu_file)
+        if path.is_absolute():
+            path = path.relative_to(self.base_dir)
+        if self._file_indices is None:
+            self._file_indices = {
+                info["path"]: file_index
+                for file_index, info in enumerate(self.files)
+            }
+        file_index = self._file_indices.get(path.as_posix())
+        if file_index is None:
+            return None
+
+        key = (file_index << 32) | (verse_id & 0xFFFFFFFF)
+        verse_keys = self["verse_key"]
+        start = np.searchsorted(verse_keys, key, side="left")
+        end = np.searchsorted(verse_keys, key, side="right")
+        if start == end:
+            return None
+        return self._read_verse(self["verse_order"][start:end])
+
+    def get_verse_of_sentence(self, sent_id: int) -> List[Dict] or None:
+        """Get the Verse containing a sentence"""
+        position = self._get_position(sent_id)
+        if position is None:
+            return None
+        if self["verse_id"][position] == -1:
+            # without verse ids, every line is a verse of its own
+            return self._read_verse([position])
+        return self.get_verse(
+            int(self["verse_id"][position]),
+            self.files[int(self["file"][position])]["path"],
+        )
+
+    def _read_verse(self, positions: np.ndarray) -> List[Dict] or None:
+        verses = self.parser.read_conllu_data(self._read_sentences(positions))
+        return verses[0] if verses else None
+
+    def __repr__(self):
+        return f"SentenceIndex(sentences={len(self)}, files={len(self.files)})"
+
+
+###############################################################################
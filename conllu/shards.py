@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Size-balanced Sharding of Corpus Files
+
+Sizes of texts (and chapters) vary by orders of magnitude, so splitting
+files into equal-count chunks leaves most workers idle while one processes
+the largest text. Files are weighed instead (by bytes or by tokens) and
+assigned to shards using the greedy longest-processing-time rule, i.e., the
+heaviest remaining file goes to the lightest shard.
+
+Shards can be processed on a local process pool, or written to a manifest
+(JSON) from which separate nodes pick their shard.
+"""
+
+import os
+import json
+import heapq
+from pathlib import Path
+from typing import Dict, List
+
+###############################################################################
+
+SHARD_MANIFEST_VERSION = 1
+
+WEIGHT_BYTES = "bytes"
+WEIGHT_TOKENS = "tokens"
+
+###############################################################################
+
+
+def count_tokens(conllu_file: str or Path) -> int:
+    """Number of token lines in a CoNLL-U file (without parsing it)"""
+    count = 0
+    with open(conllu_file, "rb") as f:
+        for line in f:
+            if line.strip() and not line.startswith(b"#"):
+                count += 1
+    return count
+
+
+def get_weight(conllu_file: str or Path, weight: str = WEIGHT_BYTES) -> int:
+    if weight == WEIGHT_BYTES:
+        return os.path.getsize(conllu_file)
+    if weight == WEIGHT_TOKENS:
+        return count_tokens(conllu_file)
+    raise ValueError(f"Invalid weight: '{weight}'")
+
+
+def balance(weights: List[int], n_shards: int) -> List[List[int]]:
+    """
+    Split items into shards of (nearly) equal total weight
+
+    Parameters
+    ----------
+    weights : List[int]
+        Weight of every item
+    n_shards : int
+        Number of shards
+
+    Returns
+    -------
+    List[List[int]]
+        Indices of the items in every shard, in the input order.
+        Shards are never empty, unless there are fewer items than shards.
+    """
+    n_shards = max(1, min(n_shards, len(weights)))
+    heap = [(0, shard_index) for shard_index in range(n_shards)]
+    shards = [[] for _ in range(n_shards)]
+    for index in sorted(
+        range(len(weights)), key=lambda index: weights[index], reverse=True
+    ):
+        load, shard_index = heapq.heappop(heap)
+        shards[shard_index].append(index)
+        heapq.heappush(heap, (load + weights[index], shard_index))
+    return [sorted(shard) for shard in shards if shard]
+
+
+###############################################################################
+
+
+def plan_shards(
+    items: List[Dict],
+    n_shards: int,
+    weight: str = WEIGHT_BYTES,
+) -> List[Dict]:
+    """
+    Plan Size-balanced Shards
+
+    Parameters
+    ----------
+    items : List[Dict]
+        Files to split, as dictionaries with a "path" key.
+        Other keys (e.g., "text_id") are retained.
+    n_shards : int
+        Number of shards
+    weight : str, optional
+        Weight of a file, WEIGHT_BYTES or WEIGHT_TOKENS.
+        The default is WEIGHT_BYTES.
+
+    Returns
+    -------
+    List[Dict]
+        Shards, as dictionaries with keys "id", "weight" and "files",
+        where every file has an additional key "weight"
+    """
+    items = [
+        {**item, "weight": get_weight(item["path"], weight)} for item in items
+    ]
+    return [
+        {
+            "id": shard_id,
+            "weight": sum(items[index]["weight"] for index in shard),
+            "files": [items[index] for index in shard],
+        }
+        for shard_id, shard in enumerate(
+            balance([item["weight"] for item in items], n_shards)
+        )
+    ]
+
+
+def save_shard_manifest(
+    manifest_path: str or Path,
+    shards: List[Dict],
+    base_dir: str or Path,
+    weight: str = WEIGHT_BYTES,
+):
+    """
+    Save shards to a manifest
+
+    File paths are stored relative to `base_dir`, so that nodes with a copy
+    of the corpus at a different location can resolve them.
+    """
+    base_dir = Path(base_dir)
+    manifest = {
+        "version": SHARD_MANIFEST_VERSION,
+        "weight": weight,
+        "shards": [
+            {
+                **shard,
+                "files": [
+                    {
+                        **item,
+                        "path": Path(item["path"])
+                        .relative_to(base_dir)
+                        .as_posix(),
+                    }
+                    for item in shard["files"]
+                ],
+            }
+            for shard in shards
+        ],
+    }
+    Path(manifest_path).write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=1), encoding="utf-8"
+    )
+
+
+def load_shard_manifest(
+    manifest_path: str or Path,
+    base_dir: str or Path,
+) -> List[Dict]:
+    """Load shards from a manifest, resolving paths against `base_dir`"""
+    base_dir = Path(base_dir)
+    manifest = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+    if manifest["version"] != SHARD_MANIFEST_VERSION:
+        raise ValueError(
+            f"Unsupported shard manifest version: {manifest['version']}"
+        )
+    for shard in manifest["shards"]:
+        for item in shard["files"]:
+            item["path"] = base_dir / item["path"]
+    return manifest["shards"]
+
+
+###############################################################################
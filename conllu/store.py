@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Columnar Token Store
+
+Tokens of the corpus are stored as columnar arrays instead of nested
+dictionaries and TokenLists. String columns (form, lemma, upos, xpos) are
+interned into string tables and stored as integer codes.
+
+Every array is saved as a separate `.npy` file in a directory, so that the
+store can be opened with `numpy.load(mmap_mode="r")` at near-zero startup
+cost, and be shared read-only by multiple processes through the page cache.
+
+Layout
+------
+* token arrays (one entry per token):
+  `form`, `lemma`, `upos`, `xpos` (codes), `lemma_id`, `token_id`
+* sentence arrays (one entry per sentence):
+  `sent_id`, `verse_id`, `chapter`, `sentence_offsets` (+1 entry, into tokens)
+* chapter arrays (one entry per chapter file):
+  `chapter_text`, `chapter_offsets` (+1 entry, into sentences)
+  and a string table with chapter names
+* text arrays (one entry per text):
+  `text_id`, `text_offsets` (+1 entry, into chapters)
+"""
+
+import json
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+###############################################################################
+
+STORE_VERSION = 1
+MISSING = -1
+
+###############################################################################
+
+
+class StringTable:
+    def __init__(self, data: np.ndarray, offsets: np.ndarray):
+        """
+        Table of Interned Strings
+
+        Strings are stored as a single UTF-8 encoded byte array, along with
+        the offsets of every string in it. Strings are decoded on access.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            UTF-8 encoded bytes of all the strings (dtype uint8)
+        offsets : np.ndarray
+            Start offset of every string, followed by the total length
+        """
+        self.data = data
+        self.offsets = offsets
+        self._index = None
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]):
+        encoded = [string.encode("utf-8") for string in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return cls(data, offsets)
+
+    @classmethod
+    def load(cls, path: Path, name: str, mmap_mode: str = "r"):
+        return cls(
+            np.load(path / f"{name}.strings.npy", mmap_mode=mmap_mode),
+            np.load(path / f"{name}.offsets.npy", mmap_mode=mmap_mode),
+        )
+
+    def save(self, path: Path, name: str):
+        np.save(path / f"{name}.strings.npy", self.data)
+        np.save(path / f"{name}.offsets.npy", self.offsets)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, code: int) -> str:
+        start, end = self.offsets[code], self.offsets[code + 1]
+        return self.data[start:end].tobytes().decode("utf-8")
+
+    def __iter__(self):
+        for code in range(len(self)):
+            yield self[code]
+
+    def index(self, string: str) -> int:
+        """Code of a string, or MISSING (-1) if the string is not present"""
+        if self._index is None:
+            self._index = {_string: code for code, _string in enumerate(self)}
+        return self._index.get(string, MISSING)
+
+
+###############################################################################
+
+
+class TokenStore:
+    STRING_COLUMNS = ["form", "lemma", "upos", "xpos"]
+    TOKEN_ARRAYS = STRING_COLUMNS + ["lemma_id", "token_id"]
+    SENTENCE_ARRAYS = ["sent_id", "verse_id", "chapter", "sentence_offsets"]
+    CHAPTER_ARRAYS = ["chapter_text", "chapter_offsets"]
+    TEXT_ARRAYS = ["text_id", "text_offsets"]
+    ARRAYS = TOKEN_ARRAYS + SENTENCE_ARRAYS + CHAPTER_ARRAYS + TEXT_ARRAYS
+
+    def __init__(
+        self,
+        arrays: Dict[str, np.ndarray],
+        vocabularies: Dict[str, StringTable],
+        chapter_names: StringTable,
+    ):
+        """
+        Columnar Store of CoNLL-U Tokens
+
+        Use `TokenStore.build()` to create a store from the corpus and
+        `TokenStore.open()` to open a saved store.
+
+        Parameters
+        ----------
+        arrays : Dict[str, np.ndarray]
+            Arrays listed in `TokenStore.ARRAYS`
+        vocabularies : Dict[str, StringTable]
+            String table for every column in `TokenStore.STRING_COLUMNS`
+        chapter_names : StringTable
+            Names (file names) of chapters
+        """
+        self.arrays = arrays
+        self.vocabularies = vocabularies
+        self.chapter_names = chapter_names
+
+    # ----------------------------------------------------------------------- #
+
+    @classmethod
+    def build(
+        cls,
+        parser,
+        corpus_ids_or_names: Iterable[str or int],
+        path: str or Path = None,
+    ):
+        """
+        Build a Token Store from the Corpus
+
+        Parameters
+        ----------
+        parser : DigitalCorpusSanskrit
+            Parser used to locate and parse the chapter files
+        corpus_ids_or_names : Iterable[str or int]
+            IDs or names of the texts to include.
+            Texts not found in the catalog are skipped.
+        path : str or Path, optional
+            If provided, the store is saved to this directory.
+            The default is None.
+
+        Returns
+        -------
+        TokenStore
+            Token store containing all tokens from the specified texts
+        """
+        codes = {column: {} for column in cls.STRING_COLUMNS}
+        arrays = {
+            "form": array("i"),
+            "lemma": array("i"),
+            "upos": array("i"),
+            "xpos": array("i"),
+            "lemma_id": array("i"),
+            "token_id": array("i"),
+            "sent_id": array("q"),
+            "verse_id": array("q"),
+            "chapter": array("i"),
+            "sentence_offsets": array("q", [0]),
+            "chapter_text": array("q"),
+            "chapter_offsets": array("q", [0]),
+            "text_id": array("q"),
+            "text_offsets": array("q", [0]),
+        }
+        chapter_names = []
+
+        for corpus_id_or_name in corpus_ids_or_names:
+            conllu_files = parser.get_corpus_files(corpus_id_or_name) or []
+            text_id = parser.get_corpus_id(corpus_id_or_name)
+            if text_id is None:
+                # not in the catalog (reported by `get_corpus_files()`)
+                continue
+            for conllu_file in conllu_files:
+                chapter = len(chapter_names)
+                chapter_names.append(Path(conllu_file).name)
+                for line in parser.parse_conllu_file(conllu_file, stream=True):
+                    for token in line:
+                        if not isinstance(token["id"], int):
+                            # multi-word tokens and empty nodes
+                            continue
+                        for column in cls.STRING_COLUMNS:
+                            value = token.get(column) or ""
+                            column_codes = codes[column]
+                            code = column_codes.get(value)
+                            if code is None:
+                                code = column_codes[value] = len(column_codes)
+                            arrays[column].append(code)
+                        misc = token.get("misc") or {}
+                        lemma_id = misc.get("LemmaId")
+                        arrays["lemma_id"].append(
+                            int(lemma_id) if lemma_id else MISSING
+                        )
+                        arrays["token_id"].append(token["id"])
+
+                    arrays["sent_id"].append(
+                        cls._metadata_int(line, parser.metadata_field_line_id)
+                    )
+                    arrays["verse_id"].append(
+                        cls._metadata_int(line, parser.metadata_field_verse_id)
+                    )
+                    arrays["chapter"].append(chapter)
+                    arrays["sentence_offsets"].append(len(arrays["form"]))
+
+                arrays["chapter_text"].append(text_id)
+                arrays["chapter_offsets"].append(len(arrays["sent_id"]))
+
+            arrays["text_id"].append(text_id)
+            arrays["text_offsets"].append(len(arrays["chapter_text"]))
+
+        store = cls(
+            {
+                name: np.frombuffer(values, dtype=values.typecode)
+                for name, values in arrays.items()
+            },
+            {
+                column: StringTable.from_strings(codes[column])
+                for column in cls.STRING_COLUMNS
+            },
+            StringTable.from_strings(chapter_names),
+        )
+        if path is not None:
+            store.save(path)
+        return store
+
+    @staticmethod
+    def _metadata_int(line, key: str) -> int:
+        if key is None:
+            return MISSING
+        try:
+            return int(line.metadata[key])
+        except (KeyError, TypeError, ValueError):
+            return MISSING
+
+    # ----------------------------------------------------------------------- #
+
+    def save(self, path: str or Path):
+        """Save the store to a directory"""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(path / f"{name}.npy", np.ascontiguousarray(self[name]))
+        for column, vocabulary in self.vocabularies.items():
+            vocabulary.save(path, column)
+        self.chapter_names.save(path, "chapter_name")
+        meta = {
+            "version": STORE_VERSION,
+            "tokens": self.n_tokens,
+            "sentences": self.n_sentences,
+            "chapters": self.n_chapters,
+            "texts": self.n_texts,
+        }
+        (path / "meta.json").write_text(json.dumps(meta, indent=2))
+
+    @classmethod
+    def open(cls, path: str or Path, mmap_mode: str = "r"):
+        """
+        Open a saved store
+
+        Parameters
+        ----------
+        path : str or Path
+            Directory containing the store
+        mmap_mode : str, optional
+            Memory-map mode passed to `numpy.load()`.
+            If None, arrays are read into memory.
+            The default is "r".
+
+        Returns
+        -------
+        TokenStore
+            Token store
+        """
+        path = Path(path)
+        meta = json.loads((path / "meta.json").read_text())
+        if meta["version"] != STORE_VERSION:
+            raise ValueError(
+                f"Unsupported token store version: {meta['version']}"
+            )
+        return cls(
+            {
+                name: np.load(path / f"{name}.npy", mmap_mode=mmap_mode)
+                for name in cls.ARRAYS
+            },
+            {
+                column: StringTable.load(path, column, mmap_mode)
+                for column in cls.STRING_COLUMNS
+            },
+            StringTable.load(path, "chapter_name", mmap_mode),
+        )
+
+    # ----------------------------------------------------------------------- #
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.arrays[name]
+
+    @property
+    def n_tokens(self) -> int:
+        return len(self["form"])
+
+    @property
+    def n_sentences(self) -> int:
+        return len(self["sent_id"])
+
+    @property
+    def n_chapters(self) -> int:
+        return len(self["chapter_text"])
+
+    @property
+    def n_texts(self) -> int:
+        return len(self["text_id"])
+
+    # ----------------------------------------------------------------------- #
+
+    def decode(self, column: str, codes: np.ndarray) -> List[str]:
+        """Decode codes of a string column"""
+        vocabulary = self.vocabularies[column]
+        return [vocabulary[code] for code in codes]
+
+    def encode(self, column: str, value: str) -> int:
+        """Code of a value in a string column (MISSING if absent)"""
+        return self.vocabularies[column].index(value)
+
+    def token_slice(self, sentence: int) -> slice:
+        """Token positions of a sentence (by position in the store)"""
+        offsets = self["sentence_offsets"]
+        return slice(int(offsets[sentence]), int(offsets[sentence + 1]))
+
+    def sentence_slice(self, chapter: int) -> slice:
+        """Sentence positions of a chapter (by position in the store)"""
+        offsets = self["chapter_offsets"]
+        return slice(int(offsets[chapter]), int(offsets[chapter + 1]))
+
+    def chapter_slice(self, text: int) -> slice:
+        """Chapter positions of a text (by position in the store)"""
+        offsets = self["text_offsets"]
+        return slice(int(offsets[text]), int(offsets[text + 1]))
+
+    def sentence_of_token(self, positions: np.ndarray) -> np.ndarray:
+        """Sentence positions of token positions"""
+        return (
+            np.searchsorted(self["sentence_offsets"], positions, side="right")
+            - 1
+        )
+
+    def get_tokens(self, positions: slice or np.ndarray) -> List[Dict]:
+        """Tokens (as dictionaries) at the specified positions"""
+        columns = {
+            column: self.decode(column, self[column][positions])
+            for column in self.STRING_COLUMNS
+        }
+        columns["id"] = self["token_id"][positions].tolist()
+        columns["lemma_id"] = self["lemma_id"][positions].tolist()
+        return [
+            dict(zip(columns, values)) for values in zip(*columns.values())
+        ]
+
+    def get_sentence(self, sentence: int) -> Dict:
+        """Sentence (by position in the store) with its tokens"""
+        chapter = int(self["chapter"][sentence])
+        return {
+            "sent_id": int(self["sent_id"][sentence]),
+            "verse_id": int(self["verse_id"][sentence]),
+            "text_id": int(self["chapter_text"][chapter]),
+            "chapter": self.chapter_names[chapter],
+            "tokens": self.get_tokens(self.token_slice(sentence)),
+        }
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(texts={self.n_texts}, "
+            f"chapters={self.n_chapters}, sentences={self.n_sentences}, "
+            f"tokens={self.n_tokens})"
+        )
+
+
+###############################################################################
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fixtures of the CoNLL-U Tests
+
+Tests run on a small synthetic corpus (`benchmarks/generate.py`), and
+compare every optimised path with the output of the baseline path
+(`conllu` engine, eager parsing, no cache, single process).
+"""
+
+import sys
+import shutil
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+TESTS_DIR = Path(__file__).resolve().parent
+BASE_DIR = TESTS_DIR.parent
+
+sys.path.insert(0, str(BASE_DIR))
+
+from dcs import DigitalCorpusSanskrit, DCS_CONLLU_CONFIG  # noqa: E402
+
+###############################################################################
+
+
+def _load_generator():
+    # `benchmarks/` is not a package, and `generate` is a common name
+    spec = importlib.util.spec_from_file_location(
+        "conllu_generate", BASE_DIR / "benchmarks" / "generate.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+generate_corpus = _load_generator().generate_corpus
+
+###############################################################################
+
+
+@pytest.fixture(scope="session")
+def corpus_info(tmp_path_factory):
+    """Synthetic corpus of three texts, shared by all tests (read-only)"""
+    data_dir = tmp_path_factory.mktemp("corpus")
+    summary = generate_corpus(
+        data_dir,
+        n_texts=3,
+        n_chapters=3,
+        n_sentences=30,
+        vocabulary_size=300,
+        seed=7,
+    )
+    summary["data_dir"] = data_dir
+    return summary
+
+
+@pytest.fixture(scope="session")
+def data_dir(corpus_info):
+    return corpus_info["data_dir"]
+
+
+@pytest.fixture(scope="session")
+def text_ids(corpus_info):
+    return corpus_info["texts"]
+
+
+@pytest.fixture
+def writable_data_dir(data_dir, tmp_path):
+    """Copy of the synthetic corpus, for tests modifying chapter files"""
+    path = tmp_path / "corpus"
+    shutil.copytree(data_dir, path)
+    return path
+
+
+@pytest.fixture
+def make_parser(data_dir):
+    """Factory of parsers (DCS configuration) of the synthetic corpus"""
+
+    def _make_parser(path=None, **kwargs):
+        config = {**DCS_CONLLU_CONFIG, **kwargs}
+        return DigitalCorpusSanskrit(path or data_dir, **config)
+
+    return _make_parser
+
+
+@pytest.fixture
+def parser(make_parser):
+    return make_parser()
+
+
+###############################################################################
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Synthetic Corpus Generator and the Benchmark Comparison
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+###############################################################################
+
+BENCHMARKS_DIR = Path(__file__).resolve().parents[1] / "benchmarks"
+
+
+def load_benchmark(name):
+    spec = importlib.util.spec_from_file_location(
+        f"conllu_{name}", BENCHMARKS_DIR / f"{name}.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+generate_corpus = load_benchmark("generate").generate_corpus
+bench_pipeline = load_benchmark("bench_pipeline")
+
+
+def read_tree(path):
+    return {
+        file.relative_to(path).as_posix(): file.read_bytes()
+        for file in sorted(path.rglob("*"))
+        if file.is_file()
+    }
+
+
+###############################################################################
+
+
+def test_generate_is_deterministic(tmp_path):
+    options = {"n_texts": 2, "n_chapters": 2, "n_sentences": 10, "seed": 3}
+    first = generate_corpus(tmp_path / "first", **options)
+    second = generate_corpus(tmp_path / "second", **options)
+    assert first == second
+    assert read_tree(tmp_path / "first") == read_tree(tmp_path / "second")
+
+    other = generate_corpus(tmp_path / "other", **{**options, "seed": 4})
+    assert read_tree(tmp_path / "first") != read_tree(tmp_path / "other")
+    assert other["files"] == first["files"]
+
+
+def test_summary_matches_parser(corpus_info, parser):
+    items = parser.get_all_corpus_files()
+    lines = [
+        line
+        for item in items
+        for line in parser.parse_conllu_file(item["path"])
+    ]
+    assert corpus_info["files"] == len(items)
+    assert corpus_info["sentences"] == len(lines)
+    assert corpus_info["tokens"] == sum(len(line) for line in lines)
+    assert sorted({item["text_id"] for item in items}) == sorted(
+        corpus_info["texts"]
+    )
+    assert [int(line.metadata["sent_id"]) for line in lines] == list(
+        range(1, len(lines) + 1)
+    )
+
+
+@pytest.mark.parametrize(
+    "current, passed",
+    [(100, True), (80, True), (74, False), (300, True)],
+)
+def test_compare_with_baseline(current, passed):
+    baseline = {"results": {"parse": {"tokens_per_second": 100}}}
+    results = {
+        "parse": {"tokens_per_second": current},
+        "new_stage": {"tokens_per_second": 1},
+    }
+    assert bench_pipeline.compare(results, baseline, 0.25) is passed
+
+
+###############################################################################
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Persistent Cache of Parsed Files
+"""
+
+import os
+
+import pytest
+
+from cache import FileCache
+
+###############################################################################
+
+
+def serialize(conllu_lines):
+    return [line.serialize() for line in conllu_lines]
+
+
+def first_file(parser):
+    return parser.get_all_corpus_files()[0]["path"]
+
+
+def touch(path):
+    """Move the modification time of a file forward (by one second)"""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def change_tag(conllu_file):
+    """Change the UPOS of a token, keeping the size of the file"""
+    content = conllu_file.read_text(encoding="utf-8")
+    assert "\tNOUN\tNC\t" in content
+    conllu_file.write_text(
+        content.replace("\tNOUN\tNC\t", "\tVERB\tNC\t", 1),
+        encoding="utf-8",
+    )
+    touch(conllu_file)
+
+
+@pytest.fixture
+def cached_parser(make_parser, writable_data_dir, tmp_path):
+    return make_parser(writable_data_dir, cache_dir=tmp_path / "cache")
+
+
+###############################################################################
+
+
+def test_cached_output_matches_parser(parser, cached_parser):
+    for item in parser.get_all_corpus_files():
+        expected_lines = serialize(parser.parse_conllu_file(item["path"]))
+        expected_verses = parser.read_conllu_file(item["path"])
+        cached_file = cached_parser.data_dir / item["path"].relative_to(
+            parser.data_dir
+        )
+        for _ in range(2):
+            assert (
+                serialize(cached_parser.parse_conllu_file(cached_file))
+                == expected_lines
+            )
+            assert cached_parser.read_conllu_file(cached_file) == (
+                expected_verses
+            )
+    assert len(list(cached_parser.cache.cache_dir.iterdir())) == 2 * len(
+        parser.get_all_corpus_files()
+    )
+
+
+def test_touched_file_is_not_reparsed(cached_parser, monkeypatch):
+    conllu_file = first_file(cached_parser)
+    expected = serialize(cached_parser.parse_conllu_file(conllu_file))
+    touch(conllu_file)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("file was parsed again")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(cached_parser, "parse_conllu", fail)
+        assert serialize(cached_parser.parse_conllu_file(conllu_file)) == (
+            expected
+        )
+
+
+def test_changed_file_is_reparsed(cached_parser, make_parser):
+    conllu_file = first_file(cached_parser)
+    cached_parser.parse_conllu_file(conllu_file)
+    cached_parser.read_conllu_file(conllu_file)
+    change_tag(conllu_file)
+
+    uncached_parser = make_parser(cached_parser.data_dir)
+    assert serialize(cached_parser.parse_conllu_file(conllu_file)) == (
+        serialize(uncached_parser.parse_conllu_file(conllu_file))
+    )
+    assert cached_parser.read_conllu_file(conllu_file) == (
+        uncached_parser.read_conllu_file(conllu_file)
+    )
+
+
+def test_file_changed_while_parsing(cached_parser, make_parser, monkeypatch):
+    conllu_file = first_file(cached_parser)
+    parse_conllu = cached_parser.parse_conllu
+
+    def parse_and_change(*args, **kwargs):
+        # parsed content is the old one, the file on disk is the new one
+        conllu_lines = parse_conllu(*args, **kwargs)
+        change_tag(conllu_file)
+        return conllu_lines
+
+    with monkeypatch.context() as patch:
+        patch.setattr(cached_parser, "parse_conllu", parse_and_change)
+        cached_parser.parse_conllu_file(conllu_file)
+
+    uncached_parser = make_parser(cached_parser.data_dir)
+    assert serialize(cached_parser.parse_conllu_file(conllu_file)) == (
+        serialize(uncached_parser.parse_conllu_file(conllu_file))
+    )
+
+
+def test_entries_depend_on_configuration(tmp_path):
+    source = tmp_path / "source.txt"
+    source.write_text("content")
+    first = FileCache(tmp_path / "cache", config={"scheme": "iast"})
+    second = FileCache(tmp_path / "cache", config={"scheme": "devanagari"})
+    first.set(source, "kind", 1)
+    assert first.get(source, "kind") == 1
+    assert second.get(source, "kind") is None
+    assert first.get(source, "other") is None
+
+
+###############################################################################
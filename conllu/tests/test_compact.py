@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Compact Verse, Line and Token Objects
+"""
+
+import pickle
+
+import pytest
+
+from compact import Verse, Line, Token, compact_value
+from engine import ENGINE_CONLLU, ENGINE_DCS
+
+###############################################################################
+
+
+@pytest.mark.parametrize("engine", [ENGINE_CONLLU, ENGINE_DCS])
+def test_compact_matches_dictionaries(make_parser, parser, engine):
+    compact_parser = make_parser(engine=engine)
+    for item in parser.get_all_corpus_files():
+        expected = parser.read_conllu_file(item["path"])
+        verses = compact_parser.read_conllu_file(item["path"], compact=True)
+        assert all(isinstance(verse, Verse) for verse in verses)
+        assert [verse.to_dict() for verse in verses] == expected
+        assert verses == expected
+
+        content = item["path"].read_text(encoding="utf-8")
+        assert list(
+            compact_parser.read_conllu_data(content, stream=True, compact=True)
+        ) == expected
+
+
+def test_access(parser):
+    conllu_file = parser.get_all_corpus_files()[0]["path"]
+    line = parser.read_conllu_file(conllu_file, compact=True)[0][0]
+    expected = parser.read_conllu_file(conllu_file)[0][0]
+
+    assert isinstance(line, Line)
+    assert line.text == line["text"] == expected["text"]
+    assert line.get("missing", "default") == "default"
+    with pytest.raises(KeyError):
+        line["missing"]
+
+    token = line.tokens[0]
+    assert isinstance(token, Token)
+    for name, value in expected["tokens"][0].items():
+        assert token[name] == token.get(name) == value
+    with pytest.raises(KeyError):
+        token["deprel"]
+    assert pickle.loads(pickle.dumps(line)) == expected
+
+
+def test_shared_values(parser):
+    conllu_file = parser.get_all_corpus_files()[0]["path"]
+    tokens = [
+        token
+        for verse in parser.read_conllu_file(conllu_file, compact=True)
+        for line in verse
+        for token in line.tokens
+    ]
+    feats = {}
+    for token in tokens:
+        if token.feats:
+            key = tuple(token.feats.items())
+            assert feats.setdefault(key, token.feats) is token.feats
+
+    shared = {}
+    first = compact_value({"Case": "Nom"}, shared)
+    assert compact_value({"Case": "Nom"}, shared) is first
+    assert compact_value({"Case": "Nom"}) is not first
+    assert compact_value(None) is None
+
+
+###############################################################################
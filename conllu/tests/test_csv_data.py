@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Lazily Loaded CSV Data
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dcs import CSVData
+
+###############################################################################
+
+
+@pytest.fixture
+def dictionary_path(data_dir):
+    return data_dir / "lookup" / "dictionary.csv"
+
+
+@pytest.fixture
+def dictionary(dictionary_path):
+    return CSVData(dictionary_path, separator="\t", index_column="id")
+
+
+@pytest.fixture
+def frame(dictionary_path):
+    """Data as read by the baseline (eager `pandas` lookups)"""
+    return pd.read_csv(
+        dictionary_path, sep="\t", keep_default_na=False
+    ).set_index("id")
+
+
+###############################################################################
+
+
+def test_lookups_match_pandas(dictionary, frame):
+    ids = frame.index.tolist()
+    for id in ids[::7]:
+        assert dictionary.get(id).equals(frame.loc[id])
+        assert dictionary.get_record(id) == frame.loc[id].to_dict()
+    assert dictionary.get(-1) is None
+    assert dictionary.get_record(-1) is None
+
+    wanted = ids[:5] + [-1] + ids[:2]
+    rows = dictionary.get_many(wanted)
+    assert rows.index.tolist() == wanted
+    for id, (_, row) in zip(wanted, rows.iterrows()):
+        if id == -1:
+            assert row.isna().all()
+        else:
+            assert row.tolist() == frame.loc[id].tolist()
+
+
+def test_search_matches_pandas(dictionary, frame):
+    for pattern in ["k", "kā", "^[jk]", "noun", "x-missing"]:
+        expected = frame[frame["lemma"].str.match(pattern)]
+        assert dictionary.search(lemma=pattern).equals(expected)
+    expected = frame[
+        frame["lemma"].str.match("[a-k]") & frame["pos"].str.match("NOUN")
+    ]
+    assert dictionary.search(lemma="[a-k]", pos="NOUN").equals(expected)
+
+
+@pytest.mark.parametrize("content", ["", "id\tlemma\tpos\n"])
+def test_empty_file(tmp_path, content):
+    path = tmp_path / "empty.csv"
+    path.write_text(content, encoding="utf-8")
+    data = CSVData(path, separator="\t", index_column="id")
+
+    assert data.get(1) is None
+    assert data.get_record(1) is None
+    assert data.get_many([]).empty
+    rows = data.get_many([1, 2])
+    assert rows.index.tolist() == [1, 2]
+    assert rows.index.name == "id"
+    assert np.all(rows.isna())
+    if content:
+        assert rows.columns.tolist() == ["lemma", "pos"]
+        assert data.search(lemma="a").empty
+
+
+###############################################################################
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the DCS Parsing Engine
+"""
+
+import conllu
+import pytest
+
+from dcs import DCS_CONLLU_CONFIG
+from engine import DCSEngine, ENGINE_DCS
+
+###############################################################################
+
+FIELDS = DCS_CONLLU_CONFIG["input_fields"]
+
+EDGE_CASES = "\n".join([
+    "# newdoc",
+    "# newpar id = p1",
+    "# sent_id = 1",
+    "# text = rāmaḥ vanaṃ gacchati",
+    "# empty =",
+    "# = no key",
+    "1-2\trāmo vanaṃ\t_\t_\t_\t_\t_\t_\t_\t_",
+    "1\trāmaḥ\trāma\tNOUN\tNC\tCase=Nom|Number=Sing\t3\tnsubj\t_\t"
+    "LemmaId=1|Unsandhied=rāmaḥ",
+    "2\tvanam\tvana\tNOUN\tNC\t_\t3\tobj\t_\tSpaceAfter=No|Flag",
+    "2.1\tgacchati\tgam\tVERB\tV\t_\t_\t_\t3:ref\t_",
+    "3\tgacchati\tgam\tVERB\tV\tTense=Pres\t0\troot\t_\tLemmaId=2",
+    "",
+    "  ",
+    "",
+    "# sent_id = 2",
+    "1\titi\titi\tPART\tP\t_\t_\t_\t_\t",
+    "",
+])
+
+###############################################################################
+
+
+def retained(token, fields):
+    """Values of the fields materialised by the DCS engine"""
+    return {
+        field: (
+            dict(token[field])
+            if isinstance(token.get(field), dict)
+            else token.get(field)
+        )
+        for field in fields
+    }
+
+
+def assert_same_lines(lines, expected_lines, fields):
+    assert len(lines) == len(expected_lines)
+    for line, expected_line in zip(lines, expected_lines):
+        assert dict(line.metadata) == dict(expected_line.metadata)
+        assert [retained(token, fields) for token in line] == [
+            retained(token, fields) for token in expected_line
+        ]
+
+
+@pytest.fixture
+def dcs_parser(make_parser):
+    return make_parser(engine=ENGINE_DCS)
+
+
+###############################################################################
+
+
+@pytest.mark.parametrize(
+    "relevant_fields",
+    [["form", "lemma", "feats", "misc"], FIELDS],
+)
+def test_edge_cases_match_conllu(relevant_fields):
+    engine = DCSEngine(FIELDS, relevant_fields)
+    expected = conllu.parse(EDGE_CASES, fields=FIELDS)
+    fields = ["id"] + relevant_fields
+    assert_same_lines(engine.parse(EDGE_CASES), expected, fields)
+    assert_same_lines(
+        list(engine.parse_incr(iter(EDGE_CASES.splitlines(True)))),
+        expected,
+        fields,
+    )
+
+
+def test_lazy_columns():
+    engine = DCSEngine(FIELDS, ["feats", "misc"])
+    tokens = engine.parse(EDGE_CASES)[0]
+    assert tokens[0]["feats"] is None
+    assert bool(tokens[1]["feats"])
+    assert tokens[1]["feats"]["Case"] == "Nom"
+    assert tokens[2]["misc"] == {"SpaceAfter": "No", "Flag": ""}
+
+
+def test_corpus_matches_conllu_engine(parser, dcs_parser):
+    fields = ["id"] + list(parser.relevant_fields)
+    for item in parser.get_all_corpus_files():
+        assert_same_lines(
+            dcs_parser.parse_conllu_file(item["path"]),
+            parser.parse_conllu_file(item["path"]),
+            fields,
+        )
+        assert_same_lines(
+            list(dcs_parser.parse_conllu_file(item["path"], stream=True)),
+            parser.parse_conllu_file(item["path"]),
+            fields,
+        )
+        assert dcs_parser.read_conllu_file(item["path"]) == (
+            parser.read_conllu_file(item["path"])
+        )
+
+
+###############################################################################
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Parquet Export
+"""
+
+import pytest
+
+from conllu.parser import parse_dict_value
+
+from export import export_parquet, format_dict, TABLE_TOKENS, TABLE_SENTENCES
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+###############################################################################
+
+
+def read_table(output_dir, table):
+    return pq.read_table(output_dir / table, partitioning="hive").to_pylist()
+
+
+###############################################################################
+
+
+def test_format_dict_round_trip():
+    value = {"Case": "Nom", "Unknown": None, "Flag": ""}
+    formatted = format_dict(value)
+    assert formatted == "Case=Nom|Unknown=_|Flag"
+    assert parse_dict_value(formatted) == value
+    assert format_dict({}) is None
+    assert format_dict(None) is None
+
+
+def test_export_matches_parser(parser, text_ids, tmp_path):
+    text_id = text_ids[0]
+    counts = export_parquet(parser, tmp_path, [text_id])
+
+    lines = [
+        line
+        for conllu_file in parser.get_corpus_files(text_id)
+        for line in parser.parse_conllu_file(conllu_file)
+    ]
+    tokens = [token for line in lines for token in line]
+    assert counts == {
+        TABLE_TOKENS: len(tokens),
+        TABLE_SENTENCES: len(lines),
+    }
+
+    rows = sorted(
+        read_table(tmp_path, TABLE_TOKENS),
+        key=lambda row: (row["sent_id"], row["position"]),
+    )
+    for row, token in zip(rows, tokens):
+        assert row["form"] == token["form"]
+        assert row["lemma"] == token["lemma"]
+        assert row["upos"] == token["upos"]
+        assert parse_dict_value(row["feats"] or "_") == token["feats"]
+        assert parse_dict_value(row["misc"] or "_") == token["misc"]
+        assert row["lemma_id"] == int(token["misc"]["LemmaId"])
+
+    sentences = sorted(
+        read_table(tmp_path, TABLE_SENTENCES), key=lambda row: row["sent_id"]
+    )
+    assert [row["sent_id"] for row in sentences] == [
+        int(line.metadata["sent_id"]) for line in lines
+    ]
+    assert [row["text"] for row in sentences] == [
+        line.metadata["text"] for line in lines
+    ]
+
+
+def test_reexport_removes_stale_partitions(
+    make_parser, writable_data_dir, text_ids, tmp_path
+):
+    parser = make_parser(writable_data_dir)
+    text_id = text_ids[0]
+    output_dir = tmp_path / "export"
+    export_parquet(parser, output_dir, [text_id])
+
+    text_dir = output_dir / TABLE_TOKENS / f"text_id={text_id}"
+    n_chapters = len(parser.get_corpus_files(text_id))
+    assert len(list(text_dir.iterdir())) == n_chapters
+
+    parser.get_corpus_files(text_id)[-1].unlink()
+    parser = make_parser(writable_data_dir)
+    counts = export_parquet(parser, output_dir, [text_id])
+
+    assert sorted(path.name for path in text_dir.iterdir()) == [
+        f"chapter={chapter}" for chapter in range(n_chapters - 1)
+    ]
+    # no staging directories are left behind
+    assert [
+        path.name for path in (output_dir / TABLE_TOKENS).iterdir()
+    ] == [f"text_id={text_id}"]
+    assert len(read_table(output_dir, TABLE_TOKENS)) == counts[TABLE_TOKENS]
+
+
+###############################################################################
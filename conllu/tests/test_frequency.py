@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Frequency and Collocation Statistics
+"""
+
+from collections import Counter
+
+import pytest
+
+import frequency
+from frequency import CorpusStatistics
+
+###############################################################################
+
+
+def count_text(parser, text_id, window):
+    """Statistics of a text, counted directly from the parsed lines"""
+    sentences = tokens = 0
+    forms, lemmas, collocations = Counter(), Counter(), Counter()
+    for conllu_file in parser.get_corpus_files(text_id):
+        for line in parser.parse_conllu_file(conllu_file):
+            sentences += 1
+            words = [token for token in line if isinstance(token["id"], int)]
+            tokens += len(words)
+            forms.update(token["form"] for token in words)
+            line_lemmas = [
+                token["lemma"] for token in words if token["lemma"] is not None
+            ]
+            lemmas.update(line_lemmas)
+            for i, first in enumerate(line_lemmas):
+                for j in range(i + 1, min(i + 1 + window, len(line_lemmas))):
+                    collocations[tuple(sorted([first, line_lemmas[j]]))] += 1
+    return sentences, tokens, forms, lemmas, collocations
+
+
+def as_tuple(statistics):
+    return (
+        statistics.sentences,
+        statistics.tokens,
+        statistics.forms,
+        statistics.lemmas,
+        statistics.collocations,
+    )
+
+
+###############################################################################
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_statistics_match_parser(parser, text_ids, tmp_path, workers):
+    corpus_statistics = CorpusStatistics(
+        parser, cache_dir=tmp_path / "cache", window=3
+    )
+    expected = {
+        text_id: count_text(parser, text_id, window=3) for text_id in text_ids
+    }
+    for _ in range(2):
+        texts = corpus_statistics.get_text_statistics(workers=workers)
+        assert {
+            text_id: as_tuple(statistics)
+            for text_id, statistics in texts.items()
+        } == expected
+
+    merged = corpus_statistics.get_statistics(text_ids[1:])
+    assert merged.tokens == sum(expected[i][1] for i in text_ids[1:])
+    assert merged.lemmas == sum(
+        (expected[i][3] for i in text_ids[1:]), Counter()
+    )
+
+
+def test_file_changed_while_counting(
+    make_parser, writable_data_dir, tmp_path, monkeypatch
+):
+    parser = make_parser(writable_data_dir)
+    text_id = parser.get_all_corpus_files()[0]["text_id"]
+    conllu_file = parser.get_corpus_files(text_id)[0]
+    compute_file_statistics = frequency.compute_file_statistics
+
+    def compute_and_change(parser, path, *args, **kwargs):
+        statistics = compute_file_statistics(parser, path, *args, **kwargs)
+        if path == conllu_file:
+            content = conllu_file.read_text(encoding="utf-8")
+            conllu_file.write_text(content + content, encoding="utf-8")
+        return statistics
+
+    corpus_statistics = CorpusStatistics(parser, cache_dir=tmp_path / "cache")
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            frequency, "compute_file_statistics", compute_and_change
+        )
+        corpus_statistics.get_text_statistics([text_id])
+
+    statistics = corpus_statistics.get_text_statistics([text_id])[text_id]
+    assert as_tuple(statistics) == count_text(parser, text_id, window=2)
+
+
+###############################################################################
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Lazy Imports and the Lazy Catalog of Texts
+"""
+
+import sys
+import subprocess
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import dcs
+
+###############################################################################
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+
+HEAVY_MODULES = ["pandas", "numpy", "natsort", "indic_transliteration"]
+
+###############################################################################
+
+
+@pytest.mark.parametrize("module", ["utils", "dcs"])
+def test_no_eager_heavy_imports(module):
+    code = (
+        f"import sys, {module}; "
+        f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == []
+
+
+def test_catalog_matches_texts_csv(parser):
+    texts = pd.read_csv(dcs.TEXTS_PATH)
+    assert dcs.get_texts_catalog() == dict(
+        zip(texts["id"].tolist(), texts["textname"].tolist())
+    )
+    assert dcs.TEXTS.equals(texts)
+
+    text_id, textname = texts.iloc[0]["id"], texts.iloc[0]["textname"]
+    expected = {"id": int(text_id), "textname": textname}
+    assert parser.get_corpus_record(int(text_id)) == expected
+    assert parser.get_corpus_record(str(text_id)) == expected
+    assert parser.get_corpus_record(textname) == expected
+    assert parser.get_corpus_record("missing text") is None
+    assert parser.get_corpus_id(textname) == int(text_id)
+
+
+###############################################################################
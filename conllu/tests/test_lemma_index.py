@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Lemma Index
+"""
+
+from collections import defaultdict
+
+import pytest
+
+from lemma_index import LemmaIndex
+
+###############################################################################
+
+
+def scan_postings(parser, text_ids):
+    """(text_id, chapter, sent_id, position) of every LemmaId, by parsing"""
+    postings = defaultdict(list)
+    lemma_ids = defaultdict(set)
+    for text_id in text_ids:
+        for chapter, conllu_file in enumerate(
+            parser.get_corpus_files(text_id)
+        ):
+            for line in parser.parse_conllu_file(conllu_file):
+                sent_id = int(line.metadata["sent_id"])
+                for token in line:
+                    lemma_id = int(token["misc"]["LemmaId"])
+                    postings[lemma_id].append(
+                        (text_id, chapter, sent_id, token["id"])
+                    )
+                    lemma_ids[token["lemma"]].add(lemma_id)
+    return postings, lemma_ids
+
+
+@pytest.fixture
+def index(parser, text_ids, tmp_path):
+    index = LemmaIndex(tmp_path / "lemma-index")
+    for text_id in text_ids:
+        index.add_text(parser, text_id)
+    return index
+
+
+###############################################################################
+
+
+def test_lookup_matches_parser(index, parser, text_ids):
+    postings, lemma_ids = scan_postings(parser, text_ids)
+    for lemma_id, expected in postings.items():
+        assert index.lookup(lemma_id).tolist() == sorted(expected)
+
+    for lemma, expected in list(lemma_ids.items())[:50]:
+        assert index.get_lemma_ids(lemma) == sorted(expected)
+        assert index.count(lemma) == sum(
+            len(postings[lemma_id]) for lemma_id in expected
+        )
+
+
+def test_intersection(index, parser, text_ids):
+    postings, _ = scan_postings(parser, text_ids)
+    first, second = sorted(postings, key=lambda k: -len(postings[k]))[:2]
+    sentences = {posting[2] for posting in postings[first]} & {
+        posting[2] for posting in postings[second]
+    }
+    expected = sorted(
+        posting
+        for posting in postings[first] + postings[second]
+        if posting[2] in sentences
+    )
+    assert index.intersection(first, second).tolist() == expected
+    assert index.intersection().tolist() == []
+
+
+def test_reopen_and_concordance(index, text_ids):
+    reopened = LemmaIndex(index.index_dir)
+    assert reopened.text_ids == text_ids
+    postings = reopened.lookup(1)
+    assert postings.tolist() == index.lookup(1).tolist()
+    text_id, chapter, sent_id, position = postings[0].tolist()
+    assert next(reopened.concordance(postings[:1])) == (
+        text_id,
+        reopened.get_chapter_name(text_id, chapter),
+        sent_id,
+        position,
+    )
+
+
+def test_reindex_keeps_mapped_arrays(index, parser, text_ids):
+    text_id = text_ids[0]
+    old_dir = index.get_text_dir(text_id)
+    mapped = index.get_text_arrays(text_id)["sent_id"]
+    expected = mapped.tolist()
+
+    index.add_text(parser, text_id)
+    new_dir = index.get_text_dir(text_id)
+    assert new_dir != old_dir
+    assert not old_dir.exists()
+    # arrays mapped before re-indexing are still readable
+    assert mapped.tolist() == expected
+    # cached arrays are reloaded from the new directory
+    filename = index.get_text_arrays(text_id)["sent_id"].filename
+    assert filename == new_dir / "sent_id.npy"
+    assert LemmaIndex(index.index_dir).get_text_dir(text_id) == new_dir
+
+
+def test_remove_text(index, text_ids):
+    text_id = text_ids[-1]
+    text_dir = index.get_text_dir(text_id)
+    index.remove_text(text_id)
+    assert not text_dir.exists()
+    assert text_id not in LemmaIndex(index.index_dir).text_ids
+    assert all(
+        posting[0] != text_id for posting in index.lookup(1).tolist()
+    )
+
+
+###############################################################################
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Manifest of CoNLL-U Files and the Incremental Sync
+"""
+
+import os
+
+import pytest
+
+from manifest import Manifest, ADDED, CHANGED, REMOVED
+
+###############################################################################
+
+
+def serialize(conllu_lines):
+    return [line.serialize() for line in conllu_lines]
+
+
+def edit_chapter(conllu_file):
+    """Change the content of a chapter file, keeping its size"""
+    content = conllu_file.read_text(encoding="utf-8")
+    conllu_file.write_text(
+        content.replace("\tNOUN\tNC\t", "\tVERB\tNC\t", 1), encoding="utf-8"
+    )
+    stat = os.stat(conllu_file)
+    os.utime(conllu_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def sync(parser, manifest_path, **kwargs):
+    calls = []
+    changes = parser.sync(
+        manifest_path,
+        callback=lambda path, status, data: calls.append(
+            (path, status, None if data is None else serialize(data))
+        ),
+        **kwargs,
+    )
+    return changes, calls
+
+
+###############################################################################
+
+
+def test_scan(writable_data_dir, tmp_path):
+    files_dir = writable_data_dir / "files"
+    paths = sorted(files_dir.glob("*/*.conllu"))
+    manifest = Manifest(tmp_path / "manifest.json", files_dir)
+
+    changes = manifest.scan(paths)
+    assert changes[ADDED] == paths
+    assert changes[CHANGED] == changes[REMOVED] == []
+    manifest.update(changes["entries"])
+
+    # only touched: hashed again, but not reported
+    stat = os.stat(paths[0])
+    os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    edit_chapter(paths[1])
+    paths[2].unlink()
+
+    loaded = Manifest(tmp_path / "manifest.json", files_dir)
+    changes = loaded.scan(paths[:2] + paths[3:])
+    assert changes[ADDED] == []
+    assert changes[CHANGED] == [paths[1]]
+    assert changes[REMOVED] == [paths[2]]
+    assert loaded.files == manifest.files
+    assert (
+        changes["entries"][loaded.get_key(paths[0])]["mtime_ns"]
+        == os.stat(paths[0]).st_mtime_ns
+    )
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_sync(make_parser, writable_data_dir, tmp_path, workers):
+    parser = make_parser(writable_data_dir)
+    manifest_path = tmp_path / "manifest.json"
+    paths = sorted((writable_data_dir / "files").glob("*/*.conllu"))
+
+    changes, calls = sync(parser, manifest_path, workers=workers)
+    assert changes[ADDED] == paths
+    assert changes["texts"] == sorted({path.parent.name for path in paths})
+    assert calls == [
+        (path, ADDED, serialize(parser.parse_conllu_file(path)))
+        for path in paths
+    ]
+
+    changes, calls = sync(parser, manifest_path, workers=workers)
+    assert changes == {ADDED: [], CHANGED: [], REMOVED: [], "texts": []}
+    assert calls == []
+
+    edit_chapter(paths[0])
+    paths[-1].unlink()
+    changes, calls = sync(parser, manifest_path, workers=workers)
+    assert changes[CHANGED] == [paths[0]]
+    assert changes[REMOVED] == [paths[-1]]
+    assert changes["texts"] == sorted(
+        {paths[0].parent.name, paths[-1].parent.name}
+    )
+    assert calls == [
+        (paths[0], CHANGED, serialize(parser.parse_conllu_file(paths[0]))),
+        (paths[-1], REMOVED, None),
+    ]
+
+
+def test_sync_verses(make_parser, writable_data_dir, tmp_path):
+    parser = make_parser(writable_data_dir)
+    verses = {}
+    parser.sync(
+        tmp_path / "manifest.json",
+        callback=lambda path, status, data: verses.update({path: data}),
+        group_verse=True,
+    )
+    assert verses == {
+        path: parser.read_conllu_file(path)
+        for path in sorted((writable_data_dir / "files").glob("*/*.conllu"))
+    }
+
+
+def test_interrupted_sync_is_resumed(make_parser, writable_data_dir, tmp_path):
+    parser = make_parser(writable_data_dir)
+    manifest_path = tmp_path / "manifest.json"
+    parser.sync(manifest_path)
+    path = sorted((writable_data_dir / "files").glob("*/*.conllu"))[0]
+    edit_chapter(path)
+
+    def fail(*args):
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        parser.sync(manifest_path, callback=fail)
+    changes, calls = sync(parser, manifest_path)
+    assert changes[CHANGED] == [path]
+    assert [call[:2] for call in calls] == [(path, CHANGED)]
+
+
+###############################################################################
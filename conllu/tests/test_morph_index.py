@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Morphological Bitmap Index
+"""
+
+import pytest
+
+from morph_index import MorphIndex, Q
+
+###############################################################################
+
+
+def scan_tokens(parser, text_ids):
+    """(posting, token) of every token, by parsing"""
+    for text_id in text_ids:
+        for chapter, conllu_file in enumerate(
+            parser.get_corpus_files(text_id)
+        ):
+            for line in parser.parse_conllu_file(conllu_file):
+                sent_id = int(line.metadata["sent_id"])
+                for token in line:
+                    yield (text_id, chapter, sent_id, token["id"]), token
+
+
+def matching(parser, text_ids, predicate):
+    return [
+        posting
+        for posting, token in scan_tokens(parser, text_ids)
+        if predicate(token)
+    ]
+
+
+def feature(token, name):
+    return (token["feats"] or {}).get(name)
+
+
+@pytest.fixture
+def index(parser, text_ids, tmp_path):
+    index = MorphIndex(tmp_path / "morph-index")
+    for text_id in text_ids:
+        index.add_text(parser, text_id)
+    return index
+
+
+###############################################################################
+
+QUERIES = [
+    (
+        Q(upos="NOUN", Case="Gen", Number="Plur"),
+        lambda token: (
+            token["upos"] == "NOUN"
+            and feature(token, "Case") == "Gen"
+            and feature(token, "Number") == "Plur"
+        ),
+    ),
+    (
+        Q(upos=["NOUN", "ADJ"]) & ~Q(Number="Sing"),
+        lambda token: (
+            token["upos"] in ["NOUN", "ADJ"]
+            and feature(token, "Number") != "Sing"
+        ),
+    ),
+    (
+        Q(Tense="Past") | Q(xpos="CC"),
+        lambda token: (
+            feature(token, "Tense") == "Past" or token["xpos"] == "CC"
+        ),
+    ),
+    (Q(upos="NOUN", Missing="Value"), lambda token: False),
+    (Q(), lambda token: True),
+    (Q(upos=[]), lambda token: False),
+    (Q(upos="NOUN") & Q(Case=[]), lambda token: False),
+    (~Q(upos=[]), lambda token: True),
+]
+
+
+@pytest.mark.parametrize("query, predicate", QUERIES)
+def test_query_matches_parser(index, parser, text_ids, query, predicate):
+    expected = matching(parser, text_ids, predicate)
+    assert index.locate(query).tolist() == expected
+    assert index.count(query) == len(expected)
+
+
+def test_concordance(index, parser, text_ids):
+    query = Q(upos="VERB")
+    postings = index.locate(query, text_ids=text_ids[:1])
+    assert [
+        (text_id, sent_id, position)
+        for text_id, _, sent_id, position in index.concordance(postings)
+    ] == [
+        (text_id, sent_id, position)
+        for text_id, _, sent_id, position in matching(
+            parser, text_ids[:1], lambda token: token["upos"] == "VERB"
+        )
+    ]
+
+
+def test_reindex_and_remove(index, parser, text_ids):
+    query = Q(upos="NOUN")
+    expected = index.locate(query).tolist()
+    text_id = text_ids[0]
+    old_dir = index.get_text_dir(text_id)
+    mapped = index.get_text_arrays(text_id)["bitmaps"]
+    before = mapped.tolist()
+
+    index.add_text(parser, text_id)
+    assert not old_dir.exists()
+    assert mapped.tolist() == before
+    assert MorphIndex(index.index_dir).locate(query).tolist() == expected
+
+    index.remove_text(text_id)
+    assert text_id not in MorphIndex(index.index_dir).text_ids
+    assert index.locate(query).tolist() == [
+        posting for posting in expected if posting[0] != text_id
+    ]
+
+
+###############################################################################
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Process Pool Parallel Mode
+"""
+
+import math
+
+import pytest
+
+from utils import imap_ordered
+
+###############################################################################
+
+
+def serialize(conllu_lines):
+    return [line.serialize() for line in conllu_lines]
+
+
+###############################################################################
+
+
+@pytest.mark.parametrize("max_pending", [1, 3, None])
+def test_imap_ordered(max_pending):
+    items = list(range(25))
+    assert list(
+        imap_ordered(math.factorial, items, workers=2, max_pending=max_pending)
+    ) == [math.factorial(item) for item in items]
+    assert list(imap_ordered(math.factorial, [], workers=2)) == []
+
+
+def test_get_corpus_matches_sequential(parser, text_ids):
+    for text_id in text_ids:
+        assert serialize(parser.get_corpus(text_id, workers=2)) == serialize(
+            parser.get_corpus(text_id)
+        )
+        assert list(
+            parser.get_corpus(text_id, group_verse=True, workers=3)
+        ) == list(parser.get_corpus(text_id, group_verse=True))
+
+
+def test_parse_files_in_order(parser):
+    conllu_files = [
+        item["path"] for item in parser.get_all_corpus_files()
+    ][::-1]
+    chapters = list(
+        parser.parse_conllu_files(iter(conllu_files), workers=2, max_pending=1)
+    )
+    assert [serialize(chapter) for chapter in chapters] == [
+        serialize(parser.parse_conllu_file(conllu_file))
+        for conllu_file in conllu_files
+    ]
+
+
+###############################################################################
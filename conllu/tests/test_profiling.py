@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Profiling Hooks
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from profiling import Profiler, STAGES, STAGE_BUILD
+
+###############################################################################
+
+
+def read_texts(parser, text_ids, mode):
+    """Verses of every text, read sequentially, on threads or on a pool"""
+    if mode == "threads":
+        with ThreadPoolExecutor(len(text_ids)) as executor:
+            return list(
+                executor.map(
+                    lambda text_id: list(
+                        parser.get_corpus(
+                            text_id, group_verse=True, stream=True
+                        )
+                    ),
+                    text_ids,
+                )
+            )
+    workers = 2 if mode == "workers" else None
+    return [
+        list(parser.get_corpus(text_id, group_verse=True, workers=workers))
+        for text_id in text_ids
+    ]
+
+
+def count_text(parser, text_id):
+    files = parser.get_corpus_files(text_id)
+    lines = [
+        line
+        for conllu_file in files
+        for line in parser.parse_conllu_file(conllu_file)
+    ]
+    return {
+        "files": len(files),
+        "sentences": len(lines),
+        "tokens": sum(len(line) for line in lines),
+    }
+
+
+###############################################################################
+
+
+@pytest.mark.parametrize("mode", ["sequential", "threads", "workers"])
+def test_statistics_per_text(make_parser, parser, text_ids, mode):
+    profiler = Profiler()
+    profiled_parser = make_parser(profiler=profiler)
+    assert read_texts(profiled_parser, text_ids, mode) == read_texts(
+        parser, text_ids, "sequential"
+    )
+
+    assert len(profiler.texts) == len(text_ids)
+    for text_id in text_ids:
+        text = profiled_parser.get_text_of_file(
+            profiled_parser.get_corpus_files(text_id)[0]
+        )
+        stats = profiler.texts[text]
+        for counter, value in count_text(parser, text_id).items():
+            assert stats.counts[counter] == value
+        assert stats.time[STAGE_BUILD] > 0
+
+    for stage in STAGES:
+        assert profiler.total.time[stage] == pytest.approx(
+            sum(stats.time[stage] for stats in profiler.texts.values())
+        )
+    assert profiler.total.counts["files"] == len(profiler.files)
+
+
+def test_callback_per_file(make_parser, text_ids):
+    calls = []
+    profiler = Profiler(
+        callback=lambda conllu_file, text, stats: calls.append(
+            (conllu_file, text, stats.counts["sentences"])
+        )
+    )
+    profiled_parser = make_parser(profiler=profiler)
+    list(profiled_parser.iter_corpus(text_ids[:2], stream=True))
+    assert [conllu_file for conllu_file, _, _ in calls] == [
+        str(item["path"])
+        for item in profiled_parser.get_all_corpus_files(text_ids[:2])
+    ]
+    assert all(text is not None and count > 0 for _, text, count in calls)
+
+
+###############################################################################
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Sentence Offset Index
+"""
+
+import os
+
+import pytest
+
+from sentence_index import SentenceIndex
+
+###############################################################################
+
+
+def split_verse(conllu_file):
+    """
+    Move the last sentence of a file to the first verse of the file
+
+    Returns the verse id of the first verse, which is now split by the lines
+    of the other verses.
+    """
+    blocks = conllu_file.read_text(encoding="utf-8").strip().split("\n\n")
+
+    def get_verse_id(block):
+        for line in block.splitlines():
+            if line.startswith("# sent_counter = "):
+                return line.split(" = ")[1]
+
+    verse_id = get_verse_id(blocks[0])
+    assert get_verse_id(blocks[-2]) != verse_id
+    blocks[-1] = blocks[-1].replace(
+        f"# sent_counter = {get_verse_id(blocks[-1])}",
+        f"# sent_counter = {verse_id}",
+    )
+    conllu_file.write_text("\n\n".join(blocks) + "\n\n", encoding="utf-8")
+    return int(verse_id)
+
+
+@pytest.fixture
+def index(parser, tmp_path):
+    SentenceIndex.build(parser, path=tmp_path / "sentence-index")
+    index = SentenceIndex.open(parser, tmp_path / "sentence-index")
+    yield index
+    index.close()
+
+
+###############################################################################
+
+
+def test_sentences_match_parser(index, parser):
+    count = 0
+    for item in parser.get_all_corpus_files():
+        for line in parser.parse_conllu_file(item["path"]):
+            sent_id = int(line.metadata["sent_id"])
+            assert index.get_sentence(sent_id).serialize() == line.serialize()
+            assert index.locate(sent_id)[0] == item["path"]
+            count += 1
+    assert len(index) == count
+    assert index.get_sentence(-1) is None
+
+
+def test_verses_match_parser(index, parser):
+    for item in parser.get_all_corpus_files():
+        for verse in parser.read_conllu_file(item["path"]):
+            assert index.get_verse(verse[0]["verse_id"], item["path"]) == verse
+            assert index.get_verse_of_sentence(verse[-1]["id"]) == verse
+
+
+def test_split_verse(make_parser, writable_data_dir):
+    parser = make_parser(writable_data_dir)
+    conllu_file = parser.get_all_corpus_files()[0]["path"]
+    verse_id = split_verse(conllu_file)
+    runs = [
+        verse
+        for verse in parser.read_conllu_file(conllu_file)
+        if verse[0]["verse_id"] == verse_id
+    ]
+    assert len(runs) == 2
+    expected = [line for verse in runs for line in verse]
+
+    index = SentenceIndex.build(parser)
+    assert index.get_verse(verse_id, conllu_file) == expected
+    assert index.get_verse_of_sentence(expected[-1]["id"]) == expected
+    index.close()
+
+
+def test_without_verse_ids(make_parser):
+    parser = make_parser(metadata_field_verse_id=None)
+    index = SentenceIndex.build(parser)
+    conllu_file = parser.get_all_corpus_files()[0]["path"]
+    for verse in parser.read_conllu_file(conllu_file):
+        assert index.get_verse_of_sentence(verse[0]["id"]) == verse
+    index.close()
+
+
+def test_changed_file_is_detected(make_parser, writable_data_dir):
+    parser = make_parser(writable_data_dir)
+    conllu_file = parser.get_all_corpus_files()[0]["path"]
+    index = SentenceIndex.build(parser)
+    sent_id = int(parser.parse_conllu_file(conllu_file)[0].metadata["sent_id"])
+
+    # same size, new modification time
+    content = conllu_file.read_text(encoding="utf-8")
+    conllu_file.write_text(
+        content.replace("\tNOUN\tNC\t", "\tVERB\tNC\t", 1), encoding="utf-8"
+    )
+    stat = os.stat(conllu_file)
+    os.utime(conllu_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert index.get_stale_files() == [conllu_file]
+    with pytest.raises(RuntimeError, match="changed since it was indexed"):
+        index.get_sentence(sent_id)
+
+
+###############################################################################
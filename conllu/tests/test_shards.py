@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Size-balanced Sharding of Corpus Files
+"""
+
+import pytest
+
+from shards import (
+    WEIGHT_BYTES,
+    WEIGHT_TOKENS,
+    balance,
+    count_tokens,
+    get_weight,
+)
+
+###############################################################################
+
+
+def count_lines(parser, conllu_file):
+    return len(parser.parse_conllu_file(conllu_file))
+
+
+###############################################################################
+
+
+@pytest.mark.parametrize(
+    "weights, n_shards, expected",
+    [
+        ([5, 1, 1, 1, 1, 1], 2, [[0], [1, 2, 3, 4, 5]]),
+        ([3, 3, 2, 2, 2], 2, [[0, 2, 4], [1, 3]]),
+        ([1, 2], 5, [[1], [0]]),
+        ([], 3, []),
+    ],
+)
+def test_balance(weights, n_shards, expected):
+    assert balance(weights, n_shards) == expected
+
+
+def test_token_count(parser):
+    for item in parser.get_all_corpus_files():
+        assert count_tokens(item["path"]) == sum(
+            len(line) for line in parser.parse_conllu_file(item["path"])
+        )
+    with pytest.raises(ValueError):
+        get_weight(item["path"], "lines")
+
+
+@pytest.mark.parametrize("weight", [WEIGHT_BYTES, WEIGHT_TOKENS])
+def test_plan_corpus(parser, weight, tmp_path):
+    items = parser.get_all_corpus_files()
+    shards = parser.plan_corpus(
+        3, weight=weight, manifest_path=tmp_path / "shards.json"
+    )
+    assert [shard["id"] for shard in shards] == [0, 1, 2]
+    assert sorted(
+        item["path"] for shard in shards for item in shard["files"]
+    ) == sorted(item["path"] for item in items)
+    for shard in shards:
+        assert shard["weight"] == sum(
+            get_weight(item["path"], weight) for item in shard["files"]
+        )
+        assert parser.get_shard(tmp_path / "shards.json", shard["id"]) == shard
+    with pytest.raises(KeyError):
+        parser.get_shard(tmp_path / "shards.json", 3)
+
+
+def test_process_corpus_matches_sequential(parser):
+    expected = {
+        item["path"]: count_lines(parser, item["path"])
+        for item in parser.get_all_corpus_files()
+    }
+    results = list(parser.process_corpus(count_lines, workers=2))
+    assert dict(results) == expected
+    assert len(results) == len(expected)
+
+    shard = parser.plan_corpus(4)[1]
+    assert dict(parser.process_corpus(count_lines, 2, shards=[shard])) == {
+        item["path"]: expected[item["path"]] for item in shard["files"]
+    }
+
+
+@pytest.mark.parametrize("group_verse", [False, True])
+def test_iter_corpus_matches_sequential(parser, text_ids, group_verse):
+    expected = list(parser.iter_corpus(text_ids[:2], group_verse=group_verse))
+    assert [text_id for text_id, _ in expected] == sorted(
+        [text_id for text_id, _ in expected], key=text_ids.index
+    )
+    for workers in [2, 3]:
+        result = list(
+            parser.iter_corpus(
+                text_ids[:2], group_verse=group_verse, workers=workers
+            )
+        )
+        if group_verse:
+            assert result == expected
+        else:
+            assert [
+                (text_id, line.serialize()) for text_id, line in result
+            ] == [(text_id, line.serialize()) for text_id, line in expected]
+
+
+###############################################################################
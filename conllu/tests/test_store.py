@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Columnar Token Store
+"""
+
+import numpy as np
+import pytest
+
+from store import StringTable, TokenStore, MISSING
+
+###############################################################################
+
+
+def scan_sentences(parser, text_ids):
+    """Sentences (in the format of `TokenStore.get_sentence()`), by parsing"""
+    for text_id in text_ids:
+        for conllu_file in parser.get_corpus_files(text_id):
+            for line in parser.parse_conllu_file(conllu_file):
+                tokens = []
+                for token in line:
+                    if not isinstance(token["id"], int):
+                        continue
+                    lemma_id = (token["misc"] or {}).get("LemmaId")
+                    tokens.append({
+                        **{
+                            column: token.get(column) or ""
+                            for column in TokenStore.STRING_COLUMNS
+                        },
+                        "id": token["id"],
+                        "lemma_id": int(lemma_id) if lemma_id else MISSING,
+                    })
+                yield {
+                    "sent_id": int(line.metadata["sent_id"]),
+                    "verse_id": int(line.metadata["sent_counter"]),
+                    "text_id": text_id,
+                    "chapter": conllu_file.name,
+                    "tokens": tokens,
+                }
+
+
+@pytest.fixture(params=["memory", "saved"])
+def store(request, parser, text_ids, tmp_path):
+    store = TokenStore.build(parser, text_ids + ["missing text"])
+    if request.param == "memory":
+        return store
+    store.save(tmp_path / "store")
+    return TokenStore.open(tmp_path / "store")
+
+
+###############################################################################
+
+
+def test_sentences_match_parser(store, parser, text_ids):
+    expected = list(scan_sentences(parser, text_ids))
+    assert [
+        store.get_sentence(sentence) for sentence in range(store.n_sentences)
+    ] == expected
+    assert store.n_tokens == sum(len(s["tokens"]) for s in expected)
+    assert store.n_texts == len(text_ids)
+    assert store["text_id"].tolist() == text_ids
+
+
+def test_offsets(store, parser, text_ids):
+    for text, text_id in enumerate(text_ids):
+        chapters = store.chapter_slice(text)
+        assert [
+            store.chapter_names[chapter]
+            for chapter in range(chapters.start, chapters.stop)
+        ] == [path.name for path in parser.get_corpus_files(text_id)]
+
+    positions = np.arange(store.n_tokens)
+    sentences = store.sentence_of_token(positions)
+    for sentence in range(0, store.n_sentences, 13):
+        tokens = store.token_slice(sentence)
+        assert (sentences[tokens] == sentence).all()
+
+
+def test_encode_decode(store):
+    forms = store.decode("form", store["form"][:20])
+    codes = [store.encode("form", form) for form in forms]
+    assert codes == store["form"][:20].tolist()
+    assert store.encode("form", "not a form") == MISSING
+
+
+def test_string_table(tmp_path):
+    strings = ["", "rāma", "राम", "", "a"]
+    table = StringTable.from_strings(strings)
+    table.save(tmp_path, "table")
+    loaded = StringTable.load(tmp_path, "table")
+    assert list(loaded) == strings == [table[i] for i in range(len(table))]
+    assert loaded.index("राम") == 2
+    assert StringTable.from_strings([]).index("") == MISSING
+
+
+###############################################################################
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Streaming Mode
+"""
+
+import types
+
+###############################################################################
+
+
+def serialize(conllu_lines):
+    return [line.serialize() for line in conllu_lines]
+
+
+###############################################################################
+
+
+def test_parse_stream_matches_eager(parser):
+    for item in parser.get_all_corpus_files():
+        lines = parser.parse_conllu_file(item["path"], stream=True)
+        assert isinstance(lines, types.GeneratorType)
+        expected = parser.parse_conllu_file(item["path"])
+        assert serialize(lines) == serialize(expected)
+
+        content = item["path"].read_text(encoding="utf-8")
+        assert serialize(parser.parse_conllu(content, stream=True)) == (
+            serialize(expected)
+        )
+        assert list(parser.read_conllu_data(content, stream=True)) == (
+            parser.read_conllu_file(item["path"])
+        )
+
+
+def test_get_corpus_stream_matches_eager(parser, text_ids):
+    for text_id in text_ids:
+        assert serialize(parser.get_corpus(text_id, stream=True)) == (
+            serialize(parser.get_corpus(text_id))
+        )
+        assert list(
+            parser.get_corpus(text_id, stream=True, group_verse=True)
+        ) == list(parser.get_corpus(text_id, group_verse=True))
+
+
+def test_stream_is_lazy(parser, text_ids):
+    lines = parser.get_corpus(text_ids[0], stream=True)
+    first = next(lines)
+    expected = parser.parse_conllu_file(
+        parser.get_corpus_files(text_ids[0])[0]
+    )[0]
+    assert first.serialize() == expected.serialize()
+    lines.close()
+
+
+def test_empty_input(parser):
+    assert list(parser.parse_conllu("", stream=True)) == []
+    assert list(parser.read_conllu_data("\n\n", stream=True)) == []
+    assert list(parser.get_corpus("missing text", stream=True)) == []
+
+
+###############################################################################
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Trigram Text Index
+"""
+
+import re
+
+import pytest
+
+from text_index import TextIndex
+from transliteration import transliterate, DEVANAGARI, IAST
+
+###############################################################################
+
+
+def scan_lines(parser):
+    """(text_id, chapter name, sent_id) and text of every line, by parsing"""
+    for item in parser.get_all_corpus_files():
+        for line in parser.parse_conllu_file(item["path"]):
+            yield (
+                (
+                    item["text_id"],
+                    item["path"].name,
+                    int(line.metadata["sent_id"]),
+                ),
+                line.metadata["text"],
+            )
+
+
+def matching(parser, predicate):
+    return [hit for hit, text in scan_lines(parser) if predicate(text)]
+
+
+@pytest.fixture
+def index(parser, tmp_path):
+    TextIndex.build(parser, path=tmp_path / "text-index")
+    return TextIndex.open(tmp_path / "text-index")
+
+
+@pytest.fixture
+def iast_parser(make_parser):
+    return make_parser(store_scheme=IAST)
+
+
+###############################################################################
+
+
+def test_schemes(index, parser):
+    assert index.scheme == parser.input_scheme
+    assert index.query_scheme == parser.store_scheme
+    assert len(index) == len(list(scan_lines(parser)))
+
+
+def test_substring_in_store_scheme(index, parser, iast_parser):
+    # queries are matched in the index scheme, e.g., `पीचौचुदृस्`
+    # (`pīcaucudṛs`) matches `pīcaucudṛsena`, hence the expected lines
+    # are found in IAST
+    texts = [text for _, text in scan_lines(parser)]
+    for text in texts[::17]:
+        word = text.split()[1]
+        query = transliterate(word, DEVANAGARI, IAST)
+        expected = matching(iast_parser, lambda line_text: query in line_text)
+        assert expected
+        assert index.search(word) == expected
+    assert len(index.search(texts[0].split()[0], limit=1)) == 1
+
+
+def test_substring_in_other_scheme(index, iast_parser):
+    texts = [text for _, text in scan_lines(iast_parser)]
+    for text in texts[::23]:
+        word = text.split()[-1]
+        expected = matching(iast_parser, lambda line_text: word in line_text)
+        assert index.search(word, scheme=IAST) == expected
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [r"\bk[aā]\S*ḥ\b", r"(?:ti|ni)\s\S{2}\b", r"^\w+ [ṛṝ]", r"\d"],
+)
+def test_regex_is_not_transliterated(index, iast_parser, pattern):
+    expected = matching(iast_parser, re.compile(pattern).search)
+    assert index.search(pattern, regex=True) == expected
+
+
+def test_index_in_input_scheme(iast_parser):
+    index = TextIndex.build(iast_parser)
+    assert index.query_scheme == index.scheme == IAST
+    assert index.search("ā") == matching(
+        iast_parser, lambda line_text: "ā" in line_text
+    )
+
+
+###############################################################################
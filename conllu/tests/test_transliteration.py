@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Shared Transliteration Cache
+"""
+
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+import pytest
+from indic_transliteration import sanscript
+
+import transliteration
+from transliteration import transliterate, DEVANAGARI, IAST
+
+###############################################################################
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+
+WORDS = ["rāmaḥ", "vanaṃ", "gacchati", "kṛṣṇa", "jñāna", "rāmaḥ", "ṛṣiḥ"]
+
+###############################################################################
+
+
+@pytest.fixture
+def cache():
+    """Restore the default cache after the test"""
+    yield transliteration
+    transliteration.set_cache_size()
+
+
+def run_python(code, cwd, **environment):
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=cwd,
+        env={**os.environ, **environment},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+###############################################################################
+
+
+@pytest.mark.parametrize("maxsize", [None, 0, 2])
+def test_matches_sanscript(cache, maxsize):
+    cache.set_cache_size(maxsize)
+    for word in WORDS * 2:
+        expected = sanscript.transliterate(word, IAST, DEVANAGARI)
+        assert transliterate(word, IAST, DEVANAGARI) == expected
+        assert transliterate(expected, DEVANAGARI, IAST) == (
+            sanscript.transliterate(expected, DEVANAGARI, IAST)
+        )
+    info = cache.cache_info()
+    assert info.maxsize == maxsize
+    if maxsize is not None:
+        assert info.currsize <= maxsize
+
+
+def test_repetitions_are_hits(cache):
+    cache.cache_clear()
+    for word in WORDS:
+        transliterate(word, IAST, DEVANAGARI)
+    info = cache.cache_info()
+    assert info.misses == len(set(WORDS))
+    assert info.hits == len(WORDS) - len(set(WORDS))
+
+
+def test_size_from_environment(tmp_path):
+    code = (
+        "import transliteration; "
+        "print(transliteration.cache_info().maxsize)"
+    )
+    output = run_python(
+        code,
+        tmp_path,
+        PYTHONPATH=str(ROOT_DIR / "common"),
+        DCS_TRANSLITERATION_CACHE_SIZE="123",
+    )
+    assert output == "123"
+
+
+@pytest.mark.parametrize(
+    "package, module",
+    [
+        ("conllu", "dcs"),
+        ("conllu", "text_index"),
+        ("database/peewee", "models"),
+    ],
+)
+def test_modules_import_without_path_setup(tmp_path, package, module):
+    # only the directory of the package itself is on the path
+    code = (
+        f"import sys; sys.path.insert(0, {str(ROOT_DIR / package)!r}); "
+        f"import {module}; print({module}.transliterate('rāma', 'iast', "
+        f"'devanagari'))"
+    )
+    assert run_python(code, tmp_path, PYTHONPATH="") == "राम"
+
+
+###############################################################################
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Trigram Text Index
+
+Full-text index over the line text (metadata `text`) of every sentence,
+for substring and regular expression search without parsing the corpus.
+
+Every line is indexed in the input scheme of the parser (IAST, for DCS), as
+the set of its character trigrams. The line text is read from the raw
+metadata of the CoNLL-U files, i.e., it is indexed exactly as in the source,
+without parsing the tokens or transliterating the text. Trigrams are encoded
+as 63-bit integers (three 21-bit code points), and the postings (lines
+containing a trigram) are stored as compressed sparse rows of `numpy`
+arrays. A query is reduced to the trigrams it must contain, the postings of
+those trigrams are intersected to get candidate lines, and the candidates
+are then verified against the query.
+
+Substring queries are expected in the store scheme of the parser (the
+scheme of the text returned by the parser, Devanagari for DCS), or in the
+scheme passed to `search()`, and are transliterated to the index scheme.
+Regular expressions are not transliterated (which would corrupt escapes and
+character classes), i.e., they must be written in the index scheme.
+
+Layout
+------
+* `keys`, `offsets` (+1 entry, into `postings`), `postings` (line numbers)
+* line arrays (one entry per line): `text_id`, `chapter`, `sent_id`
+* string tables: `line_text`, `chapter_name`
+"""
+
+import re
+import json
+from array import array
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
+
+from store import StringTable
+import common_path  # noqa: F401
+from transliteration import transliterate
+
+###############################################################################
+
+INDEX_VERSION = 3
+NGRAM = 3
+
+###############################################################################
+
+
+def read_line_texts(
+    conllu_file: str or Path, id_key: str, text_key: str
+) -> Iterable[Tuple[int, str]]:
+    """
+    Read the line text of every sentence from the raw metadata
+
+    Parameters
+    ----------
+    conllu_file : str or Path
+        Path to the CoNLL-U File
+    id_key : str
+        Metadata key of the sentence id (e.g., `sent_id`)
+    text_key : str
+        Metadata key of the line text (e.g., `text`)
+
+    Yields
+    ------
+    Tuple[int, str]
+        sent_id and text ("" if missing) of every sentence with tokens and
+        a sentence id
+    """
+    sent_id = None
+    text = ""
+    has_tokens = False
+    with open(conllu_file, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                if has_tokens and sent_id is not None:
+                    yield sent_id, text
+                sent_id = None
+                text = ""
+                has_tokens = False
+            elif line.startswith("#"):
+                key, _, value = line[1:].partition("=")
+                key = key.strip()
+                if key == id_key:
+                    sent_id = int(value)
+                elif key == text_key:
+                    text = value.strip()
+            else:
+                has_tokens = True
+
+    if has_tokens and sent_id is not None:
+        yield sent_id, text
+
+
+def encode_trigrams(text: str) -> List[int]:
+    """Distinct trigrams of a text, encoded as integers"""
+    codes = [ord(char) for char in text]
+    return list({
+        (codes[i] << 42) | (codes[i + 1] << 21) | codes[i + 2]
+        for i in range(len(codes) - NGRAM + 1)
+    })
+
+
+def required_literals(pattern: str, flags: int = 0) -> List[str]:
+    """
+    Literal strings that every match of a regular expression must contain
+
+    Only runs of literals at the top level of the expression are considered,
+    which is sufficient (not necessary) for candidate filtering. Nothing is
+    required of a case-insensitive expression, or of an expression with
+    top-level alternation.
+    """
+    parsed = sre_parse.parse(pattern, flags)
+    if (parsed.state.flags | flags) & re.IGNORECASE:
+        return []
+
+    literals = []
+    run = []
+    for opcode, argument in parsed:
+        if opcode is sre_parse.LITERAL:
+            run.append(chr(argument))
+            continue
+        if opcode is sre_parse.BRANCH:
+            return []
+        if run:
+            literals.append("".join(run))
+        run = []
+    if run:
+        literals.append("".join(run))
+    return literals
+
+
+###############################################################################
+
+
+class TextIndex:
+    LINE_ARRAYS = ["text_id", "chapter", "sent_id"]
+    ARRAYS = ["keys", "offsets", "postings"] + LINE_ARRAYS
+
+    def __init__(
+        self,
+        arrays: dict,
+        line_text: StringTable,
+        chapter_names: StringTable,
+        scheme: str,
+        query_scheme: str = None,
+    ):
+        """
+        Trigram Text Index
+
+        Use `TextIndex.build()` to create an index from the corpus, or
+        `TextIndex.open()` to open a saved index.
+
+        Parameters
+        ----------
+        arrays : dict
+            Arrays (see module docstring) by name
+        line_text : StringTable
+            Text of every line, in the index scheme
+        chapter_names : StringTable
+            Names (file names) of chapters
+        scheme : str
+            Transliteration scheme of the indexed text
+        query_scheme : str, optional
+            Default transliteration scheme of substring queries.
+            The default is None, i.e., same as `scheme`.
+        """
+        self.arrays = arrays
+        self.line_text = line_text
+        self.chapter_names = chapter_names
+        self.scheme = scheme
+        self.query_scheme = query_scheme or scheme
+
+    @classmethod
+    def build(
+        cls,
+        parser,
+        corpus_ids_or_names: Iterable[str or int] = None,
+        path: str or Path = None,
+    ):
+        """
+        Build a Text Index from the Corpus
+
+        Parameters
+        ----------
+        parser : DigitalCorpusSanskrit
+            Parser used to locate the chapter files (and metadata keys).
+            Lines are indexed in its input scheme, and substring queries are
+            expected in its store scheme by default.
+        corpus_ids_or_names : Iterable[str or int], optional
+            IDs or names of the texts to include.
+            If None, all texts are included.
+            The default is None.
+        path : str or Path, optional
+            If provided, the index is saved to this directory.
+            The default is None.
+
+        Returns
+        -------
+        TextIndex
+            Text index of the lines from the specified texts
+        """
+        scheme = parser.input_scheme
+        keys = array("q")
+        postings = array("i")
+        arrays = {
+            "text_id": array("i"),
+            "chapter": array("i"),
+            "sent_id": array("q"),
+        }
+        lines = []
+        chapter_names = []
+
+        for item in parser.get_all_corpus_files(corpus_ids_or_names):
+            chapter = len(chapter_names)
+            chapter_names.append(Path(item["path"]).name)
+            for sent_id, text in read_line_texts(
+                item["path"],
+                parser.metadata_field_line_id,
+                parser.metadata_field_line_text,
+            ):
+                trigrams = encode_trigrams(text)
+                keys.extend(trigrams)
+                postings.extend([len(lines)] * len(trigrams))
+                lines.append(text)
+                arrays["text_id"].append(item["text_id"])
+                arrays["chapter"].append(chapter)
+                arrays["sent_id"].append(sent_id)
+
+        keys = np.frombuffer(keys, dtype=np.int64)
+        order = np.argsort(keys, kind="stable")
+        arrays["keys"], counts = np.unique(keys[order], return_counts=True)
+        arrays["offsets"] = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=arrays["offsets"][1:])
+        arrays["postings"] = np.frombuffer(postings, dtype=np.int32)[order]
+        arrays["text_id"] = np.frombuffer(arrays["text_id"], dtype=np.int32)
+        arrays["chapter"] = np.frombuffer(arrays["chapter"], dtype=np.int32)
+        arrays["sent_id"] = np.frombuffer(arrays["sent_id"], dtype=np.int64)
+
+        index = cls(
+            arrays,
+            StringTable.from_strings(lines),
+            StringTable.from_strings(chapter_names),
+            scheme,
+            parser.store_scheme,
+        )
+        if path is not None:
+            index.save(path)
+        return index
+
+    def save(self, path: str or Path):
+        """Save the index to a directory"""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(path / f"{name}.npy", np.ascontiguousarray(self[name]))
+        self.line_text.save(path, "line_text")
+        self.chapter_names.save(path, "chapter_name")
+        meta = {
+            "version": INDEX_VERSION,
+            "scheme": self.scheme,
+            "query_scheme": self.query_scheme,
+            "lines": len(self),
+            "trigrams": len(self["keys"]),
+        }
+        (path / "meta.json").write_text(json.dumps(meta, indent=2))
+
+    @classmethod
+    def open(cls, path: str or Path, mmap_mode: str = "r"):
+        """
+        Open a saved index
+
+        Parameters
+        ----------
+        path : str or Path
+            Directory containing the index
+        mmap_mode : str, optional
+            Memory-map mode passed to `numpy.load()`.
+            If None, arrays are read into memory.
+            The default is "r".
+
+        Returns
+        -------
+        TextIndex
+            Text index
+        """
+        path = Path(path)
+        meta = json.loads((path / "meta.json").read_text())
+        if meta["version"] != INDEX_VERSION:
+            raise ValueError(
+                f"Unsupported text index version: {meta['version']}"
+            )
+        return cls(
+            {
+                name: np.load(path / f"{name}.npy", mmap_mode=mmap_mode)
+                for name in cls.ARRAYS
+            },
+            StringTable.load(path, "line_text", mmap_mode),
+            StringTable.load(path, "chapter_name", mmap_mode),
+            meta["scheme"],
+            meta["query_scheme"],
+        )
+
+    # ----------------------------------------------------------------------- #
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.arrays[name]
+
+    def __len__(self):
+        return len(self["sent_id"])
+
+    def normalize(self, query: str, scheme: str = None) -> str:
+        """Transliterate a (substring) query to the index scheme"""
+        scheme = scheme or self.query_scheme
+        if scheme == self.scheme:
+            return query
+        return transliterate(query, scheme, self.scheme)
+
+    def get_postings(self, key: int) -> np.ndarray:
+        position = np.searchsorted(self["keys"], key)
+        if position == len(self["keys"]) or self["keys"][position] != key:
+            return np.zeros(0, dtype=np.int32)
+        offsets = self["offsets"]
+        return self["postings"][offsets[position]:offsets[position + 1]]
+
+    def candidates(self, literals: List[str]) -> np.ndarray or None:
+        """
+        Lines containing all trigrams of the literals
+
+        Returns
+        -------
+        np.ndarray or None
+            Sorted line numbers, or None if the literals have no trigrams,
+            i.e., if every line is a candidate
+        """
+        keys = {
+            key for literal in literals for key in encode_trigrams(literal)
+        }
+        if not keys:
+            return None
+        postings = sorted(
+            (self.get_postings(key) for key in keys), key=len
+        )
+        result = postings[0]
+        for lines in postings[1:]:
+            if not len(result):
+                break
+            result = np.intersect1d(result, lines, assume_unique=True)
+        return result
+
+    # ----------------------------------------------------------------------- #
+
+    def search(
+        self,
+        query: str,
+        regex: bool = False,
+        limit: int = None,
+        scheme: str = None,
+    ) -> List[Tuple[int, str, int]]:
+        """
+        Search lines by substring or regular expression
+
+        Parameters
+        ----------
+        query : str
+            Substring, or regular expression (in the index scheme)
+        regex : bool, optional
+            If True, `query` is treated as a regular expression and matched
+            using `re.search()`, without transliteration.
+            The default is False.
+        limit : int, optional
+            Maximum number of hits.
+            The default is None.
+        scheme : str, optional
+            Transliteration scheme of a substring query.
+            The default is None, i.e., `query_scheme` of the index.
+
+        Returns
+        -------
+        List[Tuple[int, str, int]]
+            Hits as (text_id, chapter, sent_id), in corpus order
+        """
+        if regex:
+            pattern = re.compile(query)
+            literals = required_literals(query)
+            verify = pattern.search
+        else:
+            query = self.normalize(query, scheme)
+            literals = [query]
+
+            def verify(text):
+                return query in text
+
+        lines = self.candidates(literals)
+        if lines is None:
+            lines = range(len(self))
+
+        hits = []
+        for line in lines:
+            if limit is not None and len(hits) >= limit:
+                break
+            if verify(self.line_text[line]):
+                hits.append(self.get_hit(line))
+        return hits
+
+    def get_hit(self, line: int) -> Tuple[int, str, int]:
+        return (
+            int(self["text_id"][line]),
+            self.chapter_names[int(self["chapter"][line])],
+            int(self["sent_id"][line]),
+        )
+
+    def get_text(self, line: int) -> str:
+        """Text of a line (by position in the index) in the index scheme"""
+        return self.line_text[line]
+
+    def __repr__(self):
+        return (
+            f"TextIndex(lines={len(self)}, trigrams={len(self['keys'])}, "
+            f"scheme='{self.scheme}', query_scheme='{self.query_scheme}')"
+        )
+
+
+###############################################################################
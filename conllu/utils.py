@@ -6,13 +6,41 @@ CoNLL-U Parsing Utility
 @author: Hrishikesh Terdalkar
 """
 
+import io
+import os
+import threading
+from collections import deque
+from time import perf_counter
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator, Callable, TextIO
 
 import conllu
 
-from indic_transliteration import sanscript
-from indic_transliteration.sanscript import transliterate
+import common_path  # noqa: F401
+from transliteration import (
+    transliterate,
+    cache_info as transliteration_cache_info,
+    IAST,
+    DEVANAGARI,
+)
+
+from cache import FileCache, get_source_info
+from engine import DCSEngine, ENGINE_CONLLU, ENGINE_DCS
+from compact import (
+    Verse as CompactVerse,
+    Line as CompactLine,
+    Token as CompactToken,
+    SHARED_FIELDS as COMPACT_SHARED_FIELDS,
+    compact_value,
+)
+from profiling import (
+    Profiler,
+    Stats,
+    STAGE_IO,
+    STAGE_PARSE,
+    STAGE_TRANSLITERATE,
+    STAGE_BUILD,
+)
 
 ###############################################################################
 
@@ -24,6 +52,106 @@ def parse_int(text: str) -> int or None:
         pass
 
 
+def imap_ordered(
+    function: Callable,
+    iterable: Iterable,
+    workers: int,
+    max_pending: int = None,
+    initializer: Callable = None,
+    initargs: tuple = (),
+) -> Iterator:
+    """
+    Map a function over an iterable using a process pool
+
+    Results are yielded in the order of the input, and at most `max_pending`
+    tasks are in flight at any time, so that neither the submitted inputs
+    nor the finished results can accumulate without bound.
+
+    Parameters
+    ----------
+    function : Callable
+        Picklable (module-level) function to call on every item
+    iterable : Iterable
+        Items to process
+    workers : int
+        Number of worker processes
+    max_pending : int, optional
+        Maximum number of submitted but not yet yielded tasks.
+        The default is twice the number of workers.
+    initializer : Callable, optional
+        Function to call in every worker process once, on startup
+    initargs : tuple, optional
+        Arguments passed to `initializer`
+
+    Yields
+    ------
+    object
+        Result of `function` for every item, in order
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if max_pending is None:
+        max_pending = 2 * workers
+
+    pending = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as executor:
+        try:
+            for item in iterable:
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(function, item))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+###############################################################################
+# NOTE: Process pool workers
+# The parser is sent to every worker process once (through the initializer)
+# instead of being pickled along with every task.
+
+_WORKER_PARSER = None
+
+
+def _initialize_worker(parser):
+    global _WORKER_PARSER
+    _WORKER_PARSER = parser
+
+
+def _run_file_worker(function: Callable, conllu_file):
+    # NOTE: with a profiler, statistics are returned to the main process
+    profiler = _WORKER_PARSER.profiler
+    if profiler is None:
+        return function(conllu_file)
+    profiler.reset()
+    return function(conllu_file), profiler.total
+
+
+def _parse_file_worker(conllu_file):
+    return _run_file_worker(_WORKER_PARSER.parse_conllu_file, conllu_file)
+
+
+def _read_file_worker(conllu_file):
+    return _run_file_worker(_WORKER_PARSER.read_conllu_file, conllu_file)
+
+
+def _process_files_worker(task):
+    function, conllu_files = task
+    profiler = _WORKER_PARSER.profiler
+    results = []
+    for conllu_file in conllu_files:
+        if profiler is not None:
+            profiler.reset()
+        result = function(_WORKER_PARSER, conllu_file)
+        stats = profiler.total if profiler is not None else None
+        results.append((conllu_file, result, stats))
+    return results
+
+
 ###############################################################################
 
 
@@ -69,15 +197,18 @@ class CoNLLUParser:
 
     def __init__(
         self,
-        input_scheme: str = sanscript.IAST,
-        store_scheme: str = sanscript.DEVANAGARI,
+        input_scheme: str = IAST,
+        store_scheme: str = DEVANAGARI,
         input_fields: List[str] = None,
         relevant_fields: Dict[str, str] = None,
         metadata_field_line_text: str = None,
         metadata_field_line_id: str = None,
         metadata_field_verse_id: str = None,
         transliterate_metadata_keys: List[str] = None,
-        transliterate_token_keys: List[str] = None
+        transliterate_token_keys: List[str] = None,
+        cache_dir: str or Path = None,
+        engine: str = ENGINE_CONLLU,
+        profiler: Profiler = None,
     ):
         """CoNLL-U Files Parser
 
@@ -85,10 +216,10 @@ class CoNLLUParser:
         ----------
         input_scheme : str, optional
             Input transliteration scheme
-            The default is `sanscript.IAST`
+            The default is `sanscript.IAST` ("iast")
         store_scheme : str, optional
             Transliteration scheme used to store the corpus in the database
-            The default is `sanscript.DEVANAGARI`
+            The default is `sanscript.DEVANAGARI` ("devanagari")
         fields : List[str], optional
             List of CoNLL-U Fields, if not standard
         relevant_fields : Dict[str, str], optional
@@ -107,6 +238,25 @@ class CoNLLUParser:
             List of metadata keys to transliterate
         transliterate_token_keys : List[str], optional
             List of token keys to transliterate
+        cache_dir : str or Path, optional
+            Directory for the persistent cache of parsed files.
+            If set, output of `parse_conllu_file()` and `read_conllu_file()`
+            is stored per file, keyed by the file and the parser
+            configuration, and re-used as long as the file is unchanged.
+            The default is None.
+        engine : str, optional
+            Parsing engine, one of
+            * ENGINE_CONLLU ("conllu"): `conllu` library
+            * ENGINE_DCS ("dcs"): fast engine tuned to the DCS files, which
+              only materialises the `relevant_fields` (and fields to be
+              transliterated), and parses `feats` and `misc` on access
+            The default is ENGINE_CONLLU.
+        profiler : Profiler, optional
+            If set, time spent in every stage (io, parse, transliterate,
+            build) and counts of bytes, sentences, tokens and
+            transliteration calls are recorded per file (and per text) in
+            the profiler. (Refer: `profiling.Profiler`)
+            The default is None.
         """
         self.input_scheme = input_scheme
         self.store_scheme = store_scheme
@@ -129,9 +279,116 @@ class CoNLLUParser:
         self.metadata_field_line_id = metadata_field_line_id
         self.metadata_field_verse_id = metadata_field_verse_id
 
+        if engine not in [ENGINE_CONLLU, ENGINE_DCS]:
+            raise ValueError(f"Invalid engine: '{engine}'")
+        self.engine = engine
+        self.dcs_engine = None
+        if engine == ENGINE_DCS:
+            self.dcs_engine = DCSEngine(
+                self.fields,
+                list(self.relevant_fields) + [
+                    key.split(".", 1)[0]
+                    for key in self.transliterate_token_keys
+                ],
+            )
+
+        # values shared among compact tokens
+        self._compact_shared_values = {}
+
+        self.cache = None
+        if cache_dir is not None:
+            self.cache = FileCache(cache_dir, config=self.get_config())
+
+        # statistics of the file being read (only with a profiler), kept per
+        # thread, so that files read concurrently are profiled separately
+        self.profiler = profiler
+        self._profiling = threading.local()
+
+    def get_config(self) -> Dict:
+        """Configuration affecting the output of the parser"""
+        return {
+            "input_scheme": self.input_scheme,
+            "store_scheme": self.store_scheme,
+            "input_fields": self.fields,
+            "relevant_fields": self.relevant_fields,
+            "metadata_field_line_text": self.metadata_field_line_text,
+            "metadata_field_line_id": self.metadata_field_line_id,
+            "metadata_field_verse_id": self.metadata_field_verse_id,
+            "transliterate_metadata_keys": self.transliterate_metadata_keys,
+            "transliterate_token_keys": self.transliterate_token_keys,
+            "engine": self.engine,
+        }
+
+    # ----------------------------------------------------------------------- #
+    # NOTE: Profiling
+    # A file-level call (`parse_conllu_file()`, `read_conllu_file()`) made
+    # with a profiler sets `self._stats` (of the calling thread), which the
+    # stages of the pipeline update while the call (or the returned
+    # generator) runs.
+    # Without a profiler, `self._stats` is always None.
+
+    @property
+    def _stats(self) -> Stats or None:
+        return getattr(self._profiling, "stats", None)
+
+    @_stats.setter
+    def _stats(self, stats: Stats or None):
+        self._profiling.stats = stats
+
+    def __getstate__(self):
+        # NOTE: thread-local state is not pickled (e.g., for pool workers)
+        state = self.__dict__.copy()
+        del state["_profiling"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._profiling = threading.local()
+
+    def get_text_of_file(self, conllu_file: str or Path) -> str or None:
+        """Text a file belongs to, used to aggregate statistics per text"""
+        return None
+
+    def _profile_file(
+        self, conllu_file: str or Path, function: Callable, *args
+    ):
+        stats = Stats(counts={"files": 1})
+        self._stats = stats
+        try:
+            result = function(conllu_file, *args)
+        finally:
+            self._stats = None
+
+        if isinstance(result, Iterator):
+            return self._profile_stream(conllu_file, stats, result)
+        self.profiler.record(
+            conllu_file, stats, self.get_text_of_file(conllu_file)
+        )
+        return result
+
+    def _profile_stream(
+        self, conllu_file: str or Path, stats: Stats, iterator: Iterator
+    ) -> Iterator:
+        while True:
+            self._stats = stats
+            try:
+                item = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                self._stats = None
+            yield item
+        self.profiler.record(
+            conllu_file, stats, self.get_text_of_file(conllu_file)
+        )
+
+    def _count_transliterations(self) -> int:
+        info = transliteration_cache_info()
+        return info.hits + info.misses
+
     # ----------------------------------------------------------------------- #
 
-    def parse_conllu(self, conllu_content: str):
+    def parse_conllu(self, conllu_content: str, stream: bool = False):
         """
         Parse a CoNLL-U String
 
@@ -139,23 +396,42 @@ class CoNLLUParser:
         ----------
         conllu_content : str
             Valid string of CoNLL-U Data
+        stream : bool, optional
+            If True, sentences are parsed incrementally and a generator of
+            transliterated lines is returned instead of a list.
+            The default is False.
 
         Returns
         -------
-        list
+        list or generator
             List of lines
         """
-        conllu_lines = [
-            line
-            for line in conllu.parse(conllu_content, fields=self.fields)
-            if line
-        ]
+        if stream:
+            return self.iter_conllu(conllu_content)
+
+        stats = self._stats
+        if stats is not None:
+            start = perf_counter()
+
+        if self.dcs_engine is not None:
+            parsed_lines = self.dcs_engine.parse(conllu_content)
+        else:
+            parsed_lines = conllu.parse(conllu_content, fields=self.fields)
+
+        conllu_lines = [line for line in parsed_lines if line]
+
+        if stats is not None:
+            stats.time[STAGE_PARSE] += perf_counter() - start
+            stats.counts["sentences"] += len(conllu_lines)
+            stats.counts["tokens"] += sum(len(line) for line in conllu_lines)
 
         # ------------------------------------------------------------------- #
 
         return self.transliterate_lines(conllu_lines)
 
-    def parse_conllu_file(self, conllu_file: str or Path):
+    def parse_conllu_file(
+        self, conllu_file: str or Path, stream: bool = False
+    ):
         """
         Parse a CoNLL-U File
 
@@ -163,31 +439,230 @@ class CoNLLUParser:
         ----------
         conllu_file : str or Path
             Path to the CoNLL-U File
+        stream : bool, optional
+            If True, the file is read incrementally and a generator of
+            transliterated lines is returned instead of a list.
+            The file is kept open until the generator is exhausted.
+            If the parser has a cache, a valid cache entry is used, but
+            the streamed output is not stored in the cache.
+            The default is False.
 
         Returns
         -------
-        list
+        list or generator
             List of lines
         """
+        if self.profiler is not None and self._stats is None:
+            return self._profile_file(
+                conllu_file, self.parse_conllu_file, stream
+            )
+
+        stats = self._stats
+        if self.cache is not None:
+            conllu_lines = self.cache.get(conllu_file, "lines")
+            if conllu_lines is not None:
+                if stats is not None:
+                    stats.counts["cache_hits"] += 1
+                return iter(conllu_lines) if stream else conllu_lines
+
+        if stream:
+            return self.iter_conllu_file(conllu_file)
+
+        if self.cache is not None:
+            source_info = get_source_info(conllu_file)
+
+        if stats is not None:
+            start = perf_counter()
 
         with open(conllu_file, encoding="utf-8") as f:
             content = f.read()
 
-        return self.parse_conllu(content)
+        if stats is not None:
+            stats.time[STAGE_IO] += perf_counter() - start
+            stats.counts["bytes"] += os.path.getsize(conllu_file)
+
+        conllu_lines = self.parse_conllu(content)
+        if self.cache is not None:
+            self.cache.set(conllu_file, "lines", conllu_lines, source_info)
+        return conllu_lines
+
+    def parse_conllu_files(
+        self,
+        conllu_files: Iterable[str or Path],
+        workers: int = None,
+        group_verse: bool = False,
+        max_pending: int = None,
+    ) -> Iterator[List]:
+        """
+        Parse multiple CoNLL-U Files, optionally in parallel
+
+        Parameters
+        ----------
+        conllu_files : Iterable[str or Path]
+            Paths to the CoNLL-U Files
+        workers : int, optional
+            Number of worker processes.
+            If None or 1, files are parsed sequentially in this process.
+            The default is None.
+        group_verse : bool, optional
+            If True, files are read using `read_conllu_file()`, i.e.,
+            a list of verses is yielded per file instead of a list of lines.
+            The default is False.
+        max_pending : int, optional
+            Maximum number of files being parsed (or parsed but not yet
+            yielded) at any time.
+            The default is twice the number of workers.
+
+        Yields
+        ------
+        list
+            List of lines (or verses) per file, in the order of input files
+        """
+        if not workers or workers == 1:
+            read_function = (
+                self.read_conllu_file
+                if group_verse else
+                self.parse_conllu_file
+            )
+            for conllu_file in conllu_files:
+                yield read_function(conllu_file)
+            return
+
+        # NOTE: with a profiler, workers return statistics along with the
+        # result, which are recorded against the files in the order submitted
+        submitted = deque()
+        if self.profiler is not None:
+            conllu_files = (
+                submitted.append(conllu_file) or conllu_file
+                for conllu_file in conllu_files
+            )
+
+        results = imap_ordered(
+            _read_file_worker if group_verse else _parse_file_worker,
+            conllu_files,
+            workers=workers,
+            max_pending=max_pending,
+            initializer=_initialize_worker,
+            initargs=(self,),
+        )
+        if self.profiler is None:
+            yield from results
+            return
+
+        for result, stats in results:
+            conllu_file = submitted.popleft()
+            self.profiler.record(
+                conllu_file, stats, self.get_text_of_file(conllu_file)
+            )
+            yield result
+
+    # ----------------------------------------------------------------------- #
+
+    def iter_conllu(self, conllu_content: str or TextIO) -> Iterator:
+        """
+        Parse CoNLL-U Data Incrementally
+
+        Sentences are parsed one at a time and transliterated before being
+        yielded, so memory usage does not grow with the size of the input.
+
+        Parameters
+        ----------
+        conllu_content : str or TextIO
+            Valid string of CoNLL-U Data or a file-like object
+
+        Yields
+        ------
+        TokenList
+            Transliterated line
+        """
+        if isinstance(conllu_content, str):
+            conllu_content = io.StringIO(conllu_content)
+
+        if self.dcs_engine is not None:
+            parsed_lines = self.dcs_engine.parse_incr(conllu_content)
+        else:
+            parsed_lines = conllu.parse_incr(
+                conllu_content, fields=self.fields
+            )
+
+        stats = self._stats
+        if stats is None:
+            for line in parsed_lines:
+                if line:
+                    yield self.transliterate_line(line)
+            return
+
+        parsed_lines = iter(parsed_lines)
+        while True:
+            start = perf_counter()
+            line = next(parsed_lines, None)
+            stats.time[STAGE_PARSE] += perf_counter() - start
+            if line is None:
+                break
+            if not line:
+                continue
+            stats.counts["sentences"] += 1
+            stats.counts["tokens"] += len(line)
+
+            start = perf_counter()
+            calls = self._count_transliterations()
+            line = self.transliterate_line(line)
+            stats.time[STAGE_TRANSLITERATE] += perf_counter() - start
+            stats.counts["transliterations"] += (
+                self._count_transliterations() - calls
+            )
+            yield line
+
+    def iter_conllu_file(self, conllu_file: str or Path) -> Iterator:
+        """
+        Parse a CoNLL-U File Incrementally
+
+        Parameters
+        ----------
+        conllu_file : str or Path
+            Path to the CoNLL-U File
+
+        Yields
+        ------
+        TokenList
+            Transliterated line
+        """
+        with open(conllu_file, encoding="utf-8") as f:
+            if self._stats is not None:
+                self._stats.counts["bytes"] += os.fstat(f.fileno()).st_size
+            yield from self.iter_conllu(f)
 
     # ----------------------------------------------------------------------- #
 
     def transliterate_lines(self, conllu_lines):
         """Transliterate CoNLL-U Data"""
-        if self.store_scheme != self.input_scheme:
-            for textline in conllu_lines:
-                textline.metadata = self.transliterate_metadata(
-                    textline.metadata
-                )
-                for token in textline:
-                    token = self.transliterate_token(token)
+        if self.store_scheme == self.input_scheme:
+            return conllu_lines
+
+        stats = self._stats
+        if stats is not None:
+            start = perf_counter()
+            calls = self._count_transliterations()
+
+        for textline in conllu_lines:
+            self.transliterate_line(textline)
+
+        if stats is not None:
+            stats.time[STAGE_TRANSLITERATE] += perf_counter() - start
+            stats.counts["transliterations"] += (
+                self._count_transliterations() - calls
+            )
         return conllu_lines
 
+    def transliterate_line(self, textline):
+        """Transliterate a CoNLL-U Line (Sentence)"""
+        if self.store_scheme == self.input_scheme:
+            return textline
+        textline.metadata = self.transliterate_metadata(textline.metadata)
+        for token in textline:
+            token = self.transliterate_token(token)
+        return textline
+
     def transliterate_metadata(self, metadata):
         """Transliterate Metadata"""
         if self.store_scheme == self.input_scheme:
@@ -241,7 +716,9 @@ class CoNLLUParser:
     # in particular,
     # "id", "form", "lemma", "upos", "xpos", "feats", "misc"
 
-    def read_conllu_data(self, conllu_data: str):
+    def read_conllu_data(
+        self, conllu_data: str, stream: bool = False, compact: bool = False
+    ):
         """
         Parse a CoNLL-U File
         Prepare it for Data Input (Group Verses etc)
@@ -258,59 +735,217 @@ class CoNLLUParser:
 
         Parameters
         ----------
-        verses : List[object]
-            Verse data
+        conllu_data : str
+            Valid string of CoNLL-U Data
+        stream : bool, optional
+            If True, a generator of verses is returned, and each verse is
+            yielded as soon as all of its lines have been parsed.
+            The default is False.
+        compact : bool, optional
+            If True, verses, lines and tokens are compact slotted objects
+            (`compact.Verse`, `compact.Line`, `compact.Token`), which can be
+            converted to the dictionary format using `to_dict()`.
+            The default is False.
+
+        Returns
+        -------
+        list or generator
+            List of verses
         """
+        verses = self.group_verses(
+            self.parse_conllu(conllu_data, stream), compact=compact
+        )
+        return verses if stream else list(verses)
 
-        data = self.parse_conllu(conllu_data)
-        chapter_lines = []
+    def read_conllu_file(
+        self,
+        conllu_file: str or Path,
+        stream: bool = False,
+        compact: bool = False,
+    ):
+        """
+        Read a CoNLL-U File
+        Prepare it for Data Input (Group Verses etc)
 
-        for line in data:
-            try:
-                line_text = (
-                    line.metadata[self.metadata_field_line_text]
-                    if self.metadata_field_line_id else
-                    " ".join(token.get("form") for token in line)
-                )
-                line_id = (
-                    int(line.metadata[self.metadata_field_line_id])
-                    if self.metadata_field_line_id else
-                    None
-                )
-                verse_id = (
-                    int(line.metadata[self.metadata_field_verse_id])
-                    if self.metadata_field_verse_id else
-                    None
+        Parameters
+        ----------
+        conllu_file : str or Path
+            Path to the CoNLL-U File
+        stream : bool, optional
+            If True, the file is read incrementally and a generator of verses
+            is returned.
+            The default is False.
+        compact : bool, optional
+            If True, compact slotted objects are returned instead of
+            dictionaries. (Refer: `read_conllu_data()`)
+            The default is False.
+
+        Returns
+        -------
+        list or generator
+            List of verses
+        """
+        if self.profiler is not None and self._stats is None:
+            return self._profile_file(
+                conllu_file, self.read_conllu_file, stream, compact
+            )
+
+        cache_kind = "verses-compact" if compact else "verses"
+        if self.cache is not None:
+            verses = self.cache.get(conllu_file, cache_kind)
+            if verses is not None:
+                if self._stats is not None:
+                    self._stats.counts["cache_hits"] += 1
+                return iter(verses) if stream else verses
+            if not stream:
+                source_info = get_source_info(conllu_file)
+
+        verses = self.group_verses(
+            self.parse_conllu_file(conllu_file, stream), compact=compact
+        )
+        if stream:
+            return verses
+
+        verses = list(verses)
+        if self.cache is not None:
+            self.cache.set(conllu_file, cache_kind, verses, source_info)
+        return verses
+
+    # ----------------------------------------------------------------------- #
+
+    def prepare_line(self, line, compact: bool = False) -> Dict:
+        """Prepare a parsed CoNLL-U Line for Data Input"""
+        if compact:
+            return self.prepare_compact_line(line)
+
+        try:
+            line_text = (
+                line.metadata[self.metadata_field_line_text]
+                if self.metadata_field_line_id else
+                " ".join(token.get("form") for token in line)
+            )
+            line_id = (
+                int(line.metadata[self.metadata_field_line_id])
+                if self.metadata_field_line_id else
+                None
+            )
+            verse_id = (
+                int(line.metadata[self.metadata_field_verse_id])
+                if self.metadata_field_verse_id else
+                None
+            )
+            relevant_fields = list(self.relevant_fields.items())
+            return {
+                "id": line_id,          # (global) unique line_id
+                "verse_id": verse_id,   # used to group lines together
+                "text": line_text,
+                "tokens": [
+                    {
+                        _name: token.get(_name) or _default
+                        for _name, _default in relevant_fields
+                    }
+                    for token in line
+                ]
+            }
+        except Exception as e:
+            print(line)
+            raise e
+
+    def prepare_compact_line(self, line) -> "CompactLine":
+        """Prepare a parsed CoNLL-U Line as a compact Line object"""
+        fields = tuple(self.relevant_fields)
+        if not set(fields).issubset(CompactToken.FIELDS):
+            raise ValueError(
+                "Compact tokens only support the fields "
+                f"{CompactToken.FIELDS}"
+            )
+
+        # (name, default, shared values) for every slot of the compact token
+        shared = self._compact_shared_values
+        slots = [
+            (
+                name,
+                self.relevant_fields.get(name),
+                shared.setdefault(name, {})
+                if name in COMPACT_SHARED_FIELDS else
+                None
+            )
+            for name in CompactToken.FIELDS
+        ]
+        try:
+            line_text = (
+                line.metadata[self.metadata_field_line_text]
+                if self.metadata_field_line_id else
+                " ".join(token.get("form") for token in line)
+            )
+            line_id = (
+                int(line.metadata[self.metadata_field_line_id])
+                if self.metadata_field_line_id else
+                None
+            )
+            verse_id = (
+                int(line.metadata[self.metadata_field_verse_id])
+                if self.metadata_field_verse_id else
+                None
+            )
+            tokens = [
+                CompactToken(
+                    fields,
+                    *[
+                        compact_value(token.get(name) or default, _shared)
+                        for name, default, _shared in slots
+                    ],
                 )
-                unit = {
-                    "id": line_id,          # (global) unique line_id
-                    "verse_id": verse_id,   # used to group lines together
-                    "text": line_text,
-                    "tokens": [
-                        {
-                            _name: token.get(_name) or _default
-                            for _name, _default in self.relevant_fields.items()
-                        }
-                        for token in line
-                    ]
-                }
-                chapter_lines.append(unit)
-            except Exception as e:
-                print(line)
-                raise e
-
-        # group lines by same verse id to form verse units
-        verses = []
+                for token in line
+            ]
+            return CompactLine(line_id, verse_id, line_text, tokens)
+        except Exception as e:
+            print(line)
+            raise e
+
+    def group_verses(
+        self, conllu_lines: Iterable, compact: bool = False
+    ) -> Iterator[List[Dict]]:
+        """
+        Group Lines with the same verse id to form verse units
+
+        Lines are consumed lazily, and a verse is yielded as soon as a line
+        with a different verse id is encountered.
+
+        Parameters
+        ----------
+        conllu_lines : Iterable
+            Parsed (and transliterated) CoNLL-U Lines
+        compact : bool, optional
+            If True, compact Verse objects are yielded.
+            The default is False.
+
+        Yields
+        ------
+        list
+            Verse, i.e., list of lines prepared using `prepare_line()`
+        """
+        stats = self._stats
+        verse_class = CompactVerse if compact else list
+        verse = verse_class()
         last_verse_id = None
-        for _line in chapter_lines:
+        for line in conllu_lines:
+            if stats is None:
+                _line = self.prepare_line(line, compact=compact)
+            else:
+                start = perf_counter()
+                _line = self.prepare_line(line, compact=compact)
+                stats.time[STAGE_BUILD] += perf_counter() - start
             line_verse_id = _line.get("verse_id")
             if line_verse_id is None or line_verse_id != last_verse_id:
                 # initiate a verse (unit)
                 last_verse_id = line_verse_id
-                verses.append([])
-            verses[-1].append(_line)
-
-        return verses
+                if verse:
+                    yield verse
+                verse = verse_class()
+            verse.append(_line)
+        if verse:
+            yield verse
 
     # ----------------------------------------------------------------------- #
 
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Dictionary Output
+
+Compare the throughput (rows/sec) of `model_to_dict()` over model instances
+(the previous TYPE_DICT path) and the row serialisation of `rows.py`, for the
+lines and words of every chapter, and verify that both produce identical
+output.
+
+Usage:
+    $ python bench_dicts.py DB_URL [--repeat N]
+
+DB_URL is a database connection URL (e.g., `sqlite:///dcs.sqlite`).
+A synthetic database can be created using `generate.py`.
+"""
+
+###############################################################################
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+from peewee import JOIN
+from playhouse.db_url import connect
+from playhouse.shortcuts import model_to_dict
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+BASE_DIR = BENCHMARKS_DIR.parent
+
+sys.path.insert(0, str(BASE_DIR))
+
+from models import (  # noqa: E402
+    database_proxy,
+    Chapters,
+    TextLines,
+    Lexicon,
+    WordReferences,
+)
+from rows import fetch_rows  # noqa: E402
+import common_path  # noqa: F401,E402
+from transliteration import cache_clear  # noqa: E402
+
+###############################################################################
+
+
+def lines_query(chapter_id):
+    return (
+        TextLines.select()
+        .where(TextLines.chapter_id == chapter_id)
+        .order_by(TextLines.verse, TextLines.stanza)
+    )
+
+
+def words_query(chapter_id, fields=None):
+    query = WordReferences.select(WordReferences, *(fields or []))
+    if fields:
+        query = query.join_from(WordReferences, Lexicon, JOIN.LEFT_OUTER)
+    return (
+        query.join_from(WordReferences, TextLines)
+        .where(TextLines.chapter_id == chapter_id)
+        .order_by(
+            TextLines.verse,
+            TextLines.stanza,
+            TextLines.id,
+            WordReferences.absolute_position,
+            WordReferences.inner_position,
+        )
+    )
+
+
+def lexicon_to_dict(word):
+    word_model = model_to_dict(word, False)
+    word_model["word"] = word.lexicon_id.word
+    word_model["grammar"] = word.lexicon_id.grammar
+    return word_model
+
+
+def lexicon_words_query(chapter_id):
+    return words_query(chapter_id, [Lexicon])
+
+
+def lexicon_fields_query(chapter_id):
+    return words_query(chapter_id, [Lexicon.word, Lexicon.grammar])
+
+
+def to_dicts(query):
+    return [model_to_dict(model, recurse=False) for model in query]
+
+
+# stage: {path: (query function, serialisation function)}
+STAGES = {
+    "lines": {
+        "model_to_dict": (lines_query, to_dicts),
+        "rows": (lines_query, fetch_rows),
+    },
+    "words": {
+        "model_to_dict": (words_query, to_dicts),
+        "rows": (words_query, fetch_rows),
+    },
+    "words+lexicon": {
+        "model_to_dict": (
+            lexicon_words_query,
+            lambda query: [lexicon_to_dict(word) for word in query],
+        ),
+        "rows": (lexicon_fields_query, fetch_rows),
+    },
+}
+
+###############################################################################
+
+
+def benchmark(chapter_ids, make_query, function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        # transliteration is part of the cost of both the paths
+        cache_clear()
+        start = time.perf_counter()
+        for chapter_id in chapter_ids:
+            function(make_query(chapter_id))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+###############################################################################
+
+
+def main():
+    argparser = argparse.ArgumentParser(description="Benchmark dict output")
+    argparser.add_argument("db_url", help="database connection URL")
+    argparser.add_argument("--repeat", type=int, default=3)
+    args = argparser.parse_args()
+
+    database = connect(args.db_url)
+    database_proxy.initialize(database)
+    database.connect()
+
+    chapter_ids = [chapter.id for chapter in Chapters.select(Chapters.id)]
+    print(f"Chapters: {len(chapter_ids)}")
+    print(f"{'stage':<14} {'path':<14} {'seconds':>9} {'rows/sec':>12}")
+
+    for stage, paths in STAGES.items():
+        n_rows = 0
+        for chapter_id in chapter_ids:
+            outputs = [
+                function(make_query(chapter_id))
+                for make_query, function in paths.values()
+            ]
+            if any(output != outputs[0] for output in outputs):
+                raise AssertionError(f"{stage}: different output")
+            n_rows += len(outputs[0])
+
+        timings = {}
+        for path, (make_query, function) in paths.items():
+            timings[path] = benchmark(
+                chapter_ids, make_query, function, args.repeat
+            )
+            print(
+                f"{stage:<14} {path:<14} {timings[path]:>9.3f} "
+                f"{n_rows / timings[path]:>12.0f}"
+            )
+        speedup = timings["model_to_dict"] / timings["rows"]
+        print(f"{stage:<14} {'speedup':<14} {speedup:>9.2f}x")
+
+    database.close()
+
+
+###############################################################################
+
+if __name__ == "__main__":
+    main()
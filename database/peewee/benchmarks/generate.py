@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetic DCS Database Generator
+
+Generate a deterministic, DCS-shaped SQLite database for benchmarks, with
+the tables `lexicon`, `texts`, `chapters`, `text_lines` and
+`word_references` (schema from `models.py`), so that `DigitalCorpusSanskrit`
+can be pointed at it (`sqlite:///PATH`).
+
+* Lexicon: synthetic Devanagari words, stored in IAST (`SanskritCharField`)
+* Words: lexicon entries drawn from a Zipfian distribution
+
+Usage:
+    $ python generate.py OUTPUT_PATH [--texts N] [--chapters N] [--lines N]
+                                     [--words N] [--lexicon N] [--seed N]
+"""
+
+###############################################################################
+
+import sys
+import random
+import argparse
+import itertools
+from pathlib import Path
+
+from playhouse.db_url import connect
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+BASE_DIR = BENCHMARKS_DIR.parent
+
+sys.path.insert(0, str(BASE_DIR))
+
+from models import (  # noqa: E402
+    database_proxy,
+    Lexicon,
+    Texts,
+    Chapters,
+    TextLines,
+    WordReferences,
+)
+
+###############################################################################
+
+SYLLABLES = [
+    "क", "रा", "म", "धर्", "मो", "वि", "ष्णु", "शि", "व", "ना", "य", "ते",
+    "सु", "प्र", "भू", "ज्ञा", "नं", "स्य", "ति", "द्",
+]
+GRAMMAR = ["m.", "f.", "n.", "ind.", "adj.", "root"]
+
+TABLES = [Lexicon, Texts, Chapters, TextLines, WordReferences]
+BATCH_SIZE = 500
+
+###############################################################################
+
+
+def generate(
+    output_path,
+    n_texts=3,
+    n_chapters=10,
+    n_lines=100,
+    n_words=8,
+    n_lexicon=5000,
+    seed=0,
+):
+    """Generate a synthetic database (an existing file is replaced)"""
+    rng = random.Random(seed)
+    output_path = Path(output_path)
+    output_path.unlink(missing_ok=True)
+
+    def make_word():
+        return "".join(
+            rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4))
+        )
+
+    # Zipfian weights over lexicon ids
+    weights = list(
+        itertools.accumulate(1 / rank for rank in range(1, n_lexicon + 1))
+    )
+
+    def make_lexicon_id():
+        return rng.choices(range(1, n_lexicon + 1), cum_weights=weights)[0]
+
+    database = connect(f"sqlite:///{output_path}")
+    database_proxy.initialize(database)
+    database.create_tables(TABLES)
+
+    def insert(model, rows):
+        for start in range(0, len(rows), BATCH_SIZE):
+            model.insert_many(rows[start:start + BATCH_SIZE]).execute()
+
+    with database.atomic():
+        insert(
+            Lexicon,
+            [
+                {
+                    "id": lexicon_id,
+                    "word": make_word(),
+                    "grammar": rng.choice(GRAMMAR),
+                    "sortkey": lexicon_id,
+                    "language_id": 1,
+                    "frequency": rng.randint(1, 1000),
+                }
+                for lexicon_id in range(1, n_lexicon + 1)
+            ],
+        )
+
+        chapter_id = line_id = word_id = 0
+        for text_id in range(1, n_texts + 1):
+            Texts.insert(
+                id=text_id,
+                textname=f"Text{text_id}",
+                short=f"T{text_id}",
+                language_id=1,
+                text_completed=1,
+                nr_of_words=n_chapters * n_lines * n_words,
+            ).execute()
+            for position in range(n_chapters):
+                chapter_id += 1
+                Chapters.insert(
+                    id=chapter_id,
+                    text_id=text_id,
+                    name=f"Text{text_id}, {position + 1}",
+                    position=position,
+                ).execute()
+
+                lines = []
+                words = []
+                for index in range(n_lines):
+                    line_id += 1
+                    line_words = [make_lexicon_id() for _ in range(n_words)]
+                    lines.append({
+                        "id": line_id,
+                        "chapter_id": chapter_id,
+                        "line": " ".join(
+                            make_word() for _ in range(n_words)
+                        ),
+                        "stanza": index % 2,
+                        "verse": index // 2,
+                    })
+                    for word_position, lexicon_id in enumerate(line_words):
+                        word_id += 1
+                        words.append({
+                            "id": word_id,
+                            "lexicon_id": lexicon_id,
+                            "sentence_id": line_id,
+                            "position": word_position,
+                            "inner_position": 0,
+                            "absolute_position": word_position,
+                            "case": rng.randint(0, 8),
+                            "gender": rng.randint(0, 3),
+                            "number": rng.randint(0, 3),
+                            "punctuation": 0,
+                        })
+                insert(TextLines, lines)
+                insert(WordReferences, words)
+    database.close()
+    return {
+        "texts": n_texts,
+        "chapters": chapter_id,
+        "lines": line_id,
+        "words": word_id,
+        "lexicon": n_lexicon,
+    }
+
+
+###############################################################################
+
+
+def main():
+    argparser = argparse.ArgumentParser(
+        description="Generate a synthetic DCS database (SQLite)"
+    )
+    argparser.add_argument("output_path", help="path of the SQLite file")
+    argparser.add_argument("--texts", type=int, default=3)
+    argparser.add_argument("--chapters", type=int, default=10)
+    argparser.add_argument("--lines", type=int, default=100)
+    argparser.add_argument("--words", type=int, default=8)
+    argparser.add_argument("--lexicon", type=int, default=5000)
+    argparser.add_argument("--seed", type=int, default=0)
+    args = argparser.parse_args()
+
+    counts = generate(
+        args.output_path,
+        n_texts=args.texts,
+        n_chapters=args.chapters,
+        n_lines=args.lines,
+        n_words=args.words,
+        n_lexicon=args.lexicon,
+        seed=args.seed,
+    )
+    print(", ".join(f"{name}: {count}" for name, count in counts.items()))
+
+
+###############################################################################
+
+if __name__ == "__main__":
+    main()
@@ -9,16 +9,38 @@ back-links.
 `reurse' and `backrefs' options are useful for tracing ForeignKey links.
 http://docs.peewee-orm.com/en/latest/peewee/playhouse.html?highlight=model_to_dict
 
+Functions returning many rows (texts, chapters, lines, verses, words) as
+TYPE_DICT do not create model instances. Rows are read as tuples and
+converted into dictionaries, equal to `model_to_dict(model, recurse=False)`,
+with Sanskrit fields transliterated in batches. (Refer: rows.py)
+
+Lexicon rows can optionally be cached in the process (`lexicon_cache`),
+either by preloading the whole table or in a size-bounded LRU cache.
+(Refer: lexicon_cache.py)
+
+Large exports (e.g., the whole `word_references` table) can be streamed as
+tuples or dictionaries using server-side cursors, with constant memory.
+(Refer: stream.py)
+
+By default, a pooled database is used (e.g., `mysql+pool://` for a
+`mysql://` URL), and connections are scoped by the reentrant `connection`
+decorator, i.e., a call (or an exported generator) holds one connection
+that all nested calls reuse.
+
 Created on Thu Sep 10 21:41:18 2020
 
 @author: Hrishikesh Terdalkar
 """
 
-from playhouse.db_url import connect
+from peewee import JOIN, IntegerField
+from playhouse.db_url import connect, schemes
 from playhouse.shortcuts import model_to_dict
 
-from models import database_proxy, connection
+from models import database_proxy, connection, connection_scope
 from models import Texts, Chapters, TextLines, Lexicon, WordReferences
+from lexicon_cache import LexiconTable, LexiconLRU
+from rows import fetch_rows, iter_rows, ROW_TUPLE, ROW_DICT
+from stream import stream_query, DEFAULT_CHUNK_SIZE
 
 # from models import VerbalDerivation, VerbalFormsFinite, VerbalFormsInfinite
 
@@ -27,24 +49,191 @@ from models import Texts, Chapters, TextLines, Lexicon, WordReferences
 TYPE_DICT = "dict"
 TYPE_MODEL = "model"
 
+POOL_SUFFIX = "+pool"
+
+LEXICON_PRELOAD = "preload"
+LEXICON_BATCH_SIZE = 500
+
+###############################################################################
+
+
+def get_pooled_url(db_url):
+    """Connection URL of the pooled variant of the database (if available)"""
+    scheme, separator, rest = db_url.partition("://")
+    if scheme.endswith(POOL_SUFFIX) or scheme + POOL_SUFFIX not in schemes:
+        return db_url
+    return f"{scheme}{POOL_SUFFIX}{separator}{rest}"
+
+
 ###############################################################################
 
 
 class DigitalCorpusSanskrit:
-    def __init__(self, db_url, output_type=TYPE_DICT):
-        database_proxy.initialize(connect(db_url))
+    def __init__(
+        self,
+        db_url,
+        output_type=TYPE_DICT,
+        pool=True,
+        max_connections=None,
+        stale_timeout=None,
+        lexicon_cache=None,
+    ):
+        """
+        Access DCS from the Database
+
+        Parameters
+        ----------
+        db_url : str
+            Database connection URL
+        output_type : str, optional
+            Can be TYPE_MODEL or TYPE_DICT.
+            The default is TYPE_DICT.
+        pool : bool, optional
+            If True, a pooled database is used (e.g., `mysql+pool://`).
+            The default is True.
+        max_connections : int, optional
+            Maximum number of connections in the pool.
+            The default is None, i.e., the default of `peewee`.
+        stale_timeout : int, optional
+            Seconds after which an idle pooled connection is discarded.
+            The default is None, i.e., the default of `peewee`.
+        lexicon_cache : str or int, optional
+            Cache of Lexicon rows, used by get_lexicon(), get_lexicon_many(),
+            get_word() and the `fetch_lexicon` option of the words functions.
+            If LEXICON_PRELOAD, the whole Lexicon table is loaded (on first
+            use, or using preload_lexicon()) into compact columns.
+            If an integer, at most those many rows are kept in an LRU cache.
+            The default is None, i.e., no cache.
+        """
+        connect_options = {}
+        if pool:
+            db_url = get_pooled_url(db_url)
+            if max_connections is not None:
+                connect_options["max_connections"] = max_connections
+            if stale_timeout is not None:
+                connect_options["stale_timeout"] = stale_timeout
+        database_proxy.initialize(connect(db_url, **connect_options))
         self.output_type = output_type
 
+        lexicon_fields = [field.name for field in Lexicon._meta.sorted_fields]
+        if lexicon_cache is None:
+            self.lexicon_cache = None
+        elif lexicon_cache == LEXICON_PRELOAD:
+            self.lexicon_cache = LexiconTable(
+                lexicon_fields,
+                [
+                    field.name
+                    for field in Lexicon._meta.sorted_fields
+                    if isinstance(field, IntegerField)
+                ],
+            )
+        else:
+            self.lexicon_cache = LexiconLRU(lexicon_fields, lexicon_cache)
+        self._lexicon_loaded = False
+
+    def connection_scope(self):
+        """
+        Connection scope (context manager) spanning multiple calls
+
+        >>> with DCS.connection_scope():
+        ...     for chapter in DCS.get_chapters_from_text(154):
+        ...         ...
+        """
+        return connection_scope()
+
     @connection
     def get_lexicon(self, lexicon_id, output_type=None):
         if output_type is None:
             output_type = self.output_type
-        lexicon = Lexicon.get_by_id(lexicon_id)
+        if self.lexicon_cache is None:
+            lexicon = Lexicon.get_by_id(lexicon_id)
+        else:
+            lexicon = self.get_lexicon_many(
+                [lexicon_id], output_type=TYPE_MODEL
+            ).get(lexicon_id)
+            if lexicon is None:
+                raise Lexicon.DoesNotExist(
+                    f"Lexicon instance matching id {lexicon_id} does not exist"
+                )
         if output_type == TYPE_DICT:
             return model_to_dict(lexicon)
         if output_type == TYPE_MODEL:
             return lexicon
 
+    @connection
+    def get_lexicon_many(self, lexicon_ids, output_type=None):
+        """
+        Get multiple Lexicon entries
+
+        Entries missing from the cache (if any) are fetched using one query
+        per LEXICON_BATCH_SIZE ids.
+
+        Parameters
+        ----------
+        lexicon_ids : iterable
+            Lexicon IDs
+        output_type : str, optional
+            Can be TYPE_MODEL or TYPE_DICT.
+            The default is TYPE_DICT.
+
+        Returns
+        -------
+        dict
+            Lexicon entries (object or dict) by id.
+            IDs not present in the Lexicon table are omitted.
+        """
+        if output_type is None:
+            output_type = self.output_type
+
+        cache = self.lexicon_cache
+        if cache is None:
+            rows = {}
+            missing = list(dict.fromkeys(lexicon_ids))
+        else:
+            if isinstance(cache, LexiconTable) and not self._lexicon_loaded:
+                self.preload_lexicon()
+            rows, missing = cache.get_many(lexicon_ids)
+
+        for start in range(0, len(missing), LEXICON_BATCH_SIZE):
+            batch = missing[start:start + LEXICON_BATCH_SIZE]
+            fetched = list(
+                Lexicon.select().where(Lexicon.id.in_(batch)).dicts()
+            )
+            if cache is not None:
+                cache.add(fetched)
+            rows.update((row["id"], row) for row in fetched)
+
+        if output_type == TYPE_DICT:
+            return rows
+        if output_type == TYPE_MODEL:
+            return {
+                lexicon_id: self._lexicon_model(row)
+                for lexicon_id, row in rows.items()
+            }
+
+    @connection
+    def preload_lexicon(self):
+        """Load the whole Lexicon table into the cache (LEXICON_PRELOAD)"""
+        if not isinstance(self.lexicon_cache, LexiconTable):
+            raise ValueError("Preloading requires lexicon_cache='preload'")
+        self.lexicon_cache.load(
+            Lexicon.select().order_by(Lexicon.id).dicts().iterator()
+        )
+        self._lexicon_loaded = True
+
+    def lexicon_cache_info(self):
+        """Statistics of the Lexicon cache (hits, misses, maxsize, currsize)"""
+        if self.lexicon_cache is None:
+            return None
+        return self.lexicon_cache.cache_info()
+
+    @staticmethod
+    def _lexicon_model(row):
+        """Lexicon object from a row, without querying the database"""
+        lexicon = Lexicon(**row)
+        lexicon._dirty.clear()
+        return lexicon
+
     # ----------------------------------------------------------------------- #
 
     @connection
@@ -59,7 +248,7 @@ class DigitalCorpusSanskrit:
             Texts.nr_of_words,
         ]
         if output_type == TYPE_DICT:
-            texts = (model_to_dict(text, only=fields) for text in Texts)
+            texts = fetch_rows(Texts.select(*fields))
         if output_type == TYPE_MODEL:
             texts = Texts.select()
         return texts
@@ -82,10 +271,7 @@ class DigitalCorpusSanskrit:
             output_type = self.output_type
         text = Texts.get_by_id(text_id)
         if output_type == TYPE_DICT:
-            chapters = (
-                model_to_dict(chapter, recurse=False)
-                for chapter in text.chapters.order_by(Chapters.position)
-            )
+            chapters = fetch_rows(text.chapters.order_by(Chapters.position))
         if output_type == TYPE_MODEL:
             chapters = text.chapters.order_by(Chapters.position)
         return chapters
@@ -108,11 +294,8 @@ class DigitalCorpusSanskrit:
             output_type = self.output_type
         chapter = Chapters.get_by_id(chapter_id)
         if output_type == TYPE_DICT:
-            lines = (
-                model_to_dict(line, recurse=False)
-                for line in chapter.lines.order_by(
-                    TextLines.verse, TextLines.stanza
-                )
+            lines = fetch_rows(
+                chapter.lines.order_by(TextLines.verse, TextLines.stanza)
             )
         if output_type == TYPE_MODEL:
             lines = chapter.lines.order_by(TextLines.verse, TextLines.stanza)
@@ -145,16 +328,16 @@ class DigitalCorpusSanskrit:
     def get_verses_from_chapter(self, chapter_id, output_type=None):
         if output_type is None:
             output_type = self.output_type
-        lines = self.get_lines_from_chapter(chapter_id, output_type=TYPE_MODEL)
+        lines = self.get_lines_from_chapter(chapter_id, output_type)
         verse = []
 
         if output_type == TYPE_DICT:
             for line in lines:
-                if not verse or verse[-1]["verse"] == line.verse:
-                    verse.append(model_to_dict(line, recurse=False))
+                if not verse or verse[-1]["verse"] == line["verse"]:
+                    verse.append(line)
                 else:
                     yield verse
-                    verse = [model_to_dict(line, recurse=False)]
+                    verse = [line]
             yield verse
 
         if output_type == TYPE_MODEL:
@@ -192,7 +375,12 @@ class DigitalCorpusSanskrit:
             Line ID
         fetch_lexicon : bool, optional
             If True, the lexcial information from Lexicon table is fetched
-            This option is only valid with output_type TYPE_DICT.
+            along with the words (using a JOIN).
+            With output_type TYPE_DICT, the fields "word" and "grammar" are
+            added to every word. With output_type TYPE_MODEL, `lexicon_id`
+            of every word is the Lexicon object, i.e., accessing it does
+            not run another query.
+            Words without a Lexicon entry get None instead.
             The default is False.
         output_type : str, optional
             Can be TYPE_MODEL or TYPE_DICT.
@@ -207,23 +395,17 @@ class DigitalCorpusSanskrit:
         if output_type is None:
             output_type = self.output_type
         line = TextLines.get_by_id(line_id)
-        words = line.words.order_by(
-            WordReferences.absolute_position, WordReferences.inner_position
+        words = (
+            self._select_words(fetch_lexicon, output_type)
+            .where(WordReferences.sentence_id == line.id)
+            .order_by(
+                WordReferences.absolute_position,
+                WordReferences.inner_position,
+            )
         )
         if output_type == TYPE_DICT:
-            if fetch_lexicon:
-                output = []
-                for word in words:
-                    word_model = model_to_dict(word, False)
-                    word_lexicon = self.get_lexicon(word_model["lexicon_id"])
-                    word_model["word"] = word_lexicon["word"]
-                    word_model["grammar"] = word_lexicon["grammar"]
-                    output.append(word_model)
-                return output
-            else:
-                return [model_to_dict(word, False) for word in words]
-        if output_type == TYPE_MODEL:
-            return words
+            words = fetch_rows(words)
+        return self._prepare_words(words, fetch_lexicon, output_type)
 
     @connection
     def get_words_from_verse(
@@ -235,19 +417,170 @@ class DigitalCorpusSanskrit:
         A verse is a list of lines.
         In this function, a line is assumed to be in the model format.
         i.e. lines is an iterable of <TextLines: ..> objects
+
+        Words of all the lines are fetched using a single query.
+        (Refer: get_words_from_line())
         """
         if output_type is None:
             output_type = self.output_type
-        return [
-            word
-            for line in lines
-            for word in self.get_words_from_line(
-                line.id, fetch_lexicon=fetch_lexicon, output_type=output_type
+        line_ids = [line.id for line in lines]
+        line_words = {line_id: [] for line_id in line_ids}
+        words = (
+            self._select_words(fetch_lexicon, output_type)
+            .where(WordReferences.sentence_id.in_(list(line_words)))
+            .order_by(
+                WordReferences.absolute_position,
+                WordReferences.inner_position,
             )
-        ]
+        )
+        for word in self._iter_words(words, output_type):
+            line_words[self._get_line_id(word)].append(word)
+        return self._prepare_words(
+            [word for line_id in line_ids for word in line_words[line_id]],
+            fetch_lexicon,
+            output_type,
+        )
 
     # ----------------------------------------------------------------------- #
 
+    def _select_words(self, fetch_lexicon=False, output_type=None):
+        """
+        Query for words, optionally joined with their Lexicon entries
+
+        For TYPE_DICT, only the "word" and "grammar" fields of the Lexicon
+        are selected. If the Lexicon is cached, entries are taken from the
+        cache instead. (Refer: _prepare_words())
+        """
+        if not fetch_lexicon or self.lexicon_cache is not None:
+            return WordReferences.select()
+        if output_type == TYPE_DICT:
+            fields = [Lexicon.word, Lexicon.grammar]
+        else:
+            fields = [Lexicon]
+        return WordReferences.select(WordReferences, *fields).join_from(
+            WordReferences, Lexicon, JOIN.LEFT_OUTER
+        )
+
+    @staticmethod
+    def _iter_words(words, output_type=None):
+        """Execute a query for words (dicts for TYPE_DICT, else objects)"""
+        if output_type == TYPE_DICT:
+            return iter_rows(words)
+        return words.iterator()
+
+    @staticmethod
+    def _get_line_id(word):
+        """Line ID of a word (dict or object)"""
+        if isinstance(word, dict):
+            return word["sentence_id"]
+        return word.sentence_id_id
+
+    def _prepare_words(self, words, fetch_lexicon=False, output_type=None):
+        """
+        Prepare words for output
+
+        Words are dicts (rows) for TYPE_DICT, and WordReferences objects for
+        TYPE_MODEL. If `fetch_lexicon` is True, the words must have been
+        selected along with their Lexicon entries (Refer: _select_words()),
+        unless the Lexicon is cached, in which case the entries of all the
+        words are resolved at once from the cache.
+        """
+        if not fetch_lexicon or self.lexicon_cache is None:
+            return words
+
+        if output_type == TYPE_DICT:
+            lexicons = self.get_lexicon_many(
+                [word["lexicon_id"] for word in words], output_type=TYPE_DICT
+            )
+            for word in words:
+                lexicon = lexicons.get(word["lexicon_id"], {})
+                word["word"] = lexicon.get("word")
+                word["grammar"] = lexicon.get("grammar")
+        if output_type == TYPE_MODEL:
+            words = list(words)
+            lexicons = self.get_lexicon_many(
+                [word.lexicon_id_id for word in words], output_type=TYPE_MODEL
+            )
+            for word in words:
+                lexicon = lexicons.get(word.lexicon_id_id)
+                if lexicon is None:
+                    # same as the JOIN, i.e., absent entry, id intact
+                    word.__rel__["lexicon_id"] = None
+                else:
+                    word.lexicon_id = lexicon
+        return words
+
+    def _iter_line_words(
+        self, chapter_id, fetch_lexicon=False, output_type=None
+    ):
+        """
+        Lines of a chapter along with their words, using two queries
+
+        Lines and words (joined with their lines) are fetched in the same
+        order, and words are grouped into lines as they are read.
+
+        Yields
+        ------
+        tuple
+            ((line_id, verse), words), i.e., line and list of words
+            (dicts or WordReferences objects, as per output_type), for every
+            line in the order of get_lines_from_chapter()
+        """
+        line_order = [TextLines.verse, TextLines.stanza, TextLines.id]
+        lines = (
+            TextLines.select(TextLines.id, TextLines.verse)
+            .where(TextLines.chapter_id == chapter_id)
+            .order_by(*line_order)
+            .tuples()
+        )
+        words = (
+            self._select_words(fetch_lexicon, output_type)
+            .join_from(WordReferences, TextLines)
+            .where(TextLines.chapter_id == chapter_id)
+            .order_by(
+                *line_order,
+                WordReferences.absolute_position,
+                WordReferences.inner_position,
+            )
+        )
+
+        words = self._iter_words(words, output_type)
+        word = next(words, None)
+        for line_id, verse in lines.iterator():
+            line_words = []
+            while word is not None and self._get_line_id(word) == line_id:
+                line_words.append(word)
+                word = next(words, None)
+            yield (line_id, verse), line_words
+
+    def _iter_chapter_words(
+        self, chapter_id, group_verse=False, fetch_lexicon=False,
+        output_type=None
+    ):
+        """Words from a chapter (Refer: get_words_from_chapter())"""
+        line_words = self._iter_line_words(
+            chapter_id, fetch_lexicon, output_type
+        )
+        if not group_verse:
+            for _, words in line_words:
+                yield self._prepare_words(words, fetch_lexicon, output_type)
+            return
+
+        # NOTE: verse == lines with the same `verse` value, in sequence
+        # (same as get_verses_from_chapter(), which yields an empty verse
+        # for a chapter without lines)
+        verse = None
+        verse_words = []
+        for index, ((_, line_verse), words) in enumerate(line_words):
+            if index and line_verse != verse:
+                yield self._prepare_words(
+                    verse_words, fetch_lexicon, output_type
+                )
+                verse_words = []
+            verse = line_verse
+            verse_words.extend(words)
+        yield self._prepare_words(verse_words, fetch_lexicon, output_type)
+
     @connection
     def get_words_from_chapter(
         self,
@@ -259,6 +592,8 @@ class DigitalCorpusSanskrit:
         """
         Get Words from a chapter
 
+        Lines and words of the chapter are fetched using two queries,
+        and words are grouped by line (or verse) as they are read.
 
         Parameters
         ----------
@@ -266,11 +601,10 @@ class DigitalCorpusSanskrit:
             Chapter ID
         group_verse : bool, optional
             If True, the words from a verse are grouped together.
-            Internally, this implies calling get_words_from_verse() function
-            instead of calling get_words_from_line().
             The default is False.
         fetch_lexicon : bool, optional
-            Argument is passed as is to the yielding function.
+            If True, the lexcial information from Lexicon table is fetched
+            along with the words. (Refer: get_words_from_line())
             The default is False.
         output_type : str, optional
             Can be TYPE_MODEL or TYPE_DICT.
@@ -285,24 +619,13 @@ class DigitalCorpusSanskrit:
         """
         if output_type is None:
             output_type = self.output_type
-        if group_verse:
-            verses = self.get_verses_from_chapter(
-                chapter_id, output_type=TYPE_MODEL
-            )
-            for verse in verses:
-                yield self.get_words_from_verse(
-                    verse, fetch_lexicon=fetch_lexicon, output_type=output_type
-                )
-        else:
-            lines = self.get_lines_from_chapter(
-                chapter_id, output_type=TYPE_MODEL
-            )
-            for line in lines:
-                yield self.get_words_from_line(
-                    line.id,
-                    fetch_lexicon=fetch_lexicon,
-                    output_type=output_type,
-                )
+        chapter = Chapters.get_by_id(chapter_id)
+        yield from self._iter_chapter_words(
+            chapter.id,
+            group_verse=group_verse,
+            fetch_lexicon=fetch_lexicon,
+            output_type=output_type,
+        )
 
     @connection
     def get_words_from_text(
@@ -311,17 +634,19 @@ class DigitalCorpusSanskrit:
         """
         Get words from a text
 
+        Every chapter is fetched using two queries.
+        (Refer: get_words_from_chapter())
+
         Parameters
         ----------
         text_id : int
             Text ID
         group_verse : bool, optional
             If True, the words from a verse are grouped together.
-            Internally, this implies calling get_words_from_verse() function
-            instead of calling get_words_from_line().
             The default is False.
         fetch_lexicon : bool, optional
-            Argument is passed as is to the yielding function.
+            If True, the lexcial information from Lexicon table is fetched
+            along with the words. (Refer: get_words_from_line())
             The default is False.
         output_type : str, optional
             Can be TYPE_MODEL or TYPE_DICT.
@@ -335,21 +660,15 @@ class DigitalCorpusSanskrit:
         """
         if output_type is None:
             output_type = self.output_type
-        if group_verse:
-            verses = self.get_verses_from_text(text_id, output_type=TYPE_MODEL)
-            for verse in verses:
-                yield self.get_words_from_verse(
-                    verse, fetch_lexicon=fetch_lexicon, output_type=output_type
-                )
-        else:
-            for line in self.get_lines_from_text(
-                text_id, output_type=TYPE_MODEL
-            ):
-                yield self.get_words_from_line(
-                    line.id,
-                    fetch_lexicon=fetch_lexicon,
-                    output_type=output_type,
-                )
+        for chapter in self.get_chapters_from_text(
+            text_id, output_type=TYPE_MODEL
+        ):
+            yield from self._iter_chapter_words(
+                chapter.id,
+                group_verse=group_verse,
+                fetch_lexicon=fetch_lexicon,
+                output_type=output_type,
+            )
 
     # ----------------------------------------------------------------------- #
 
@@ -379,12 +698,155 @@ class DigitalCorpusSanskrit:
         if output_type is None:
             output_type = self.output_type
         word = WordReferences.get_by_id(word_id)
+        if recurse and self.lexicon_cache is not None:
+            lexicon = self.get_lexicon_many(
+                [word.lexicon_id_id], output_type=TYPE_MODEL
+            ).get(word.lexicon_id_id)
+            if lexicon is not None:
+                word.lexicon_id = lexicon
         if output_type == TYPE_DICT:
             return model_to_dict(word, recurse=recurse, max_depth=1)
 
         if output_type == TYPE_MODEL:
             return word
 
+    # ----------------------------------------------------------------------- #
+    # Streaming (server-side cursors)
+
+    @connection
+    def stream_words(
+        self, text_id=None, chunk_size=DEFAULT_CHUNK_SIZE, row_type=ROW_TUPLE
+    ):
+        """
+        Stream words (rows of WordReferences)
+
+        Rows are read from a server-side cursor in chunks, hence memory
+        usage does not depend on the number of words.
+        The connection must not be used for other queries until the stream
+        is exhausted (or closed).
+
+        Parameters
+        ----------
+        text_id : int, optional
+            If provided, words of the text are streamed in the text order
+            (same as get_words_from_text()).
+            If None, all words are streamed in the order of their ids.
+            The default is None.
+        chunk_size : int, optional
+            Number of rows fetched at a time.
+            The default is DEFAULT_CHUNK_SIZE.
+        row_type : str, optional
+            Can be ROW_TUPLE or ROW_DICT.
+            Dictionaries have the same keys as the TYPE_DICT output of
+            get_words_from_line() (without `fetch_lexicon`).
+            The default is ROW_TUPLE.
+
+        Yields
+        ------
+        tuple or dict
+            Word
+        """
+        query = WordReferences.select()
+        if text_id is None:
+            query = query.order_by(WordReferences.id)
+        else:
+            query = (
+                query.join(TextLines)
+                .join(Chapters)
+                .where(Chapters.text_id == text_id)
+                .order_by(
+                    Chapters.position,
+                    Chapters.id,
+                    TextLines.verse,
+                    TextLines.stanza,
+                    TextLines.id,
+                    WordReferences.absolute_position,
+                    WordReferences.inner_position,
+                )
+            )
+        yield from stream_query(query, chunk_size, row_type)
+
+    @connection
+    def stream_lines(
+        self, text_id=None, chunk_size=DEFAULT_CHUNK_SIZE, row_type=ROW_TUPLE
+    ):
+        """
+        Stream lines (rows of TextLines)
+
+        Lines are ordered by chapter, and in the order of
+        get_lines_from_chapter() within a chapter.
+        (Refer: stream_words())
+
+        Parameters
+        ----------
+        text_id : int, optional
+            If provided, only the lines of the text are streamed, with
+            chapters in the order of their positions.
+            If None, all lines are streamed, with chapters in the order of
+            their ids.
+            The default is None.
+        chunk_size : int, optional
+            Number of rows fetched at a time.
+            The default is DEFAULT_CHUNK_SIZE.
+        row_type : str, optional
+            Can be ROW_TUPLE or ROW_DICT.
+            The default is ROW_TUPLE.
+
+        Yields
+        ------
+        tuple or dict
+            Line
+        """
+        line_order = [TextLines.verse, TextLines.stanza, TextLines.id]
+        query = TextLines.select()
+        if text_id is None:
+            query = query.order_by(TextLines.chapter_id, *line_order)
+        else:
+            query = (
+                query.join(Chapters)
+                .where(Chapters.text_id == text_id)
+                .order_by(Chapters.position, Chapters.id, *line_order)
+            )
+        yield from stream_query(query, chunk_size, row_type)
+
+    @connection
+    def stream_verses(
+        self, text_id=None, chunk_size=DEFAULT_CHUNK_SIZE, row_type=ROW_TUPLE
+    ):
+        """
+        Stream verses, i.e., lists of consecutive lines of a chapter with
+        the same `verse` value
+
+        Only one verse is held in memory at a time.
+        Unlike get_verses_from_chapter(), no verse is yielded for a chapter
+        without lines. (Refer: stream_lines())
+
+        Yields
+        ------
+        list
+            Verse (list of lines as tuples or dicts)
+        """
+        if row_type == ROW_DICT:
+            chapter_key, verse_key = "chapter_id", "verse"
+        else:
+            names = [field.name for field in TextLines._meta.sorted_fields]
+            chapter_key, verse_key = (
+                names.index("chapter_id"),
+                names.index("verse"),
+            )
+
+        verse = []
+        for line in self.stream_lines(text_id, chunk_size, row_type):
+            if verse and (
+                verse[-1][chapter_key] != line[chapter_key]
+                or verse[-1][verse_key] != line[verse_key]
+            ):
+                yield verse
+                verse = []
+            verse.append(line)
+        if verse:
+            yield verse
+
 
 ###############################################################################
 
@@ -73,7 +73,9 @@ chapters = DCS.get_chapters_from_text(text_id)
 words = [
     [word.lexicon_id.word for word in line]
     for chapter in tqdm(chapters)
-    for line in DCS.get_words_from_chapter(chapter, group_verse=True)
+    for line in DCS.get_words_from_chapter(
+        chapter, group_verse=True, fetch_lexicon=True
+    )
 ]
 
 with open(EXAMPLES_DIR / f"words_{text_id}.json", "w") as f:
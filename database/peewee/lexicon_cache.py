@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+In-process Cache of Lexicon Rows
+
+Lexicon rows are small, immutable and looked up constantly (lemmas of
+words), hence they are worth keeping in the process, already transliterated.
+
+Two kinds of caches are available, with the same interface,
+* LexiconTable: the whole Lexicon table, preloaded into compact columns
+  (`array` for integers, interned strings), with ids kept sorted for lookup
+  by binary search
+* LexiconLRU: a size-bounded cache with least-recently-used eviction, for
+  memory-constrained workers
+
+Rows are dictionaries with the values of the fields of the Lexicon model, as
+returned by `Lexicon.select().dicts()` (i.e., with `python_value()` applied).
+"""
+
+import sys
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict, namedtuple
+
+###############################################################################
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# Stand-in for NULL in integer columns
+NULL = -(2 ** 63)
+
+###############################################################################
+
+
+class LexiconCache:
+    def __init__(self, fields):
+        """
+        Base Class of Lexicon Caches
+
+        Parameters
+        ----------
+        fields : list
+            Names of the fields of a row (the first one being the id)
+        """
+        self.fields = list(fields)
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, ids):
+        """
+        Get Cached Rows
+
+        Parameters
+        ----------
+        ids : iterable
+            Lexicon IDs
+
+        Returns
+        -------
+        rows : dict
+            Rows found in the cache, by id
+        missing : list
+            IDs not found in the cache (without duplicates)
+        """
+        rows = {}
+        missing = {}
+        for lexicon_id in ids:
+            if lexicon_id in rows or lexicon_id in missing:
+                continue
+            row = self._get(lexicon_id)
+            if row is None:
+                missing[lexicon_id] = None
+            else:
+                rows[lexicon_id] = row
+        self.hits += len(rows)
+        self.misses += len(missing)
+        return rows, list(missing)
+
+    def get(self, lexicon_id):
+        rows, _ = self.get_many([lexicon_id])
+        return rows.get(lexicon_id)
+
+    def add(self, rows):
+        """Add rows (dictionaries) fetched from the database"""
+        raise NotImplementedError
+
+    def clear(self):
+        """Discard all rows and statistics"""
+        self.hits = 0
+        self.misses = 0
+
+    def cache_info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+    def _get(self, lexicon_id):
+        raise NotImplementedError
+
+    @property
+    def maxsize(self):
+        return None
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.cache_info()})"
+
+
+###############################################################################
+
+
+class LexiconTable(LexiconCache):
+    def __init__(self, fields, int_fields):
+        """
+        Lexicon Table Preloaded into Compact Columns
+
+        Parameters
+        ----------
+        fields : list
+            Names of the fields of a row (the first one being the id)
+        int_fields : list
+            Names of the integer fields, which are stored as arrays.
+            The remaining fields are stored as lists of interned strings.
+        """
+        super().__init__(fields)
+        self.int_fields = set(int_fields)
+        self.clear()
+
+    def clear(self):
+        super().clear()
+        self.columns = {
+            field: array("q") if field in self.int_fields else []
+            for field in self.fields
+        }
+
+    def load(self, rows):
+        """Replace the contents of the table by the rows"""
+        self.clear()
+        self.add(rows)
+
+    def add(self, rows):
+        """
+        Add rows
+
+        Rows are expected in the order of their ids (e.g., as read from the
+        database with `ORDER BY id`), otherwise the columns are re-sorted.
+        """
+        ids = self.columns[self.fields[0]]
+        last_id = ids[-1] if ids else None
+        is_sorted = True
+        for row in rows:
+            lexicon_id = row[self.fields[0]]
+            if last_id is not None and lexicon_id <= last_id:
+                is_sorted = False
+            last_id = lexicon_id
+            for field in self.fields:
+                value = row[field]
+                if field in self.int_fields:
+                    value = NULL if value is None else value
+                elif isinstance(value, str):
+                    value = sys.intern(value)
+                self.columns[field].append(value)
+        if not is_sorted:
+            self._sort()
+
+    def _sort(self):
+        ids = self.columns[self.fields[0]]
+        order = sorted(range(len(ids)), key=ids.__getitem__)
+        # NOTE: the last duplicate of an id wins
+        unique = {ids[index]: index for index in order}
+        order = list(unique.values())
+        for field, values in self.columns.items():
+            sorted_values = [values[index] for index in order]
+            self.columns[field] = (
+                array("q", sorted_values)
+                if field in self.int_fields
+                else sorted_values
+            )
+
+    def _get(self, lexicon_id):
+        ids = self.columns[self.fields[0]]
+        index = bisect_left(ids, lexicon_id)
+        if index == len(ids) or ids[index] != lexicon_id:
+            return None
+        row = {}
+        for field in self.fields:
+            value = self.columns[field][index]
+            if field in self.int_fields and value == NULL:
+                value = None
+            row[field] = value
+        return row
+
+    def __len__(self):
+        return len(self.columns[self.fields[0]])
+
+
+###############################################################################
+
+
+class LexiconLRU(LexiconCache):
+    def __init__(self, fields, maxsize):
+        """
+        Size-bounded Lexicon Cache with LRU Eviction
+
+        Parameters
+        ----------
+        fields : list
+            Names of the fields of a row (the first one being the id)
+        maxsize : int
+            Maximum number of rows
+        """
+        super().__init__(fields)
+        self._maxsize = maxsize
+        self.rows = OrderedDict()
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def clear(self):
+        super().clear()
+        self.rows = OrderedDict()
+
+    def add(self, rows):
+        for row in rows:
+            row = tuple(row[field] for field in self.fields)
+            self.rows[row[0]] = row
+            self.rows.move_to_end(row[0])
+            if len(self.rows) > self._maxsize:
+                self.rows.popitem(last=False)
+
+    def _get(self, lexicon_id):
+        row = self.rows.get(lexicon_id)
+        if row is None:
+            return None
+        self.rows.move_to_end(lexicon_id)
+        return dict(zip(self.fields, row))
+
+    def __len__(self):
+        return len(self.rows)
+
+
+###############################################################################
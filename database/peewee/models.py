@@ -19,9 +19,26 @@ The python_value() function enables us to display relevant fields from search
 results in Devanagari.
 Similarly, the db_value() function enables us to search relevant fields in
 Devanagari.
+Transliteration goes through the shared (LRU) transliteration cache from
+`common/transliteration.py`.
+
+`connection` (and `connection_scope()`) are reentrant. The outermost call
+connects (or takes a connection from the pool) and the connection is reused
+by all nested calls until the outermost call returns, or, if it returns a
+generator, until the generator is exhausted (or closed), i.e., the
+generator runs on the same connection as the call that created it.
+A generator function connects on its first iteration.
+Scopes are counted per thread. A scope is released against the thread that
+opened it, even if it is exited in another thread (e.g., a generator
+finished by a worker); the connection of that thread is then closed by its
+next outermost scope.
 """
 
+import inspect
 import functools
+import threading
+from contextlib import contextmanager, ExitStack
+
 from peewee import (
     DatabaseProxy,
     Model,
@@ -32,25 +49,132 @@ from peewee import (
     AutoField,
     ForeignKeyField,
 )
-from indic_transliteration.sanscript import transliterate
+
+import common_path  # noqa: F401
+from transliteration import transliterate
 
 database_proxy = DatabaseProxy()
 
+# connection state (depth of nested connection scopes) of every thread
+_connection_local = threading.local()
+
 ###############################################################################
 
 
+class ConnectionState:
+    def __init__(self):
+        """Depth of the nested connection scopes of a thread"""
+        self.thread_id = threading.get_ident()
+        self.depth = 0
+
+
+def get_connection_state() -> ConnectionState:
+    """Connection state of the current thread"""
+    state = getattr(_connection_local, "state", None)
+    if state is None:
+        state = _connection_local.state = ConnectionState()
+    return state
+
+
+@contextmanager
+def connection_scope():
+    """
+    Reentrant connection scope
+
+    The outermost scope of a thread connects to the database (reusing an
+    open connection, if any) and closes the connection on exit, which
+    returns it to the pool in case of a pooled database. Nested scopes
+    reuse the connection.
+
+    The scope is released against the state of the thread that opened it.
+    If it is exited in another thread, the connection (which belongs to
+    the opening thread) is left open, to be closed by the next outermost
+    scope of that thread.
+    """
+    state = get_connection_state()
+    if state.depth == 0:
+        database_proxy.obj.connect(reuse_if_open=True)
+    state.depth += 1
+    try:
+        yield database_proxy.obj
+    finally:
+        state.depth -= 1
+        if state.depth == 0 and state.thread_id == threading.get_ident():
+            database_proxy.obj.close()
+
+
+class ScopedGenerator:
+    def __init__(self, generator, scope):
+        """
+        Generator holding a connection scope
+
+        The scope (already entered) is exited when the generator is
+        exhausted, closed, raises, or is garbage collected, in any thread.
+
+        Parameters
+        ----------
+        generator : generator
+            Generator returned by a function
+        scope : ExitStack
+            Exit stack with the connection scope of the function call
+        """
+        self.generator = generator
+        self.scope = scope
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self.generator)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        scope, self.scope = self.scope, None
+        if scope is None:
+            return
+        try:
+            self.generator.close()
+        finally:
+            scope.close()
+
+    def __del__(self):
+        self.close()
+
+
 def connection(func):
-    """Connect to a database before function call and exit afterwards"""
+    """
+    Connect to a database before function call and exit afterwards
+
+    Calls are reentrant, i.e., nested calls reuse the connection of the
+    outermost call.
+    If the function returns a generator, the connection of the call is
+    held by the generator until it is exhausted (or closed).
+    If the function itself is a generator function, the connection is
+    taken on the first iteration and held until the generator is exhausted.
+    """
+
+    # ----------------------------------------------------------------------- #
+    if inspect.isgeneratorfunction(func):
+
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            with connection_scope():
+                yield from func(*args, **kwargs)
+
+        return generator_wrapper
 
     # ----------------------------------------------------------------------- #
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        database_proxy.obj.close()
-        database_proxy.obj.connect()
-        try:
+        with ExitStack() as stack:
+            stack.enter_context(connection_scope())
             result = func(*args, **kwargs)
-        finally:
-            database_proxy.obj.close()
+            if inspect.isgenerator(result):
+                # hand the (entered) scope over to the generator
+                return ScopedGenerator(result, stack.pop_all())
         return result
 
     # ----------------------------------------------------------------------- #
@@ -70,17 +194,25 @@ class BaseModel(Model):
 
 class SanskritCharField(CharField):
     def db_value(self, value):
+        if value is None:
+            return value
         return transliterate(value, "devanagari", "iast")
 
     def python_value(self, value):
+        if value is None:
+            return value
         return transliterate(value, "iast", "devanagari")
 
 
 class SanskritTextField(TextField):
     def db_value(self, value):
+        if value is None:
+            return value
         return transliterate(value, "devanagari", "iast")
 
     def python_value(self, value):
+        if value is None:
+            return value
         return transliterate(value, "iast", "devanagari")
 
 
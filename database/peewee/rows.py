@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fast Row Serialisation
+
+`playhouse.shortcuts.model_to_dict()` needs a model instance for every row,
+and introspects the fields of the model again for every row. For queries
+returning many rows (lines, words), the rows are instead read straight from
+the cursor as tuples, and converted into tuples or dictionaries (keyed by
+field names, same as `model_to_dict(model, recurse=False)`).
+
+Only Sanskrit fields (`SanskritCharField`, `SanskritTextField`) need a
+conversion (transliteration). It is applied in batches, i.e., once per
+distinct value in every chunk of rows.
+"""
+
+from models import SanskritCharField, SanskritTextField
+
+###############################################################################
+
+ROW_TUPLE = "tuple"
+ROW_DICT = "dict"
+
+DEFAULT_CHUNK_SIZE = 10000
+
+###############################################################################
+
+
+def get_converters(fields):
+    """(column index, python_value) of every Sanskrit field"""
+    return [
+        (index, field.python_value)
+        for index, field in enumerate(fields)
+        if isinstance(field, (SanskritCharField, SanskritTextField))
+    ]
+
+
+def convert_rows(rows, names, converters, row_type=ROW_DICT):
+    """
+    Convert a chunk of rows (tuples) read from a cursor
+
+    Parameters
+    ----------
+    rows : list
+        Rows (tuples of column values)
+    names : list
+        Names of the columns
+    converters : list
+        (column index, function) for every column to convert.
+        Every function is called once per distinct value.
+    row_type : str, optional
+        Can be ROW_TUPLE or ROW_DICT.
+        The default is ROW_DICT.
+
+    Returns
+    -------
+    list
+        Converted rows
+    """
+    if converters and rows:
+        columns = [list(column) for column in zip(*rows)]
+        for index, converter in converters:
+            values = columns[index]
+            converted = {value: converter(value) for value in set(values)}
+            columns[index] = [converted[value] for value in values]
+        rows = zip(*columns)
+
+    if row_type == ROW_DICT:
+        return [dict(zip(names, row)) for row in rows]
+    if row_type == ROW_TUPLE:
+        return [tuple(row) for row in rows]
+    raise ValueError(f"Invalid row type: '{row_type}'")
+
+
+def iter_cursor(
+    cursor, fields, chunk_size=DEFAULT_CHUNK_SIZE, row_type=ROW_DICT
+):
+    """Rows of an executed cursor, fetched and converted in chunks"""
+    if row_type not in [ROW_TUPLE, ROW_DICT]:
+        raise ValueError(f"Invalid row type: '{row_type}'")
+    names = [field.name for field in fields]
+    converters = get_converters(fields)
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        yield from convert_rows(rows, names, converters, row_type)
+
+
+###############################################################################
+
+
+def iter_rows(query, row_type=ROW_DICT, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Rows of a query, without creating model instances
+
+    Parameters
+    ----------
+    query : peewee.Select
+        Query selecting model fields
+    row_type : str, optional
+        Can be ROW_TUPLE or ROW_DICT (keyed by field names).
+        The default is ROW_DICT.
+    chunk_size : int, optional
+        Number of rows fetched and converted at a time.
+        The default is DEFAULT_CHUNK_SIZE.
+
+    Yields
+    ------
+    tuple or dict
+        Rows of the query
+    """
+    sql, params = query.sql()
+    cursor = query.model._meta.database.execute_sql(sql, params)
+    try:
+        yield from iter_cursor(
+            cursor, query.selected_columns, chunk_size, row_type
+        )
+    finally:
+        cursor.close()
+
+
+def fetch_rows(query, row_type=ROW_DICT):
+    """All rows of a query as a list (Refer: iter_rows())"""
+    return list(iter_rows(query, row_type))
+
+
+###############################################################################
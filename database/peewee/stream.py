@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming of Query Results using Server-side Cursors
+
+A regular (buffered) MySQL cursor transfers the complete result set to the
+client before the first row is returned, and peewee then creates a model
+instance for every row. `stream_query()` instead executes a query on an
+unbuffered (server-side) cursor, fetches rows in chunks of bounded size, and
+yields lightweight tuples or dictionaries, i.e., memory usage does not
+depend on the size of the result.
+
+Server-side cursors are used for the MySQL drivers `pymysql`, `MySQLdb`
+(mysqlclient) and `mysql.connector`. SQLite cursors step through the result
+lazily anyway. Other drivers use a regular cursor (with chunked fetching).
+
+NOTE: A MySQL connection can not run other queries while a server-side
+cursor is being read. Hence, the connection should not be used for other
+queries until the stream has been exhausted (or closed).
+"""
+
+from rows import iter_cursor, ROW_TUPLE, DEFAULT_CHUNK_SIZE
+
+###############################################################################
+
+
+def server_side_cursor(database):
+    """Unbuffered cursor on the current connection of the database"""
+    connection = database.connection()
+    driver = type(connection).__module__.split(".")[0]
+    if driver == "pymysql":
+        from pymysql.cursors import SSCursor
+
+        return connection.cursor(SSCursor)
+    if driver == "MySQLdb":
+        from MySQLdb.cursors import SSCursor
+
+        return connection.cursor(SSCursor)
+    if driver == "mysql":
+        # mysql.connector cursors are unbuffered by default
+        return connection.cursor(buffered=False)
+    return database.cursor()
+
+
+def stream_query(query, chunk_size=DEFAULT_CHUNK_SIZE, row_type=ROW_TUPLE):
+    """
+    Stream the results of a query
+
+    Parameters
+    ----------
+    query : peewee.Select
+        Query selecting model fields.
+        Values of Sanskrit fields are transliterated (Refer: rows.py),
+        other values are returned as provided by the database driver.
+    chunk_size : int, optional
+        Number of rows fetched from the cursor at a time.
+        The default is DEFAULT_CHUNK_SIZE.
+    row_type : str, optional
+        Can be ROW_TUPLE or ROW_DICT (keyed by field names).
+        The default is ROW_TUPLE.
+
+    Yields
+    ------
+    tuple or dict
+        Rows of the query
+    """
+    sql, params = query.sql()
+    cursor = server_side_cursor(query.model._meta.database)
+    try:
+        cursor.execute(sql, params)
+        yield from iter_cursor(
+            cursor, query.selected_columns, chunk_size, row_type
+        )
+    finally:
+        cursor.close()
+
+
+###############################################################################
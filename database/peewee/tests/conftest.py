@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fixtures of the peewee Tests
+
+Tests run on a small synthetic SQLite database (`benchmarks/generate.py`),
+and compare the optimised paths (row serialisation, single-query fetches,
+lexicon caches, streaming) with `model_to_dict()` of model instances.
+"""
+
+import sys
+import shutil
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+TESTS_DIR = Path(__file__).resolve().parent
+BASE_DIR = TESTS_DIR.parent
+
+sys.path.insert(0, str(BASE_DIR))
+
+###############################################################################
+
+
+def _load_module(name, path):
+    # `dcs` and `generate` are also names of modules of the CoNLL-U package
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+peewee_dcs = _load_module("peewee_dcs", BASE_DIR / "dcs.py")
+generate = _load_module(
+    "peewee_generate", BASE_DIR / "benchmarks" / "generate.py"
+).generate
+
+###############################################################################
+
+
+@pytest.fixture(scope="session")
+def db_path(tmp_path_factory):
+    """Synthetic database of three texts, shared by all tests (read-only)"""
+    path = tmp_path_factory.mktemp("database") / "dcs.sqlite"
+    generate(
+        path,
+        n_texts=3,
+        n_chapters=3,
+        n_lines=12,
+        n_words=5,
+        n_lexicon=200,
+        seed=3,
+    )
+    return path
+
+
+@pytest.fixture
+def writable_db_path(db_path, tmp_path):
+    """Copy of the synthetic database, for tests modifying rows"""
+    path = tmp_path / "dcs.sqlite"
+    shutil.copyfile(db_path, path)
+    return path
+
+
+@pytest.fixture
+def make_dcs(db_path):
+    """Factory of DigitalCorpusSanskrit instances on the database"""
+
+    def _make_dcs(path=None, **kwargs):
+        return peewee_dcs.DigitalCorpusSanskrit(
+            f"sqlite:///{path or db_path}", **kwargs
+        )
+
+    return _make_dcs
+
+
+@pytest.fixture
+def dcs(make_dcs):
+    return make_dcs()
+
+
+###############################################################################
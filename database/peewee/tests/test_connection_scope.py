@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Reentrant Connection Scope
+"""
+
+import gc
+import threading
+
+import pytest
+
+from models import (
+    connection,
+    connection_scope,
+    database_proxy,
+    get_connection_state,
+    Texts,
+)
+
+###############################################################################
+
+
+@pytest.fixture
+def database(dcs):
+    database = database_proxy.obj
+    database.close()
+    yield database
+    database.close()
+
+
+@connection
+def get_connections():
+    """Connection of the call, and of a nested call"""
+    return database_proxy.obj.connection(), get_nested_connection()
+
+
+@connection
+def get_nested_connection():
+    return database_proxy.obj.connection()
+
+
+@connection
+def get_text_ids():
+    connection = database_proxy.obj.connection()
+    return (
+        (text.id, database_proxy.obj.connection() is connection)
+        for text in Texts.select().order_by(Texts.id)
+    )
+
+
+@connection
+def get_lazy_text_ids():
+    """Generator running its query on the thread iterating it"""
+    return select_text_ids()
+
+
+def select_text_ids():
+    for text in Texts.select().order_by(Texts.id):
+        yield text.id
+
+
+@connection
+def iter_text_ids():
+    for text in Texts.select().order_by(Texts.id):
+        yield text.id
+
+
+def run_in_thread(function):
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(
+        value=function(), depth=get_connection_state().depth
+    ))
+    thread.start()
+    thread.join()
+    return result
+
+
+###############################################################################
+
+
+def test_nested_calls_share_connection(database):
+    outer, inner = get_connections()
+    assert outer is inner
+    assert database.is_closed()
+    assert get_connection_state().depth == 0
+
+
+def test_scope_spans_calls(database):
+    with connection_scope():
+        first = get_nested_connection()
+        assert get_nested_connection() is first
+        assert not database.is_closed()
+    assert database.is_closed()
+
+
+def test_returned_generator_holds_connection(database):
+    generator = get_text_ids()
+    assert not database.is_closed()
+    assert get_connection_state().depth == 1
+    rows = list(generator)
+    assert [text_id for text_id, _ in rows] == [1, 2, 3]
+    assert all(same for _, same in rows)
+    assert database.is_closed()
+    assert get_connection_state().depth == 0
+
+
+@pytest.mark.parametrize("finish", ["close", "garbage"])
+def test_unfinished_generator_releases_connection(database, finish):
+    generator = get_text_ids()
+    next(generator)
+    if finish == "close":
+        generator.close()
+    else:
+        del generator
+        gc.collect()
+    assert database.is_closed()
+    assert get_connection_state().depth == 0
+
+
+def test_generator_function_connects_on_iteration(database):
+    generator = iter_text_ids()
+    assert database.is_closed()
+    assert next(generator) == 1
+    assert not database.is_closed()
+    assert list(generator) == [2, 3]
+    assert database.is_closed()
+
+
+def test_generator_finished_in_another_thread(database):
+    generator = get_lazy_text_ids()
+    state = get_connection_state()
+    assert state.depth == 1
+
+    result = run_in_thread(lambda: list(generator))
+    assert result["value"] == [1, 2, 3]
+    # the scope was released against the thread that opened it
+    assert result["depth"] == 0
+    assert state.depth == 0
+    # the connection of this thread is closed by its next outermost scope
+    assert not database.is_closed()
+    with connection_scope():
+        pass
+    assert database.is_closed()
+
+
+def test_scope_of_another_thread_is_not_closed(database):
+    with connection_scope():
+        connection = database.connection()
+        generator = get_lazy_text_ids()
+        result = run_in_thread(lambda: generator.close())
+        assert result["depth"] == 0
+        assert get_connection_state().depth == 1
+        assert database.connection() is connection
+    assert database.is_closed()
+
+
+###############################################################################
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Words with their Lexicon Entries (JOIN)
+"""
+
+import pytest
+from playhouse.shortcuts import model_to_dict
+
+from peewee_dcs import TYPE_MODEL
+from models import Lexicon, TextLines, WordReferences
+
+###############################################################################
+
+MISSING_LEXICON_ID = 99999
+
+
+def with_lexicon(word):
+    """Word (dict) along with its Lexicon entry, using get_lexicon()"""
+    lexicon = Lexicon.get_or_none(Lexicon.id == word["lexicon_id"])
+    return {
+        **word,
+        "word": None if lexicon is None else lexicon.word,
+        "grammar": None if lexicon is None else lexicon.grammar,
+    }
+
+
+@pytest.fixture
+def edited_dcs(make_dcs, writable_db_path):
+    """Database with a word whose Lexicon entry does not exist"""
+    dcs = make_dcs(writable_db_path)
+    WordReferences.update(lexicon_id=MISSING_LEXICON_ID).where(
+        WordReferences.id == 2
+    ).execute()
+    return dcs
+
+
+###############################################################################
+
+
+def test_line_words(edited_dcs):
+    line_id = WordReferences.get_by_id(2).sentence_id_id
+    words = edited_dcs.get_words_from_line(line_id, fetch_lexicon=True)
+    assert words == [
+        with_lexicon(word) for word in edited_dcs.get_words_from_line(line_id)
+    ]
+    assert words[1]["word"] is None
+
+    lines = TextLines.select().where(TextLines.chapter_id == 1)
+    assert edited_dcs.get_words_from_verse(lines, fetch_lexicon=True) == [
+        with_lexicon(word) for word in edited_dcs.get_words_from_verse(lines)
+    ]
+
+
+@pytest.mark.parametrize("group_verse", [False, True])
+def test_text_words(edited_dcs, group_verse):
+    words = edited_dcs.get_words_from_text(
+        1, group_verse=group_verse, fetch_lexicon=True
+    )
+    assert list(words) == [
+        [with_lexicon(word) for word in group]
+        for group in edited_dcs.get_words_from_text(
+            1, group_verse=group_verse
+        )
+    ]
+
+
+def test_model_words(edited_dcs):
+    words = [
+        word
+        for group in edited_dcs.get_words_from_chapter(
+            1, fetch_lexicon=True, output_type=TYPE_MODEL
+        )
+        for word in group
+    ]
+    for word in words:
+        # lexicon entry is already loaded, i.e., no query on access
+        assert "lexicon_id" in word.__rel__
+        lexicon = Lexicon.get_or_none(Lexicon.id == word.lexicon_id_id)
+        if lexicon is None:
+            assert word.lexicon_id is None
+        else:
+            assert model_to_dict(word.lexicon_id) == model_to_dict(lexicon)
+    assert [model_to_dict(word, recurse=False) for word in words] == [
+        word
+        for group in edited_dcs.get_words_from_chapter(1)
+        for word in group
+    ]
+
+
+###############################################################################
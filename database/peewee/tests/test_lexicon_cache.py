@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the In-process Cache of Lexicon Rows
+"""
+
+import pytest
+from playhouse.shortcuts import model_to_dict
+
+import peewee_dcs
+from peewee_dcs import TYPE_MODEL, LEXICON_PRELOAD
+from models import Lexicon, WordReferences
+from lexicon_cache import LexiconTable, LexiconLRU
+
+###############################################################################
+
+CACHES = [None, LEXICON_PRELOAD, 20]
+
+MISSING_LEXICON_ID = 99999
+
+###############################################################################
+
+
+def expected_lexicon(lexicon_ids):
+    """Lexicon entries (model_to_dict) by id, using one query per id"""
+    lexicons = {}
+    for lexicon_id in lexicon_ids:
+        lexicon = Lexicon.get_or_none(Lexicon.id == lexicon_id)
+        if lexicon is not None:
+            lexicons[lexicon_id] = model_to_dict(lexicon)
+    return lexicons
+
+
+def get_model_words(dcs, chapter_id):
+    return [
+        word
+        for group in dcs.get_words_from_chapter(
+            chapter_id, fetch_lexicon=True, output_type=TYPE_MODEL
+        )
+        for word in group
+    ]
+
+
+@pytest.fixture
+def edited_db_path(make_dcs, writable_db_path):
+    """Database with a word whose Lexicon entry does not exist"""
+    make_dcs(writable_db_path)
+    WordReferences.update(lexicon_id=MISSING_LEXICON_ID).where(
+        WordReferences.id == 2
+    ).execute()
+    return writable_db_path
+
+
+###############################################################################
+
+
+@pytest.mark.parametrize("lexicon_cache", CACHES)
+def test_lexicon_matches_model_to_dict(
+    make_dcs, monkeypatch, lexicon_cache
+):
+    monkeypatch.setattr(peewee_dcs, "LEXICON_BATCH_SIZE", 7)
+    dcs = make_dcs(lexicon_cache=lexicon_cache)
+    lexicon_ids = [5, 3, 5, MISSING_LEXICON_ID] + list(range(40, 0, -3))
+    expected = expected_lexicon(lexicon_ids)
+
+    for _ in range(2):
+        assert dcs.get_lexicon_many(lexicon_ids) == expected
+        lexicons = dcs.get_lexicon_many(lexicon_ids, output_type=TYPE_MODEL)
+        assert {
+            lexicon_id: model_to_dict(lexicon)
+            for lexicon_id, lexicon in lexicons.items()
+        } == expected
+        assert all(not lexicon.is_dirty() for lexicon in lexicons.values())
+
+    assert dcs.get_lexicon(5) == expected[5]
+    with pytest.raises(Lexicon.DoesNotExist):
+        dcs.get_lexicon(MISSING_LEXICON_ID)
+    assert dcs.get_lexicon_many([]) == {}
+
+
+@pytest.mark.parametrize("lexicon_cache", CACHES[1:])
+def test_words_match_uncached(make_dcs, edited_db_path, lexicon_cache):
+    uncached = make_dcs(edited_db_path)
+    dcs = make_dcs(edited_db_path, lexicon_cache=lexicon_cache)
+
+    assert list(dcs.get_words_from_text(1, fetch_lexicon=True)) == list(
+        uncached.get_words_from_text(1, fetch_lexicon=True)
+    )
+    for word, expected in zip(
+        get_model_words(dcs, 1), get_model_words(uncached, 1)
+    ):
+        assert model_to_dict(word, recurse=False) == model_to_dict(
+            expected, recurse=False
+        )
+        assert "lexicon_id" in word.__rel__
+        if expected.lexicon_id is None:
+            assert word.lexicon_id is None
+        else:
+            assert model_to_dict(word.lexicon_id) == model_to_dict(
+                expected.lexicon_id
+            )
+    assert dcs.get_word(1) == uncached.get_word(1)
+
+
+def test_preload(make_dcs):
+    dcs = make_dcs(lexicon_cache=LEXICON_PRELOAD)
+    dcs.get_lexicon_many([1, 2])
+    info = dcs.lexicon_cache_info()
+    assert info.currsize == Lexicon.select().count()
+    assert (info.hits, info.misses, info.maxsize) == (2, 0, None)
+
+    with pytest.raises(ValueError):
+        make_dcs(lexicon_cache=10).preload_lexicon()
+    assert make_dcs().lexicon_cache_info() is None
+
+
+def test_lexicon_table():
+    table = LexiconTable(["id", "word", "frequency"], ["id", "frequency"])
+    table.add([{"id": 3, "word": "c", "frequency": None}])
+    table.add([
+        {"id": 1, "word": "a", "frequency": 10},
+        {"id": 3, "word": "d", "frequency": 30},
+    ])
+    assert len(table) == 2
+    assert table.get(1) == {"id": 1, "word": "a", "frequency": 10}
+    assert table.get(3) == {"id": 3, "word": "d", "frequency": 30}
+
+    table.load([{"id": 2, "word": "b", "frequency": None}])
+    rows, missing = table.get_many([2, 1, 2, 1])
+    assert rows == {2: {"id": 2, "word": "b", "frequency": None}}
+    assert missing == [1]
+    assert table.cache_info() == (1, 1, None, 1)
+
+
+def test_lexicon_lru():
+    cache = LexiconLRU(["id", "word"], maxsize=2)
+    cache.add([{"id": 1, "word": "a"}, {"id": 2, "word": "b"}])
+    assert cache.get(1) == {"id": 1, "word": "a"}
+    cache.add([{"id": 3, "word": "c"}])
+    assert cache.get_many([1, 2, 3]) == (
+        {1: {"id": 1, "word": "a"}, 3: {"id": 3, "word": "c"}},
+        [2],
+    )
+    assert cache.cache_info() == (3, 1, 2, 2)
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 2, 0)
+
+
+###############################################################################
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Row Serialisation of the Dictionary Output
+"""
+
+import pytest
+from playhouse.shortcuts import model_to_dict
+
+from peewee_dcs import TYPE_MODEL
+from models import Texts, TextLines
+from rows import convert_rows, iter_rows, ROW_TUPLE, ROW_DICT
+
+###############################################################################
+
+TEXT_FIELDS = [
+    Texts.id,
+    Texts.textname,
+    Texts.short,
+    Texts.text_completed,
+    Texts.nr_of_words,
+]
+
+###############################################################################
+
+
+def test_texts_and_chapters_match_model_to_dict(dcs):
+    assert dcs.get_texts() == [
+        model_to_dict(text, only=TEXT_FIELDS) for text in Texts
+    ]
+    for text_id in [1, 2]:
+        assert dcs.get_chapters_from_text(text_id) == [
+            model_to_dict(chapter, recurse=False)
+            for chapter in dcs.get_chapters_from_text(
+                text_id, output_type=TYPE_MODEL
+            )
+        ]
+
+
+def test_lines_and_verses_match_model_to_dict(make_dcs, writable_db_path):
+    dcs = make_dcs(writable_db_path)
+    TextLines.update(line=None).where(TextLines.id == 2).execute()
+    for chapter_id in [1, 4]:
+        assert dcs.get_lines_from_chapter(chapter_id) == [
+            model_to_dict(line, recurse=False)
+            for line in dcs.get_lines_from_chapter(
+                chapter_id, output_type=TYPE_MODEL
+            )
+        ]
+        assert list(dcs.get_verses_from_chapter(chapter_id)) == [
+            [model_to_dict(line, recurse=False) for line in verse]
+            for verse in dcs.get_verses_from_chapter(
+                chapter_id, output_type=TYPE_MODEL
+            )
+        ]
+    assert dcs.get_lines_from_chapter(1)[1]["line"] is None
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 10000])
+def test_iter_rows(dcs, chunk_size):
+    query = TextLines.select().where(TextLines.chapter_id == 2)
+    expected = [model_to_dict(line, recurse=False) for line in query]
+    assert list(iter_rows(query, chunk_size=chunk_size)) == expected
+    assert list(iter_rows(query, ROW_TUPLE, chunk_size)) == [
+        tuple(line.values()) for line in expected
+    ]
+
+
+def test_convert_rows():
+    calls = []
+
+    def upper(value):
+        calls.append(value)
+        return value.upper()
+
+    rows = [(1, "a"), (2, "b"), (3, "a")]
+    assert convert_rows(rows, ["id", "name"], [(1, upper)]) == [
+        {"id": 1, "name": "A"},
+        {"id": 2, "name": "B"},
+        {"id": 3, "name": "A"},
+    ]
+    assert sorted(calls) == ["a", "b"]
+    assert convert_rows(rows, ["id", "name"], [], ROW_TUPLE) == rows
+    assert convert_rows([], ["id"], [(0, upper)], ROW_DICT) == []
+    with pytest.raises(ValueError):
+        convert_rows(rows, ["id", "name"], [], "list")
+
+
+###############################################################################
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Streaming of Words, Lines and Verses
+"""
+
+import pytest
+from playhouse.shortcuts import model_to_dict
+
+from rows import ROW_DICT
+from models import Texts, Chapters, WordReferences
+
+###############################################################################
+
+
+@pytest.fixture
+def edited_dcs(make_dcs, writable_db_path):
+    """Database with a chapter without lines"""
+    dcs = make_dcs(writable_db_path)
+    Chapters.insert(
+        id=1000, text_id=1, name="Text1, empty", position=100
+    ).execute()
+    return dcs
+
+
+def as_tuples(rows):
+    return [tuple(row.values()) for row in rows]
+
+
+###############################################################################
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 10000])
+def test_words_match_text_words(edited_dcs, chunk_size):
+    for text_id in [1, 2]:
+        expected = [
+            word
+            for words in edited_dcs.get_words_from_text(text_id)
+            for word in words
+        ]
+        assert list(
+            edited_dcs.stream_words(text_id, chunk_size, row_type=ROW_DICT)
+        ) == expected
+        assert list(edited_dcs.stream_words(text_id, chunk_size)) == (
+            as_tuples(expected)
+        )
+
+    assert list(edited_dcs.stream_words(chunk_size=chunk_size)) == as_tuples(
+        model_to_dict(word, recurse=False)
+        for word in WordReferences.select().order_by(WordReferences.id)
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 10000])
+def test_lines_and_verses_match_chapters(edited_dcs, chunk_size):
+    for text_id in [1, 3]:
+        expected = list(edited_dcs.get_lines_from_text(text_id))
+        assert list(
+            edited_dcs.stream_lines(text_id, chunk_size, row_type=ROW_DICT)
+        ) == expected
+        assert list(edited_dcs.stream_lines(text_id, chunk_size)) == (
+            as_tuples(expected)
+        )
+
+        # no verse for a chapter without lines
+        verses = [
+            verse
+            for verse in edited_dcs.get_verses_from_text(text_id)
+            if verse
+        ]
+        assert list(
+            edited_dcs.stream_verses(text_id, chunk_size, row_type=ROW_DICT)
+        ) == verses
+        assert list(edited_dcs.stream_verses(text_id, chunk_size)) == [
+            as_tuples(verse) for verse in verses
+        ]
+
+    lines = list(edited_dcs.stream_lines(chunk_size=chunk_size))
+    assert lines == [
+        line
+        for chapter in Chapters.select().order_by(Chapters.id)
+        for line in as_tuples(edited_dcs.get_lines_from_chapter(chapter.id))
+    ]
+
+
+def test_closed_stream(dcs):
+    with dcs.connection_scope():
+        words = dcs.stream_words(1, chunk_size=3)
+        next(words)
+        words.close()
+        assert [text["id"] for text in dcs.get_texts()] == [
+            text.id for text in Texts.select().order_by(Texts.id)
+        ]
+
+    with pytest.raises(ValueError):
+        next(dcs.stream_lines(row_type="list"))
+    assert list(dcs.stream_words(12345)) == []
+
+
+###############################################################################
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests of the Words of Chapters and Texts (two queries per chapter)
+"""
+
+import pytest
+from playhouse.shortcuts import model_to_dict
+
+from peewee_dcs import TYPE_DICT, TYPE_MODEL
+from models import Texts, Chapters, TextLines, WordReferences
+
+###############################################################################
+
+
+def select_line_words(line_id):
+    return WordReferences.select().where(
+        WordReferences.sentence_id == line_id
+    ).order_by(
+        WordReferences.absolute_position, WordReferences.inner_position
+    )
+
+
+def expected_words(chapter_id, group_verse=False):
+    """Words of a chapter, by one query per line (model_to_dict)"""
+    lines = Chapters.get_by_id(chapter_id).lines.order_by(
+        TextLines.verse, TextLines.stanza
+    )
+    groups = []
+    verse = None
+    for index, line in enumerate(lines):
+        words = [
+            model_to_dict(word, recurse=False)
+            for word in select_line_words(line.id)
+        ]
+        if group_verse and index and line.verse == verse:
+            groups[-1].extend(words)
+        else:
+            groups.append(words)
+        verse = line.verse
+    if group_verse and not groups:
+        groups.append([])
+    return groups
+
+
+def get_ids(groups):
+    return [[word.id for word in words] for words in groups]
+
+
+@pytest.fixture
+def edited_dcs(make_dcs, writable_db_path):
+    """Database with a chapter without lines, and a line without words"""
+    dcs = make_dcs(writable_db_path)
+    Chapters.insert(
+        id=1000, text_id=1, name="Text1, empty", position=100
+    ).execute()
+    line = TextLines.select().where(TextLines.chapter_id == 1).first()
+    TextLines.insert(
+        id=1000, chapter_id=1, line="", stanza=2, verse=line.verse
+    ).execute()
+    TextLines.insert(
+        id=1001, chapter_id=1, line="", stanza=0, verse=1000
+    ).execute()
+    return dcs
+
+
+###############################################################################
+
+
+@pytest.mark.parametrize("group_verse", [False, True])
+def test_chapter_words_match_line_queries(edited_dcs, group_verse):
+    for chapter_id in [1, 2, 1000]:
+        expected = expected_words(chapter_id, group_verse)
+        assert list(
+            edited_dcs.get_words_from_chapter(
+                chapter_id, group_verse=group_verse
+            )
+        ) == expected
+
+        words = list(
+            edited_dcs.get_words_from_chapter(
+                chapter_id, group_verse=group_verse, output_type=TYPE_MODEL
+            )
+        )
+        assert get_ids(words) == [
+            [word["id"] for word in group] for group in expected
+        ]
+
+
+@pytest.mark.parametrize("group_verse", [False, True])
+def test_text_words_match_chapters(edited_dcs, group_verse):
+    chapters = Texts.get_by_id(1).chapters.order_by(Chapters.position)
+    assert list(
+        edited_dcs.get_words_from_text(1, group_verse=group_verse)
+    ) == [
+        words
+        for chapter in chapters
+        for words in expected_words(chapter.id, group_verse)
+    ]
+
+
+def test_verse_words_match_line_words(dcs):
+    for verse in dcs.get_verses_from_chapter(3, output_type=TYPE_MODEL):
+        expected = [
+            word for line in verse for word in dcs.get_words_from_line(line.id)
+        ]
+        assert dcs.get_words_from_verse(verse) == expected
+        assert expected == [
+            model_to_dict(word, recurse=False)
+            for line in verse
+            for word in select_line_words(line.id)
+        ]
+    assert dcs.get_words_from_verse([], output_type=TYPE_DICT) == []
+
+
+def test_missing_chapter(dcs):
+    with pytest.raises(Chapters.DoesNotExist):
+        list(dcs.get_words_from_chapter(12345))
+
+
+###############################################################################